@@ -0,0 +1,333 @@
+"""
+Booking flow load generator.
+
+Replays the home page search, flight selection, purchase and confirmation
+steps with a number of concurrent virtual users and reports throughput,
+step latency percentiles and error rates as JSON.
+
+    python -m benchmarks.booking_flow --target local --backend http --concurrency 20 --flows 2000
+    python -m benchmarks.booking_flow --backend browser --headless --browser-contexts --concurrency 8
+    python -m benchmarks.booking_flow --baseline reports/booking_flow_baseline.json --max-increase 0.25
+"""
+import argparse
+import itertools
+import json
+import logging
+import math
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from config.config import Config
+from pages import HomePage, FlightsPage, PurchasePage, ConfirmationPage
+from utilities.driver_factory import DriverFactory
+from utilities.helpers import load_test_data
+from utilities.http_backend import HttpDriver
+from utilities.local_server import LocalBlazeDemoServer
+
+
+STEPS = ["open_home", "search_flights", "select_flight", "complete_purchase", "confirmation"]
+
+# Pseudo-step timing the start of a virtual user's driver; a failed start is an errored flow
+START_STEP = "start_driver"
+
+# Latency percentiles compared in regression mode
+CHECKED_PERCENTILES = ("p95", "p99")
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class FlowStats:
+    """Thread-safe collector of step latencies, completed flows and errors."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.step_errors: Counter = Counter()
+        self.error_types: Counter = Counter()
+        self.completed = 0
+        self.failed = 0
+
+    def record_step(self, step: str, duration: float) -> None:
+        with self._lock:
+            self.latencies[step].append(duration)
+
+    def record_flow(self, failed_step: Optional[str] = None, error: Exception = None) -> None:
+        with self._lock:
+            if failed_step is None:
+                self.completed += 1
+                return
+            self.failed += 1
+            self.step_errors[failed_step] += 1
+            self.error_types[type(error).__name__] += 1
+
+    def report(self, elapsed: float, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the JSON report.
+
+        Args:
+            elapsed: Wall time of the run in seconds
+            settings: Run settings echoed into the report
+        """
+        flows = self.completed + self.failed
+        steps = {}
+        for step in [START_STEP] + STEPS:
+            values = sorted(self.latencies.get(step, []))
+            steps[step] = {
+                "count": len(values),
+                "errors": self.step_errors.get(step, 0),
+                "mean": sum(values) / len(values) if values else 0.0,
+                "p50": percentile(values, 0.50),
+                "p95": percentile(values, 0.95),
+                "p99": percentile(values, 0.99),
+                "max": values[-1] if values else 0.0,
+            }
+        return {
+            "settings": settings,
+            "elapsed": elapsed,
+            "flows": flows,
+            "completed": self.completed,
+            "failed": self.failed,
+            "flows_per_second": self.completed / elapsed if elapsed else 0.0,
+            "error_rate": self.failed / flows if flows else 0.0,
+            "errors": dict(self.error_types),
+            "steps": steps,
+        }
+
+
+class BookingFlow:
+    """One virtual user replaying the booking flow on its own driver."""
+
+    def __init__(self, driver, test_data: Dict[str, Any], route: str):
+        self.home_page = HomePage(driver)
+        self.flights_page = FlightsPage(driver)
+        self.purchase_page = PurchasePage(driver)
+        self.confirmation_page = ConfirmationPage(driver)
+        self.passenger = test_data["passenger"]
+        self.payment = test_data["payment"]
+        self.route = test_data["routes"][route]
+
+    def steps(self) -> List[Callable[[], Any]]:
+        """The flow's steps, in STEPS order."""
+        return [
+            self.home_page.open_home_page,
+            lambda: self.home_page.search_flights(self.route["departure"], self.route["destination"]),
+            self.flights_page.select_cheapest_flight,
+            lambda: self.purchase_page.complete_purchase(self.passenger, self.payment),
+            self.confirm,
+        ]
+
+    def confirm(self) -> str:
+        """Check the confirmation page and return the transaction ID."""
+        if not self.confirmation_page.is_purchase_successful():
+            raise AssertionError("Purchase was not confirmed")
+        transaction_id = self.confirmation_page.get_transaction_id()
+        if not transaction_id:
+            raise AssertionError("Confirmation has no transaction ID")
+        return transaction_id
+
+    def run(self, stats: FlowStats) -> None:
+        """Run the flow once, recording each step until one fails."""
+        for step, action in zip(STEPS, self.steps()):
+            start = time.perf_counter()
+            try:
+                action()
+            except Exception as e:
+                stats.record_flow(step, e)
+                return
+            finally:
+                stats.record_step(step, time.perf_counter() - start)
+        stats.record_flow()
+
+
+def run_load(concurrency: int, ramp_up: float, flows: Optional[int], duration: Optional[float],
+             driver_factory: Callable[[], Any], route: str = "paris_to_berlin") -> Dict[str, Any]:
+    """
+    Replay the booking flow with concurrent virtual users.
+
+    Virtual user i starts i * ramp_up / concurrency seconds into the run and
+    then repeats the flow on its own driver until the flow budget is spent
+    or the duration has elapsed. A virtual user whose driver fails to start
+    records one errored flow at START_STEP and stops.
+
+    Args:
+        concurrency: Number of virtual users
+        ramp_up: Seconds over which the virtual users are started
+        flows: Total number of flows to run, or None to run for duration
+        duration: Seconds to run for, or None to run until flows are done
+        driver_factory: Creates the driver of a virtual user
+        route: Route key in bookings.json
+
+    Returns:
+        JSON-serializable report
+    """
+    test_data = load_test_data("bookings.json")
+    stats = FlowStats()
+    budget = itertools.count()
+    start = time.monotonic()
+    deadline = start + duration if duration else None
+
+    def virtual_user(index: int) -> None:
+        time.sleep(index * ramp_up / concurrency)
+        started = time.perf_counter()
+        try:
+            driver = driver_factory()
+        except Exception as e:
+            if flows is None or next(budget) < flows:
+                stats.record_flow(START_STEP, e)
+            return
+        finally:
+            stats.record_step(START_STEP, time.perf_counter() - started)
+        try:
+            flow = BookingFlow(driver, test_data, route)
+            while True:
+                if deadline is not None and time.monotonic() >= deadline:
+                    return
+                if flows is not None and next(budget) >= flows:
+                    return
+                driver.delete_all_cookies()
+                flow.run(stats)
+        finally:
+            driver.quit()
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="virtual-user") as executor:
+        for future in [executor.submit(virtual_user, index) for index in range(concurrency)]:
+            future.result()
+
+    settings = {
+        "backend": Config.BACKEND,
+        "base_url": Config.BASE_URL,
+        "concurrency": concurrency,
+        "ramp_up": ramp_up,
+        "flows": flows,
+        "duration": duration,
+        "route": route,
+    }
+    return stats.report(time.monotonic() - start, settings)
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any],
+                        max_increase: float, max_error_rate: float = None) -> List[str]:
+    """
+    List the step latencies that regressed beyond the allowed increase.
+
+    Args:
+        report: Report of this run
+        baseline: Stored report to compare against
+        max_increase: Allowed relative increase of p95/p99 latency, e.g. 0.25 for 25%
+        max_error_rate: Optional upper bound for the error rate
+
+    Returns:
+        Human readable regression messages (empty when within thresholds)
+    """
+    regressions = []
+    for step, stats in report["steps"].items():
+        reference = baseline.get("steps", {}).get(step)
+        if not reference or not stats["count"]:
+            continue
+        for key in CHECKED_PERCENTILES:
+            limit = reference[key] * (1 + max_increase)
+            if reference[key] and stats[key] > limit:
+                regressions.append(
+                    f"{step} {key} {stats[key] * 1000:.1f}ms exceeds baseline "
+                    f"{reference[key] * 1000:.1f}ms by more than {max_increase:.0%}"
+                )
+    if max_error_rate is not None and report["error_rate"] > max_error_rate:
+        regressions.append(f"error rate {report['error_rate']:.2%} exceeds {max_error_rate:.2%}")
+    return regressions
+
+
+def parse_args(argv: Sequence[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Booking flow load generator")
+    parser.add_argument("--target", choices=["live", "local"], default=Config.TARGET,
+                        help="Site to load: live BlazeDemo or the bundled local stand-in server")
+    parser.add_argument("--backend", choices=["browser", "http"], default="http",
+                        help="Drive real browsers or the browserless HTTP backend")
+    parser.add_argument("--browser", default=Config.BROWSER, help="Browser for --backend=browser")
+    parser.add_argument("--headless", action="store_true", help="Run browsers headless")
+    parser.add_argument("--browser-contexts", action="store_true",
+                        help="Give each virtual user an isolated context of one shared Chrome")
+    parser.add_argument("--concurrency", type=int, default=10, help="Number of virtual users")
+    parser.add_argument("--ramp-up", type=float, default=0.0,
+                        help="Seconds over which virtual users are started")
+    parser.add_argument("--flows", type=int, default=None,
+                        help="Total number of flows (default 100 unless --duration is given)")
+    parser.add_argument("--duration", type=float, default=None, help="Run for this many seconds")
+    parser.add_argument("--route", default="paris_to_berlin", help="Route key in bookings.json")
+    parser.add_argument("--output", default=os.path.join(Config.REPORTS_DIR, "booking_flow.json"),
+                        help="Where to write the JSON report")
+    parser.add_argument("--baseline", help="Baseline report to compare against (regression mode)")
+    parser.add_argument("--save-baseline", help="Also write this run's report as a new baseline")
+    parser.add_argument("--max-increase", type=float, default=0.25,
+                        help="Allowed relative p95/p99 step latency increase over the baseline")
+    parser.add_argument("--max-error-rate", type=float, default=None,
+                        help="Fail when the error rate exceeds this fraction")
+    parser.add_argument("--verbose", action="store_true", help="Keep page object INFO logging")
+    args = parser.parse_args(argv)
+    if args.flows is None and args.duration is None:
+        args.flows = 100
+    return args
+
+
+def main(argv: Sequence[str] = None) -> int:
+    args = parse_args(argv)
+    if not args.verbose:
+        logging.disable(logging.INFO)
+    Config.BACKEND = args.backend
+    Config.COMMAND_TIMING = False
+
+    server = None
+    if args.target == "local":
+        server = LocalBlazeDemoServer(port=Config.LOCAL_SERVER_PORT).start()
+        Config.BASE_URL = f"http://{Config.LOCAL_HOSTNAME}:{server.port}"
+
+    shared_browser = None
+    if args.backend == "http":
+        driver_factory = HttpDriver
+    elif args.browser_contexts:
+        shared_browser = DriverFactory.get_shared_browser(args.browser, args.headless)
+        driver_factory = shared_browser.new_context
+    else:
+        driver_factory = lambda: DriverFactory.get_driver(browser=args.browser, headless=args.headless)
+
+    try:
+        report = run_load(args.concurrency, args.ramp_up, args.flows, args.duration,
+                          driver_factory, args.route)
+    finally:
+        if shared_browser is not None:
+            shared_browser.close()
+        if server is not None:
+            server.stop()
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.max_increase, args.max_error_rate)
+        for message in regressions:
+            print(f"REGRESSION: {message}", file=sys.stderr)
+        if regressions:
+            return 1
+    elif args.max_error_rate is not None and report["error_rate"] > args.max_error_rate:
+        print(f"REGRESSION: error rate {report['error_rate']:.2%} exceeds {args.max_error_rate:.2%}",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+import pytest
+from typing import Generator
+from benchmarks.fake_webdriver import FAKE_BASE_URL, FakeWebDriver
+from config.config import Config
+from pages import HomePage, FlightsPage, PurchasePage, ConfirmationPage
+from utilities.helpers import load_test_data
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fake_site() -> Generator[str, None, None]:
+    """Point the page objects at the in-memory site for the whole session."""
+    base_url, command_timing = Config.BASE_URL, Config.COMMAND_TIMING
+    Config.BASE_URL = FAKE_BASE_URL
+    Config.COMMAND_TIMING = False
+
+    yield FAKE_BASE_URL
+
+    Config.BASE_URL, Config.COMMAND_TIMING = base_url, command_timing
+
+
+@pytest.fixture(scope="session")
+def test_data() -> dict:
+    """Booking test data shared by the benchmarks."""
+    return load_test_data("bookings.json")
+
+
+@pytest.fixture(scope="function", params=["static", "javascript"])
+def fake_driver(request) -> Generator[FakeWebDriver, None, None]:
+    """
+    Yield an in-memory WebDriver for each benchmark.
+
+    Every benchmark runs twice: on the static paths of browserless drivers
+    and on the script paths (batched reads and fills, in-browser waits)
+    that browser runs take.
+    """
+    driver = FakeWebDriver(javascript=request.param == "javascript")
+
+    yield driver
+
+    driver.quit()
+
+
+@pytest.fixture(scope="function")
+def home_page(fake_driver: FakeWebDriver) -> HomePage:
+    """HomePage opened on the in-memory site."""
+    return HomePage(fake_driver).open_home_page()
+
+
+@pytest.fixture(scope="function")
+def flights_page(fake_driver: FakeWebDriver, test_data: dict) -> FlightsPage:
+    """FlightsPage showing the flights of the first route."""
+    route = test_data["routes"]["paris_to_berlin"]
+    return FlightsPage(fake_driver).goto(route["departure"], route["destination"])
+
+
+@pytest.fixture(scope="function")
+def purchase_page(fake_driver: FakeWebDriver, test_data: dict) -> PurchasePage:
+    """PurchasePage for the configured flight."""
+    return PurchasePage(fake_driver).goto(test_data["flight"])
+
+
+@pytest.fixture(scope="function")
+def confirmation_page(purchase_page: PurchasePage, test_data: dict) -> ConfirmationPage:
+    """ConfirmationPage of a completed purchase."""
+    purchase_page.complete_purchase(test_data["passenger"], test_data["payment"])
+    return ConfirmationPage(purchase_page.driver)
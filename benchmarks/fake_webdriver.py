@@ -0,0 +1,185 @@
+import http.client
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+from selenium.common.exceptions import JavascriptException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import Select
+from pages.base_page import (
+    DOCUMENT_ID_SCRIPT, FILL_MANY_SCRIPT, MUTATION_WAIT_SCRIPT, READ_MANY_SCRIPT,
+    READ_TABLE_SCRIPT, SUBMIT_FORM_SCRIPT
+)
+from utilities.driver_pool import STORAGE_CLEAR_SCRIPT
+from utilities.http_backend import HttpDriver, HttpElement, PooledResponse
+from utilities.http_server import HttpRequest
+from utilities.local_server import LocalBlazeDemoServer
+from utilities.resource_blocking import PAGE_LOAD_SCRIPT
+
+
+FAKE_BASE_URL = "http://blazedemo.fake"
+
+# Scripts the framework itself runs outside the page objects (driver pool
+# health checks and resets), answered without a JavaScript engine.
+DEFAULT_SCRIPT_RESULTS = {
+    "return 1;": 1,
+    STORAGE_CLEAR_SCRIPT: None,
+}
+
+
+class InMemoryTransport:
+    """
+    Drop-in for ConnectionPool that answers requests in-process.
+
+    Paths registered in ``pages`` are served as scripted documents; every
+    other request is rendered by the local BlazeDemo stand-in, so the page
+    objects see the real site structure without any socket or server thread.
+    """
+
+    def __init__(self, pages: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            pages: Request paths mapped to the HTML to serve for them
+        """
+        self.pages = dict(pages or {})
+        self.site = LocalBlazeDemoServer()
+        self.requests_sent = 0
+
+    def request(self, method: str, url: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None, proxy: str = "") -> PooledResponse:
+        """Answer a request with the same response shape as ConnectionPool.request."""
+        self.requests_sent += 1
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if path in self.pages:
+            status, content_type, payload = 200, "text/html; charset=utf-8", self.pages[path].encode("utf-8")
+        else:
+            target = path + (f"?{parts.query}" if parts.query else "")
+            request = HttpRequest(method, target, {k.lower(): v for k, v in (headers or {}).items()},
+                                  body or b"")
+            response = self.site.respond(request)
+            status, content_type, payload = (response.status, response.headers["Content-Type"],
+                                             response.body)
+
+        message = http.client.HTTPMessage()
+        message["Content-Type"] = content_type
+        message["Content-Length"] = str(len(payload))
+        return PooledResponse(status, message, payload, len(payload))
+
+    def close(self) -> None:
+        pass
+
+
+class FakeWebDriver(HttpDriver):
+    """
+    In-memory WebDriver with a scripted DOM for measuring framework overhead.
+
+    Documents come from an InMemoryTransport and are parsed by the HTTP
+    backend, so element lookup, waits, typing and form submission exercise
+    the same page-object code paths as a real run while costing only
+    Python time. ``execute_script`` answers the scripts registered in
+    ``script_results`` and raises JavascriptException for any other script.
+
+    With ``javascript=True`` the driver reports supports_javascript, so
+    BasePage takes the script paths a browser run takes (batched reads and
+    fills, in-browser waits, table reads, form submission and page load
+    checks). The fake answers those scripts by emulating them on the parsed
+    document.
+    """
+
+    name = "fake"
+
+    def __init__(self, pages: Optional[Dict[str, str]] = None,
+                 script_results: Optional[Dict[str, Any]] = None,
+                 javascript: bool = False):
+        """
+        Args:
+            pages: Request paths mapped to scripted HTML documents
+            script_results: Script source mapped to its return value
+            javascript: Answer the framework's page scripts, as a browser would
+        """
+        super().__init__(pool=InMemoryTransport(pages), proxy="")
+        self.script_results = dict(DEFAULT_SCRIPT_RESULTS, **(script_results or {}))
+        self.supports_javascript = javascript
+        self.scripts = {
+            READ_MANY_SCRIPT: self._script_read_many,
+            FILL_MANY_SCRIPT: self._script_fill_many,
+            MUTATION_WAIT_SCRIPT: self._script_wait_for_element,
+            READ_TABLE_SCRIPT: self._script_read_table,
+            DOCUMENT_ID_SCRIPT: lambda: str(self.document_id),
+            SUBMIT_FORM_SCRIPT: self._script_submit_form,
+            PAGE_LOAD_SCRIPT: self._script_page_load,
+            "return window.__pomFormSubmitted === true;": lambda: False,
+            "arguments[0].scrollIntoView(true);": lambda element: None,
+        } if javascript else {}
+
+    def execute_script(self, script: str, *args):
+        if script in self.script_results:
+            return self.script_results[script]
+        if script in self.scripts:
+            return self.scripts[script](*args)
+        raise JavascriptException("Script is not scripted on the fake driver")
+
+    def execute_async_script(self, script: str, *args):
+        return self.execute_script(script, *args)
+
+    def _first(self, by: str, value: str) -> Optional[HttpElement]:
+        elements = self.find_elements(by, value)
+        return elements[0] if elements else None
+
+    def _script_read_many(self, locators: Dict[str, List[str]],
+                          fields: Sequence[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """READ_MANY_SCRIPT: read fields of the first element of every locator."""
+        readers = {
+            "text": lambda element: element.text.strip() if element.is_displayed() else "",
+            "value": lambda element: element.get_property("value"),
+            "visible": HttpElement.is_displayed,
+            "enabled": HttpElement.is_enabled,
+            "selected": HttpElement.is_selected,
+            "tag": lambda element: element.tag_name.lower(),
+        }
+        result = {}
+        for name, (by, value) in locators.items():
+            element = self._first(by, value)
+            result[name] = None if element is None else {
+                field: readers[field](element) if field in readers else element.get_dom_attribute(field)
+                for field in fields
+            }
+        return result
+
+    def _script_fill_many(self, entries: List[List[str]]) -> List[str]:
+        """FILL_MANY_SCRIPT: set every value, or return the entries that cannot be set."""
+        elements = [self._first(by, value) for by, value, _ in entries]
+        missing = [f"{by}={value}" for (by, value, _), element in zip(entries, elements) if element is None]
+        if missing:
+            return missing
+        for (_, _, text), element in zip(entries, elements):
+            if element.tag_name.lower() == "select":
+                Select(element).select_by_value(text)
+            else:
+                element.clear()
+                element.send_keys(text)
+        return []
+
+    def _script_wait_for_element(self, by: str, value: str, appear: bool, timeout_ms: int) -> bool:
+        """MUTATION_WAIT_SCRIPT: the document cannot change while the script runs."""
+        element = self._first(by, value)
+        visible = element is not None and element.is_displayed()
+        return visible if appear else not visible
+
+    def _script_read_table(self, by: str, value: str) -> Dict[str, Any]:
+        """READ_TABLE_SCRIPT: cell texts of the matching rows and the document ID."""
+        rows = [[cell.text.strip() for cell in row.find_elements(By.TAG_NAME, "td")]
+                for row in self.find_elements(by, value)]
+        return {"document": str(self.document_id), "rows": rows}
+
+    def _script_submit_form(self, url: str, method: str, fields: Dict[str, str]) -> None:
+        """SUBMIT_FORM_SCRIPT: navigate with the form fields."""
+        self.submit(url, fields, method)
+
+    def _script_page_load(self) -> Dict[str, Any]:
+        """PAGE_LOAD_SCRIPT: the page has loaded once navigation returns."""
+        load = self.last_load
+        return {"state": "complete", "url": self.current_url,
+                "bytes": load.transferred if load else 0, "load_time": load.load_time if load else 0}
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,225 @@
+"""
+Framework overhead benchmarks.
+
+Measures the Python time the framework itself adds around WebDriver calls:
+logger and wait setup, page object construction, locator handling, test
+data loading, synthetic data and driver leasing. Pages are served by the in-memory
+FakeWebDriver, so no browser, socket or server thread is involved and the
+ops/sec figures track the framework alone. Each benchmark runs on the static
+paths of browserless drivers and on the script paths of browser runs.
+
+    pytest benchmarks/ --benchmark-autosave
+    pytest benchmarks/ --benchmark-compare --benchmark-compare-fail=mean:15%
+"""
+import itertools
+import pytest
+from selenium.webdriver.common.by import By
+from benchmarks.fake_webdriver import FakeWebDriver
+from pages import BasePage, WaitEngine, HomePage, FlightsPage, PurchasePage, ConfirmationPage
+from utilities.data_pool import SyntheticDataPool
+from utilities.driver_pool import DriverPool
+from utilities.helpers import load_test_data
+from utilities.logger import get_logger
+
+
+class TestSetupOverhead:
+    """Cost of the objects every test creates before it touches the page."""
+
+    @pytest.mark.benchmark(group="setup")
+    def test_get_logger_existing(self, benchmark):
+        """get_logger for a name that already has its handlers."""
+        get_logger("BenchmarkLogger")
+        benchmark(get_logger, "BenchmarkLogger")
+
+    @pytest.mark.benchmark(group="setup")
+    def test_get_logger_new(self, benchmark):
+        """get_logger attaching the shared queue handler to a new name."""
+        names = (f"BenchmarkLogger{i}" for i in itertools.count())
+        benchmark(lambda: get_logger(next(names)))
+
+    @pytest.mark.benchmark(group="setup")
+    def test_log_info(self, benchmark):
+        """An INFO record handed to the background writer."""
+        benchmark(get_logger("BenchmarkLogger").info, "Opening URL: http://blazedemo.fake/")
+
+    @pytest.mark.benchmark(group="setup")
+    def test_log_debug_disabled(self, benchmark):
+        """A DEBUG record below the configured level."""
+        logger = get_logger("BenchmarkLogger")
+        level = logger.level
+        logger.setLevel("INFO")
+        benchmark(logger.debug, "Clicking element: ('id', 'rememberMe')")
+        logger.setLevel(level)
+
+    @pytest.mark.benchmark(group="setup")
+    def test_wait_engine_init(self, benchmark, fake_driver: FakeWebDriver):
+        benchmark(WaitEngine, fake_driver)
+
+    @pytest.mark.benchmark(group="setup")
+    def test_base_page_init(self, benchmark, fake_driver: FakeWebDriver):
+        benchmark(BasePage, fake_driver)
+
+    @pytest.mark.benchmark(group="setup")
+    def test_page_objects_init(self, benchmark, fake_driver: FakeWebDriver):
+        """The four page objects a booking test builds."""
+        def build():
+            return (HomePage(fake_driver), FlightsPage(fake_driver),
+                    PurchasePage(fake_driver), ConfirmationPage(fake_driver))
+
+        benchmark(build)
+
+    @pytest.mark.benchmark(group="setup")
+    def test_load_test_data(self, benchmark):
+        benchmark(load_test_data, "bookings.json")
+
+    @pytest.mark.benchmark(group="setup")
+    def test_driver_lease_release(self, benchmark):
+        """What the driver fixture does per test with pooling: lease, reset and release."""
+        pool = DriverPool(FakeWebDriver, size=1, max_reuse=10 ** 9).start()
+
+        def lease_release():
+            pool.release(pool.lease())
+
+        benchmark(lease_release)
+        pool.close()
+
+    @pytest.mark.benchmark(group="setup")
+    def test_home_page_fixture(self, benchmark, fake_driver: FakeWebDriver):
+        """What the home_page fixture does: build the page and open it."""
+        benchmark(lambda: HomePage(fake_driver).open_home_page())
+
+
+class TestBasePageOverhead:
+    """Ops/sec of the BasePage methods on a loaded purchase form."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, purchase_page: PurchasePage):
+        self.page = purchase_page
+
+    @pytest.mark.benchmark(group="BasePage")
+    def test_find_element(self, benchmark):
+        benchmark(self.page.find_element, PurchasePage.NAME_INPUT)
+
+    @pytest.mark.benchmark(group="BasePage")
+    def test_find_element_css(self, benchmark):
+        benchmark(self.page.find_element, PurchasePage.PRICE_INFO)
+
+    @pytest.mark.benchmark(group="BasePage")
+    def test_find_elements(self, benchmark):
+        benchmark(self.page.find_elements, (By.TAG_NAME, "input"))
+
+    @pytest.mark.benchmark(group="BasePage")
+    def test_click(self, benchmark):
+        benchmark(self.page.click, (By.ID, "rememberMe"))
+
+    @pytest.mark.benchmark(group="BasePage")
+    def test_type_text(self, benchmark):
+        benchmark(self.page.type_text, PurchasePage.NAME_INPUT, "John Doe")
+
+    @pytest.mark.benchmark(group="BasePage")
+    def test_get_text(self, benchmark):
+        benchmark(self.page.get_text, PurchasePage.PAGE_HEADING)
+
+    @pytest.mark.benchmark(group="BasePage")
+    def test_get_attribute(self, benchmark):
+        benchmark(self.page.get_attribute, PurchasePage.NAME_INPUT, "placeholder")
+
+    @pytest.mark.benchmark(group="BasePage")
+    def test_is_element_visible(self, benchmark):
+        benchmark(self.page.is_element_visible, PurchasePage.PURCHASE_BUTTON)
+
+    @pytest.mark.benchmark(group="BasePage")
+    def test_is_element_present(self, benchmark):
+        benchmark(self.page.is_element_present, (By.ID, "missing"))
+
+    @pytest.mark.benchmark(group="BasePage")
+    def test_select_dropdown_by_value(self, benchmark):
+        benchmark(self.page.select_dropdown_by_value, PurchasePage.CARD_TYPE_SELECT, "amex")
+
+    @pytest.mark.benchmark(group="BasePage")
+    def test_select_dropdown_by_text(self, benchmark):
+        benchmark(self.page.select_dropdown_by_text, PurchasePage.CARD_TYPE_SELECT, "American Express")
+
+    @pytest.mark.benchmark(group="BasePage")
+    def test_read_many(self, benchmark):
+        benchmark(self.page.read_many, PurchasePage.FORM_FIELDS, ("value", "visible"))
+
+    @pytest.mark.benchmark(group="BasePage")
+    def test_fill_many(self, benchmark, test_data: dict):
+        passenger = test_data["passenger"]
+        benchmark(self.page.fill_many, {
+            PurchasePage.NAME_INPUT: passenger["name"],
+            PurchasePage.ADDRESS_INPUT: passenger["address"],
+            PurchasePage.CITY_INPUT: passenger["city"],
+            PurchasePage.STATE_INPUT: passenger["state"],
+            PurchasePage.ZIP_INPUT: passenger["zip_code"],
+            PurchasePage.CARD_TYPE_SELECT: "amex",
+        })
+
+    @pytest.mark.benchmark(group="BasePage")
+    def test_document_id(self, benchmark):
+        benchmark(self.page.document_id)
+
+
+class TestPageObjectOverhead:
+    """Ops/sec of the page-object methods the booking tests call."""
+
+    @pytest.mark.benchmark(group="page objects")
+    def test_search_flights(self, benchmark, home_page: HomePage, test_data: dict):
+        route = test_data["routes"]["paris_to_berlin"]
+
+        def search():
+            home_page.open_home_page()
+            home_page.search_flights(route["departure"], route["destination"])
+
+        benchmark(search)
+
+    @pytest.mark.benchmark(group="page objects")
+    def test_get_flights(self, benchmark, flights_page: FlightsPage):
+        benchmark(flights_page.get_flights, refresh=True)
+
+    @pytest.mark.benchmark(group="page objects")
+    def test_get_cheapest_flight_cached(self, benchmark, flights_page: FlightsPage):
+        flights_page.get_flights()
+        benchmark(flights_page.get_cheapest_flight)
+
+    @pytest.mark.benchmark(group="page objects")
+    def test_complete_purchase(self, benchmark, purchase_page: PurchasePage, test_data: dict):
+        flight = test_data["flight"]
+
+        def purchase():
+            purchase_page.goto(flight)
+            purchase_page.complete_purchase(test_data["passenger"], test_data["payment"])
+
+        benchmark(purchase)
+
+    @pytest.mark.benchmark(group="page objects")
+    def test_get_confirmation_details(self, benchmark, confirmation_page: ConfirmationPage):
+        benchmark(confirmation_page.get_confirmation_details)
+
+
+class TestSyntheticDataOverhead:
+    """Per-record cost of synthetic test data."""
+
+    RECORDS = 100
+
+    @pytest.mark.benchmark(group="synthetic data")
+    def test_faker_per_call(self, benchmark):
+        """The former approach: a new Faker for every generated user."""
+        from faker import Faker
+
+        def user():
+            fake = Faker()
+            return {"first_name": fake.first_name(), "last_name": fake.last_name(), "email": fake.email()}
+
+        benchmark(user)
+
+    @pytest.mark.benchmark(group="synthetic data")
+    @pytest.mark.parametrize("kind", ["user", "passenger", "payment"])
+    def test_pool_records(self, benchmark, kind: str):
+        """One batch of RECORDS generated by the seeded pool and handed out."""
+        pool = SyntheticDataPool(seed=1, batch_size=self.RECORDS)
+        benchmark(pool.take, kind, self.RECORDS)
+        benchmark.extra_info["records"] = self.RECORDS
+        if benchmark.stats:
+            benchmark.extra_info["us_per_record"] = benchmark.stats.stats.mean / self.RECORDS * 1e6
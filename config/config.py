@@ -9,20 +9,119 @@ class Config:
     # Base URL
     BASE_URL = "https://www.blazedemo.com"
 
+    # Target site: "live" for www.blazedemo.com or "local" for the bundled
+    # stand-in server. *.localhost resolves to loopback in browsers, so the
+    # local site keeps "blazedemo" in its URLs.
+    TARGET = os.getenv("TARGET", "live")
+    LOCAL_HOSTNAME = "blazedemo.localhost"
+    LOCAL_SERVER_PORT = int(os.getenv("LOCAL_SERVER_PORT", "0"))
+
+    # Driver backend: "browser" for WebDriver or "http" for the browserless
+    # HTTP client, which loads and parses pages without rendering them
+    BACKEND = os.getenv("BACKEND", "browser")
+
     # Browser settings
     BROWSER = os.getenv("BROWSER", "chrome")
     HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
 
+    # Resource blocking (comma separated categories, e.g. "images,fonts,cdn")
+    # and WebDriver page load strategy (normal, eager or none)
+    BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES", "")
+    PAGE_LOAD_STRATEGY = os.getenv("PAGE_LOAD_STRATEGY", "normal")
+
+    # Fill forms with a single script call instead of typing keystrokes
+    FAST_FILL = os.getenv("FAST_FILL", "false").lower() == "true"
+
     # Timeouts (in seconds)
-    IMPLICIT_WAIT = 10
+    # Implicit waits stay off: they stall every explicit wait poll and
+    # negative check, BasePage waits explicitly instead
+    IMPLICIT_WAIT = 0
     EXPLICIT_WAIT = 15
     PAGE_LOAD_TIMEOUT = 30
 
+    # Adaptive wait polling (in seconds): starts fast and backs off to the max
+    WAIT_POLL_INITIAL = 0.05
+    WAIT_POLL_MAX = 0.5
+    WAIT_POLL_BACKOFF = 1.5
+
+    # Record the latency of every WebDriver command for the timing report
+    COMMAND_TIMING = os.getenv("COMMAND_TIMING", "true").lower() == "true"
+    # Number of slowest commands kept for the timing report
+    TIMING_TOP = int(os.getenv("TIMING_TOP", "20"))
+
+    # Driver pool settings (a pool size of 0 launches one browser per test)
+    DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "1"))
+    DRIVER_POOL_MAX_REUSE = int(os.getenv("DRIVER_POOL_MAX_REUSE", "50"))
+
+    # Run each test in an isolated browser context of one shared Chrome
+    # instead of a browser of its own
+    BROWSER_CONTEXTS = os.getenv("BROWSER_CONTEXTS", "false").lower() == "true"
+
+    # Browser performance profile ("default", "lean" or "minimal"); lean and
+    # minimal keep the browser profile on TMPFS_DIR
+    BROWSER_PROFILE = os.getenv("BROWSER_PROFILE", "default")
+    TMPFS_DIR = os.getenv("TMPFS_DIR", "/dev/shm")
+
+    # Browser memory budgets in MB (0 disables them): a driver over
+    # MEMORY_BUDGET_MB is recycled, and while all browsers of a worker are over
+    # WORKER_MEMORY_BUDGET_MB released drivers are closed instead of kept idle
+    MEMORY_BUDGET_MB = int(os.getenv("MEMORY_BUDGET_MB", "0"))
+    WORKER_MEMORY_BUDGET_MB = int(os.getenv("WORKER_MEMORY_BUDGET_MB", "0"))
+    MEMORY_SAMPLE_INTERVAL = float(os.getenv("MEMORY_SAMPLE_INTERVAL", "0.5"))
+
+    # In-worker retries of timeout, stale element and WebDriver failures:
+    # retries per test, retries a worker may spend in total, outcomes kept per
+    # test in the flakiness database, and the flake rate over at least
+    # QUARANTINE_MIN_RUNS recorded runs that quarantines a test (0 disables)
+    RETRIES = int(os.getenv("RETRIES", "1"))
+    RETRY_BUDGET = int(os.getenv("RETRY_BUDGET", "10"))
+    FLAKE_HISTORY = int(os.getenv("FLAKE_HISTORY", "20"))
+    QUARANTINE_RATE = float(os.getenv("QUARANTINE_RATE", "0.3"))
+    QUARANTINE_MIN_RUNS = int(os.getenv("QUARANTINE_MIN_RUNS", "5"))
+
+    # Concurrent async browser sessions per flow run and how many may be open at once
+    ASYNC_SESSIONS = int(os.getenv("ASYNC_SESSIONS", "10"))
+    ASYNC_CONCURRENCY = int(os.getenv("ASYNC_CONCURRENCY", "5"))
+
+    # Distribute xdist runs by historical test durations ("lpt") or with
+    # xdist's own --dist scheduler ("xdist")
+    SCHEDULER = os.getenv("SCHEDULER", "lpt")
+
+    # Failure artifacts: screenshot format ("png", "webp" or "jpeg"), scale
+    # factor and WebP/JPEG quality, written by background threads
+    ARTIFACT_FORMAT = os.getenv("ARTIFACT_FORMAT", "png")
+    ARTIFACT_SCALE = float(os.getenv("ARTIFACT_SCALE", "1.0"))
+    ARTIFACT_QUALITY = int(os.getenv("ARTIFACT_QUALITY", "80"))
+    ARTIFACT_WORKERS = int(os.getenv("ARTIFACT_WORKERS", "2"))
+
+    # Seed of the synthetic data pool (random per run when unset) and its batch size
+    DATA_SEED = int(os.getenv("DATA_SEED")) if os.getenv("DATA_SEED") else None
+    DATA_POOL_BATCH_SIZE = int(os.getenv("DATA_POOL_BATCH_SIZE", "200"))
+
+    # Framework log level (records below it are dropped before they are
+    # formatted) and whether a JSON-lines log is written next to the text log
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG").upper()
+    LOG_JSON = os.getenv("LOG_JSON", "true").lower() == "true"
+
+    # Whether the Chrome sessions of a process share one running chromedriver
+    SHARED_DRIVER_SERVICE = os.getenv("SHARED_DRIVER_SERVICE", "true").lower() == "true"
+
     # Paths
     ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     SCREENSHOTS_DIR = os.path.join(ROOT_DIR, "screenshots")
     REPORTS_DIR = os.path.join(ROOT_DIR, "reports")
     TEST_DATA_DIR = os.path.join(ROOT_DIR, "test_data")
+    HTTP_CACHE_DIR = os.path.join(ROOT_DIR, ".http_cache")
+    DURATIONS_FILE = os.path.join(ROOT_DIR, ".test_durations.json")
+    DRIVER_CACHE_FILE = os.path.join(ROOT_DIR, ".driver_cache.json")
+    DEPENDENCY_MAP_FILE = os.path.join(ROOT_DIR, ".dependency_map.json")
+    FLAKE_DB_FILE = os.path.join(ROOT_DIR, ".flake_db.json")
+
+    # HTTP record/replay cache ("off", "record" or "replay") and its size limit.
+    # PROXY ("host:port") is the HTTP proxy browsers are launched with.
+    HTTP_CACHE = os.getenv("HTTP_CACHE", "off")
+    HTTP_CACHE_MAX_MB = int(os.getenv("HTTP_CACHE_MAX_MB", "200"))
+    PROXY = os.getenv("PROXY", "")
 
     # Create directories if they don't exist
     @classmethod
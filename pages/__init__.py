@@ -1,13 +1,24 @@
-from pages.base_page import BasePage
+from pages.base_page import BasePage, ElementCache, WaitEngine
 from pages.home_page import HomePage
-from pages.flights_page import FlightsPage
+from pages.flights_page import FlightsPage, FlightRecord
 from pages.purchase_page import PurchasePage
 from pages.confirmation_page import ConfirmationPage
+from pages.async_pages import (
+    AsyncBasePage, AsyncHomePage, AsyncFlightsPage, AsyncPurchasePage, AsyncConfirmationPage
+)
 
 __all__ = [
     "BasePage",
+    "ElementCache",
+    "WaitEngine",
     "HomePage",
     "FlightsPage",
+    "FlightRecord",
     "PurchasePage",
-    "ConfirmationPage"
+    "ConfirmationPage",
+    "AsyncBasePage",
+    "AsyncHomePage",
+    "AsyncFlightsPage",
+    "AsyncPurchasePage",
+    "AsyncConfirmationPage"
 ]
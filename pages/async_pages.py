@@ -0,0 +1,356 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from selenium.common.exceptions import (
+    NoSuchElementException, StaleElementReferenceException, TimeoutException
+)
+from config.config import Config
+from pages.base_page import (
+    DOCUMENT_ID_SCRIPT, FILL_MANY_SCRIPT, READ_MANY_SCRIPT, READ_TABLE_SCRIPT,
+    SUBMIT_FORM_SCRIPT, TableSnapshot, WaitRecord
+)
+from pages.confirmation_page import ConfirmationPage
+from pages.flights_page import FlightRecord, FlightsPage
+from pages.home_page import HomePage
+from pages.purchase_page import PurchasePage
+from utilities.async_webdriver import AsyncWebDriver, AsyncWebElement
+from utilities.logger import get_logger
+from utilities.resource_blocking import PAGE_LOAD_SCRIPT
+
+
+class AsyncBasePage:
+    """
+    asyncio counterpart of BasePage for AsyncWebDriver sessions.
+
+    Waits poll with the same adaptive back-off as WaitEngine but yield to
+    the event loop between polls, so other sessions keep running.
+    """
+
+    def __init__(self, driver: AsyncWebDriver):
+        self.driver = driver
+        self.timeout = Config.EXPLICIT_WAIT
+        self.logger = get_logger(self.__class__.__name__)
+        self.wait_records: List[WaitRecord] = []
+
+    async def until(self, condition: Callable[[], Awaitable[Any]], message: str = "",
+                    timeout: float = None, label: str = "condition") -> Any:
+        """
+        Await condition until it returns a truthy value.
+
+        Args:
+            condition: Coroutine function taking no arguments
+            message: Message for the TimeoutException
+            timeout: Timeout in seconds (defaults to Config.EXPLICIT_WAIT)
+            label: Name recorded with the wait timing
+
+        Returns:
+            The first truthy value returned by condition
+        """
+        timeout = self.timeout if timeout is None else timeout
+        poll = Config.WAIT_POLL_INITIAL
+        start = time.monotonic()
+        end_time = start + timeout
+        while True:
+            try:
+                value = await condition()
+                if value:
+                    self.wait_records.append(WaitRecord(label, time.monotonic() - start, False))
+                    return value
+            except (NoSuchElementException, StaleElementReferenceException):
+                pass
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(poll, remaining))
+            poll = min(poll * Config.WAIT_POLL_BACKOFF, Config.WAIT_POLL_MAX)
+        self.wait_records.append(WaitRecord(label, time.monotonic() - start, True))
+        raise TimeoutException(message or f"Timed out waiting for {label}")
+
+    async def open(self, url: str) -> None:
+        """Navigate to the specified URL."""
+        self.logger.info(f"Opening URL: {url}")
+        await self.driver.get(url)
+
+    async def get_title(self) -> str:
+        """Get the current page title."""
+        return await self.driver.title()
+
+    async def get_current_url(self) -> str:
+        """Get the current page URL."""
+        return await self.driver.current_url()
+
+    async def find_element(self, locator: Tuple[str, str]) -> AsyncWebElement:
+        """Wait for an element to be present and return it."""
+        return await self.until(lambda: self.driver.find_element(*locator), label=f"present {locator}")
+
+    async def find_elements(self, locator: Tuple[str, str]) -> List[AsyncWebElement]:
+        """Wait for at least one matching element and return all of them."""
+        return await self.until(lambda: self.driver.find_elements(*locator), label=f"present {locator}")
+
+    async def click(self, locator: Tuple[str, str]) -> None:
+        """Wait for element to be clickable and click it."""
+        self.logger.debug(f"Clicking element: {locator}")
+
+        async def clickable():
+            element = await self.driver.find_element(*locator)
+            return element if await element.is_displayed() and await element.is_enabled() else None
+
+        element = await self.until(clickable, label=f"clickable {locator}")
+        await element.click()
+
+    async def type_text(self, locator: Tuple[str, str], text: str, clear_first: bool = True) -> None:
+        """Type text into an input field."""
+        self.logger.debug(f"Typing '{text}' into element: {locator}")
+        element = await self.find_element(locator)
+        if clear_first:
+            await element.clear()
+        await element.send_keys(text)
+
+    async def get_text(self, locator: Tuple[str, str]) -> str:
+        """Get the text content of an element."""
+        return await (await self.find_element(locator)).text()
+
+    async def get_attribute(self, locator: Tuple[str, str], attribute: str) -> Any:
+        """Get a property (or, failing that, attribute) value from an element."""
+        element = await self.find_element(locator)
+        value = await element.get_property(attribute)
+        return value if value is not None else await element.get_dom_attribute(attribute)
+
+    async def is_element_visible(self, locator: Tuple[str, str], timeout: int = None) -> bool:
+        """Check if an element is visible on the page, waiting up to timeout for it."""
+        async def visible():
+            return await (await self.driver.find_element(*locator)).is_displayed()
+
+        try:
+            return await self.until(visible, timeout=timeout, label=f"visible {locator}")
+        except TimeoutException:
+            return False
+
+    async def select_dropdown_by_value(self, locator: Tuple[str, str], value: str) -> None:
+        """Select a dropdown option by value attribute."""
+        dropdown = await self.find_element(locator)
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        option = await dropdown.find_element("css selector", f'option[value="{escaped}"]')
+        if not await option.is_selected():
+            await option.click()
+
+    async def read_many(self, locators: Dict[str, Tuple[str, str]],
+                        fields: Sequence[str] = ("text",),
+                        wait: bool = True) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Read properties of several elements in a single round-trip; see BasePage.read_many."""
+        args = ({name: list(locator) for name, locator in locators.items()}, list(fields))
+
+        async def read():
+            result = await self.driver.execute_script(READ_MANY_SCRIPT, *args)
+            if wait and any(values is None for values in result.values()):
+                return None
+            return result
+
+        if wait:
+            return await self.until(read, label="read_many")
+        return await read()
+
+    async def fill_many(self, values: Dict[Tuple[str, str], str]) -> None:
+        """Set several input and dropdown values in a single round-trip; see BasePage.fill_many."""
+        entries = [[by, value, text] for (by, value), text in values.items()]
+        self.logger.debug(f"Fast filling {len(entries)} fields")
+
+        async def filled():
+            return not await self.driver.execute_script(FILL_MANY_SCRIPT, entries)
+
+        try:
+            await self.until(filled, label="fill_many")
+        except TimeoutException:
+            missing = await self.driver.execute_script(FILL_MANY_SCRIPT, entries)
+            raise NoSuchElementException(f"Could not fill fields: {missing}")
+
+    async def submit_form(self, url: str, fields: Dict[str, str], method: str = "post") -> None:
+        """Navigate by submitting form data directly; see BasePage.submit_form."""
+        self.logger.info(f"Submitting {method.upper()} {url} with {sorted(fields)}")
+        await self.driver.execute_script(SUBMIT_FORM_SCRIPT, url, method, fields)
+
+        async def replaced():
+            return not await self.driver.execute_script("return window.__pomFormSubmitted === true;")
+
+        await self.until(replaced, label="form submission")
+        await self.wait_for_page_load()
+
+    async def wait_for_page_load(self) -> Dict[str, Any]:
+        """Wait for the page to load; with the eager page load strategy an interactive DOM is enough."""
+        ready_states = ("interactive", "complete") if Config.PAGE_LOAD_STRATEGY == "eager" else ("complete",)
+
+        async def loaded():
+            result = await self.driver.execute_script(PAGE_LOAD_SCRIPT)
+            return result if result["state"] in ready_states else None
+
+        return await self.until(loaded, label="page load")
+
+    async def document_id(self) -> str:
+        """Identify the current document; the ID changes whenever the page navigates."""
+        return await self.driver.execute_script(DOCUMENT_ID_SCRIPT)
+
+    async def read_table(self, rows_locator: Tuple[str, str]) -> TableSnapshot:
+        """Read every cell of the matching table rows in a single round-trip."""
+        async def read():
+            result = await self.driver.execute_script(READ_TABLE_SCRIPT, *rows_locator)
+            return TableSnapshot(result["document"], result["rows"]) if result["rows"] else None
+
+        return await self.until(read, label=f"table rows {rows_locator}")
+
+
+class AsyncHomePage(AsyncBasePage):
+    """asyncio counterpart of HomePage."""
+
+    DEPARTURE_SELECT = HomePage.DEPARTURE_SELECT
+    DESTINATION_SELECT = HomePage.DESTINATION_SELECT
+    FIND_FLIGHTS_BUTTON = HomePage.FIND_FLIGHTS_BUTTON
+    TITLE_HEADING = HomePage.TITLE_HEADING
+
+    async def open_home_page(self) -> "AsyncHomePage":
+        """Navigate to the home page."""
+        await self.open(Config.BASE_URL)
+        await self.wait_for_page_load()
+        return self
+
+    async def search_flights(self, departure: str, destination: str) -> None:
+        """
+        Complete search for flights.
+
+        Args:
+            departure: Departure city
+            destination: Destination city
+        """
+        self.logger.info(f"Searching flights from {departure} to {destination}")
+        await self.select_dropdown_by_value(self.DEPARTURE_SELECT, departure)
+        await self.select_dropdown_by_value(self.DESTINATION_SELECT, destination)
+        await self.click(self.FIND_FLIGHTS_BUTTON)
+        await self.wait_for_page_load()
+
+    async def get_page_heading(self) -> str:
+        """Get the main heading text."""
+        return await self.get_text(self.TITLE_HEADING)
+
+
+class AsyncFlightsPage(AsyncBasePage):
+    """asyncio counterpart of FlightsPage."""
+
+    FLIGHT_ROWS = FlightsPage.FLIGHT_ROWS
+    CHOOSE_FLIGHT_BUTTONS = FlightsPage.CHOOSE_FLIGHT_BUTTONS
+
+    def __init__(self, driver: AsyncWebDriver):
+        super().__init__(driver)
+        self._flights: Optional[TableSnapshot] = None
+        self._records: List[FlightRecord] = []
+
+    async def goto(self, departure: str, destination: str) -> "AsyncFlightsPage":
+        """Open the flights list for a route directly, skipping the home page search."""
+        await self.submit_form(Config.BASE_URL + FlightsPage.PATH, {
+            "fromPort": departure,
+            "toPort": destination,
+        })
+        return self
+
+    async def is_on_flights_page(self) -> bool:
+        """Check if we're on the flights page."""
+        return "reserve" in (await self.get_current_url()).lower()
+
+    async def get_flights(self, refresh: bool = False) -> List[FlightRecord]:
+        """Get every flight in the table from a single extraction, cached until navigation."""
+        if refresh or self._flights is None or self._flights.document != await self.document_id():
+            self._flights = await self.read_table(self.FLIGHT_ROWS)
+            self._records = [FlightRecord.from_cells(index, cells)
+                             for index, cells in enumerate(self._flights.rows)]
+        return list(self._records)
+
+    async def get_cheapest_flight(self) -> FlightRecord:
+        """Get the flight with the lowest price (the first one on ties)."""
+        return min(await self.get_flights(), key=lambda flight: flight.price)
+
+    async def select_flight(self, index: int = 0) -> None:
+        """Select a flight by index (0-based) and wait for the purchase page."""
+        self.logger.info(f"Selecting flight at index {index}")
+        buttons = await self.find_elements(self.CHOOSE_FLIGHT_BUTTONS)
+        if index >= len(buttons):
+            raise IndexError(f"Flight index {index} out of range")
+        await buttons[index].click()
+        await self.wait_for_page_load()
+
+    async def select_cheapest_flight(self) -> FlightRecord:
+        """Select the cheapest available flight and return it."""
+        cheapest = await self.get_cheapest_flight()
+        await self.select_flight(cheapest.index)
+        return cheapest
+
+
+class AsyncPurchasePage(AsyncBasePage):
+    """asyncio counterpart of PurchasePage."""
+
+    FORM_FIELDS = PurchasePage.FORM_FIELDS
+    PURCHASE_BUTTON = PurchasePage.PURCHASE_BUTTON
+
+    async def goto(self, flight: dict) -> "AsyncPurchasePage":
+        """Open the purchase form for a flight directly; see PurchasePage.goto."""
+        await self.submit_form(Config.BASE_URL + PurchasePage.PATH, {
+            "flight": flight['flight'],
+            "price": flight['price'],
+            "airline": flight['airline'],
+            "fromPort": flight['from_port'],
+            "toPort": flight['to_port'],
+        })
+        return self
+
+    async def is_on_purchase_page(self) -> bool:
+        """Check if we're on the purchase page."""
+        return "purchase" in (await self.get_current_url()).lower()
+
+    async def complete_purchase(self, passenger_data: dict, payment_data: dict,
+                                fast: bool = None) -> None:
+        """
+        Complete the entire purchase form and submit it.
+
+        Args:
+            passenger_data: Dict with keys: name, address, city, state, zip_code
+            payment_data: Dict with keys: card_type, card_number, month, year, name_on_card
+            fast: Fill the whole form in one script call instead of typing it
+                (defaults to Config.FAST_FILL)
+        """
+        values = {self.FORM_FIELDS[name]: passenger_data[name]
+                  for name in ("name", "address", "city", "state", "zip_code")}
+        values.update({self.FORM_FIELDS[name]: payment_data[name]
+                       for name in ("card_type", "card_number", "month", "year", "name_on_card")})
+        if Config.FAST_FILL if fast is None else fast:
+            await self.fill_many(values)
+        else:
+            for locator, value in values.items():
+                if locator == self.FORM_FIELDS["card_type"]:
+                    await self.select_dropdown_by_value(locator, value)
+                else:
+                    await self.type_text(locator, value)
+        await self.click(self.PURCHASE_BUTTON)
+        await self.wait_for_page_load()
+
+
+class AsyncConfirmationPage(AsyncBasePage):
+    """asyncio counterpart of ConfirmationPage."""
+
+    CONFIRMATION_HEADING = ConfirmationPage.CONFIRMATION_HEADING
+    TRANSACTION_ID = ConfirmationPage.TRANSACTION_ID
+    DETAIL_FIELDS = ConfirmationPage.DETAIL_FIELDS
+
+    async def is_on_confirmation_page(self) -> bool:
+        """Check if we're on the confirmation page."""
+        return "confirmation" in (await self.get_current_url()).lower()
+
+    async def get_transaction_id(self) -> str:
+        """Get the transaction ID."""
+        return await self.get_text(self.TRANSACTION_ID)
+
+    async def get_confirmation_details(self) -> Dict[str, str]:
+        """Get every confirmation table value in a single round-trip."""
+        details = await self.read_many(self.DETAIL_FIELDS, fields=("text",))
+        return {name: values["text"] for name, values in details.items()}
+
+    async def is_purchase_successful(self) -> bool:
+        """Check if the purchase was successful."""
+        heading = (await self.get_text(self.CONFIRMATION_HEADING)).lower()
+        return "thank you" in heading or "confirmation" in heading
@@ -1,27 +1,498 @@
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from typing import List, Tuple
+from selenium.common.exceptions import (
+    ElementClickInterceptedException, ElementNotInteractableException, TimeoutException,
+    NoSuchElementException, StaleElementReferenceException, WebDriverException
+)
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import threading
+import time
 from config.config import Config
 from utilities.logger import get_logger
+from utilities.driver_startup import get_startup_stats
+from utilities.instrumentation import get_recorder
+from utilities.resource_blocking import PAGE_LOAD_SCRIPT, get_page_load_stats
+
+
+# Resolves a Selenium (By, value) locator inside the page.
+RESOLVE_LOCATOR_JS = """
+function resolve(by, value) {
+    switch (by) {
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'css selector': return document.querySelector(value);
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'xpath':
+            return document.evaluate(value, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'link text':
+        case 'partial link text':
+            var links = document.getElementsByTagName('a');
+            for (var i = 0; i < links.length; i++) {
+                var text = links[i].innerText.trim();
+                if (by === 'link text' ? text === value : text.indexOf(value) !== -1) {
+                    return links[i];
+                }
+            }
+            return null;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+
+function isVisible(el) {
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' &&
+        el.getClientRects().length > 0;
+}
+"""
+
+# Resolves a batch of locators and reads the requested properties of each
+# element in a single round-trip. Unknown field names are read as attributes.
+READ_MANY_SCRIPT = RESOLVE_LOCATOR_JS + """
+var locators = arguments[0], fields = arguments[1], result = {};
+
+function read(el, field) {
+    switch (field) {
+        case 'text': return isVisible(el) ? el.innerText.trim() : '';
+        case 'value': return el.value === undefined ? null : el.value;
+        case 'visible': return isVisible(el);
+        case 'enabled': return !el.disabled;
+        case 'selected': return !!(el.selected || el.checked);
+        case 'tag': return el.tagName.toLowerCase();
+    }
+    return el.getAttribute(field);
+}
+
+for (var name in locators) {
+    var el = resolve(locators[name][0], locators[name][1]);
+    if (!el) {
+        result[name] = null;
+        continue;
+    }
+    result[name] = {};
+    for (var i = 0; i < fields.length; i++) {
+        result[name][fields[i]] = read(el, fields[i]);
+    }
+}
+return result;
+"""
+
+# Sets the value of a batch of inputs and dropdowns in a single round-trip and
+# fires the events a user would. Nothing is changed unless every locator
+# resolves; the names of missing elements or dropdown options are returned.
+FILL_MANY_SCRIPT = RESOLVE_LOCATOR_JS + """
+var entries = arguments[0], elements = [], missing = [];
+
+for (var i = 0; i < entries.length; i++) {
+    var el = resolve(entries[i][0], entries[i][1]);
+    if (!el) {
+        missing.push(entries[i][0] + '=' + entries[i][1]);
+    } else if (el.tagName === 'SELECT' && !Array.prototype.some.call(
+            el.options, function (o) { return o.value === entries[i][2]; })) {
+        missing.push(entries[i][0] + '=' + entries[i][1] + ' option ' + entries[i][2]);
+    }
+    elements.push(el);
+}
+if (missing.length) {
+    return missing;
+}
+
+for (var i = 0; i < elements.length; i++) {
+    var el = elements[i], value = entries[i][2];
+    var proto = Object.getPrototypeOf(el);
+    var setter = Object.getOwnPropertyDescriptor(proto, 'value');
+    el.focus();
+    if (setter && setter.set) {
+        setter.set.call(el, value);
+    } else {
+        el.value = value;
+    }
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+}
+return missing;
+"""
+
+# Waits inside the browser for an element to become visible (or to disappear)
+# using a MutationObserver, with a short re-check interval as a backstop for
+# style changes that do not mutate the DOM. Resolves to true on success.
+MUTATION_WAIT_SCRIPT = RESOLVE_LOCATOR_JS + """
+var by = arguments[0], value = arguments[1], appear = arguments[2],
+    timeoutMs = arguments[3], done = arguments[arguments.length - 1];
+var observer = null, interval = null, timer = null;
+
+function satisfied() {
+    var el = resolve(by, value);
+    var visible = !!el && isVisible(el);
+    return appear ? visible : !visible;
+}
+
+function finish(result) {
+    if (observer) observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(result);
+}
+
+if (satisfied()) {
+    finish(true);
+} else {
+    observer = new MutationObserver(function () { if (satisfied()) finish(true); });
+    observer.observe(document, {childList: true, subtree: true, attributes: true});
+    interval = setInterval(function () { if (satisfied()) finish(true); }, 100);
+    timer = setTimeout(function () { finish(satisfied()); }, timeoutMs);
+}
+"""
+
+# Stamps the current document with a random ID on first use. The stamp lives
+# on window, so it changes whenever the browser navigates to a new document.
+DOCUMENT_ID_JS = """
+function documentId() {
+    if (!window.__pomDocumentId) {
+        window.__pomDocumentId = Date.now().toString(36) + Math.random().toString(36).slice(2);
+    }
+    return window.__pomDocumentId;
+}
+"""
+
+DOCUMENT_ID_SCRIPT = DOCUMENT_ID_JS + "return documentId();"
+
+# Reads the visible text of every cell of the matching table rows in a single
+# round-trip, together with the ID of the document it was read from.
+READ_TABLE_SCRIPT = DOCUMENT_ID_JS + """
+var by = arguments[0], value = arguments[1], rows;
+switch (by) {
+    case 'css selector': rows = document.querySelectorAll(value); break;
+    case 'tag name': rows = document.getElementsByTagName(value); break;
+    case 'class name': rows = document.getElementsByClassName(value); break;
+    case 'xpath':
+        var snapshot = document.evaluate(value, document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        rows = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) rows.push(snapshot.snapshotItem(i));
+        break;
+    default: throw new Error('Unsupported locator strategy: ' + by);
+}
+return {
+    document: documentId(),
+    rows: Array.prototype.map.call(rows, function (row) {
+        return Array.prototype.map.call(row.cells || row.children, function (cell) {
+            return cell.innerText.trim();
+        });
+    })
+};
+"""
+
+# Builds a form on the current document and submits it, navigating the
+# browser straight to the response page. The old document is flagged so the
+# caller can tell when the new one has replaced it.
+SUBMIT_FORM_SCRIPT = """
+var action = arguments[0], method = arguments[1], fields = arguments[2];
+var form = document.createElement('form');
+form.action = action;
+form.method = method;
+for (var name in fields) {
+    var input = document.createElement('input');
+    input.type = 'hidden';
+    input.name = name;
+    input.value = fields[name];
+    form.appendChild(input);
+}
+(document.body || document.documentElement).appendChild(form);
+window.__pomFormSubmitted = true;
+form.submit();
+"""
+
+
+class WaitRecord(NamedTuple):
+    """Timing of a single wait."""
+
+    label: str
+    duration: float
+    timed_out: bool
+
+
+class TableSnapshot(NamedTuple):
+    """Cell texts of table rows and the document they were read from."""
+
+    document: str
+    rows: List[List[str]]
+
+
+class WaitEngine:
+    """
+    Explicit wait with adaptive polling and per-wait timing.
+
+    Conditions are polled quickly at first and the interval backs off towards
+    a ceiling, so short waits return fast without hammering the driver during
+    long ones. Implicit waits must stay disabled (Config.IMPLICIT_WAIT = 0) or
+    every poll can stall for the implicit timeout.
+
+    Documents of a browserless driver (supports_javascript = False) only
+    change when it navigates, so conditions are checked once instead of polled.
+    """
+
+    # Default W3C script timeout; in-browser waits must finish before it
+    SCRIPT_TIMEOUT = 30
+
+    def __init__(self, driver: WebDriver, timeout: float = None,
+                 initial_poll: float = None, max_poll: float = None,
+                 backoff: float = None):
+        """
+        Args:
+            driver: WebDriver instance
+            timeout: Default timeout in seconds
+            initial_poll: First polling interval in seconds
+            max_poll: Upper bound for the polling interval in seconds
+            backoff: Factor the polling interval grows by after each poll
+        """
+        self.driver = driver
+        self.timeout = timeout or Config.EXPLICIT_WAIT
+        self.initial_poll = initial_poll or Config.WAIT_POLL_INITIAL
+        self.max_poll = max_poll or Config.WAIT_POLL_MAX
+        self.backoff = backoff or Config.WAIT_POLL_BACKOFF
+        self.ignored_exceptions = (NoSuchElementException, StaleElementReferenceException)
+        self.records: List[WaitRecord] = []
+        self.static = not getattr(driver, "supports_javascript", True)
+
+    def until(self, method: Callable[[WebDriver], Any], message: str = "",
+              timeout: float = None, label: str = None) -> Any:
+        """
+        Call method with the driver until it returns a truthy value.
+
+        Args:
+            method: Condition callable taking the driver
+            message: Message for the TimeoutException
+            timeout: Timeout in seconds (defaults to the engine timeout)
+            label: Name recorded with the wait timing
+
+        Returns:
+            The first truthy value returned by method
+        """
+        timeout = 0 if self.static else self.timeout if timeout is None else timeout
+        label = label or getattr(method, "__qualname__", repr(method))
+        screen = stacktrace = None
+        poll = self.initial_poll
+        start = time.monotonic()
+        end_time = start + timeout
+
+        while True:
+            try:
+                value = method(self.driver)
+                if value:
+                    self._record(label, start, timed_out=False)
+                    return value
+            except self.ignored_exceptions as exc:
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(poll, remaining))
+            poll = min(poll * self.backoff, self.max_poll)
+
+        self._record(label, start, timed_out=True)
+        raise TimeoutException(message, screen, stacktrace)
+
+    def until_not(self, method: Callable[[WebDriver], Any], message: str = "",
+                  timeout: float = None, label: str = None) -> bool:
+        """Call method with the driver until it returns a falsy value."""
+        label = label or getattr(method, "__qualname__", repr(method))
+
+        def negated(driver):
+            try:
+                return not method(driver)
+            except self.ignored_exceptions:
+                return True
+
+        return self.until(negated, message, timeout, f"not {label}")
+
+    def for_element(self, locator: Tuple[str, str], visible: bool = True,
+                    timeout: float = None) -> bool:
+        """
+        Wait for an element to become visible, or to disappear.
+
+        Uses an in-browser MutationObserver when the timeout fits in the
+        script timeout, so the wait costs a single round-trip; otherwise
+        falls back to adaptive polling.
+
+        Args:
+            locator: Element locator
+            visible: True to wait for appearance, False for disappearance
+            timeout: Timeout in seconds
+
+        Returns:
+            True if the condition was met before the timeout
+        """
+        timeout = self.timeout if timeout is None else timeout
+        label = f"{'visible' if visible else 'invisible'} {locator}"
+
+        if timeout < self.SCRIPT_TIMEOUT and not self.static:
+            start = time.monotonic()
+            try:
+                result = self.driver.execute_async_script(
+                    MUTATION_WAIT_SCRIPT, locator[0], locator[1], visible, int(timeout * 1000)
+                )
+                self._record(label, start, timed_out=not result)
+                return bool(result)
+            except WebDriverException:
+                timeout = max(timeout - (time.monotonic() - start), 0)
+
+        condition = (EC.visibility_of_element_located(locator) if visible
+                     else EC.invisibility_of_element_located(locator))
+        try:
+            self.until(condition, timeout=timeout, label=label)
+            return True
+        except TimeoutException:
+            return False
+
+    def _record(self, label: str, start: float, timed_out: bool) -> None:
+        record = WaitRecord(label, time.monotonic() - start, timed_out)
+        self.records.append(record)
+        get_recorder().record_wait(*record)
+
+
+class ElementCacheStats:
+    """Lookup outcomes of the element caches of every page in this process."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.not_interactable = 0
+        self._lock = threading.Lock()
+
+    def count(self, hits: int = 0, misses: int = 0, stale: int = 0, not_interactable: int = 0) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.stale += stale
+            self.not_interactable += not_interactable
+
+    def summarize(self) -> Dict[str, int]:
+        """Return {"hits", "misses", "stale", "not_interactable"}."""
+        return {"hits": self.hits, "misses": self.misses, "stale": self.stale,
+                "not_interactable": self.not_interactable}
+
+
+def merge_element_cache_summaries(summaries: List[Dict[str, int]]) -> Dict[str, int]:
+    """Merge ElementCacheStats.summarize results from several workers."""
+    merged = {"hits": 0, "misses": 0, "stale": 0, "not_interactable": 0}
+    for summary in summaries:
+        for key in merged:
+            merged[key] += summary.get(key, 0)
+    return merged
+
+
+def format_element_cache_summary(summary: Dict[str, int]) -> Optional[str]:
+    """Describe the element lookups the caches answered, or None if nothing was looked up."""
+    lookups = summary["hits"] + summary["misses"]
+    if not lookups:
+        return None
+    saved = summary["hits"] - summary["stale"] - summary["not_interactable"]
+    return (f"Element cache: {summary['hits']}/{lookups} lookups served from cache, "
+            f"{summary['stale']} stale re-fetch(es), "
+            f"{summary['not_interactable']} not yet interactable, {saved} round-trip(s) saved")
+
+
+_element_cache_stats = ElementCacheStats()
+
+
+def get_element_cache_stats() -> ElementCacheStats:
+    """Return the process-wide element cache statistics."""
+    return _element_cache_stats
+
+
+class ElementCache:
+    """
+    Elements a page has already located, keyed by locator.
+
+    Entries belong to the document they were found on. The page empties the
+    cache when it navigates (open, click, form submission), and for
+    browserless drivers a change of the driver's document ID empties it too.
+    Hits are not re-checked with an extra round-trip: the command run on
+    the cached element is the check, and a StaleElementReferenceException
+    makes the page locate the element again.
+    """
+
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.not_interactable = 0
+        self._elements: Dict[Tuple[str, str], WebElement] = {}
+        self._document = self._document_key()
+
+    def get(self, locator: Tuple[str, str]) -> Optional[WebElement]:
+        """Return the cached element of a locator, or None on a miss."""
+        document = self._document_key()
+        if document != self._document:
+            self._elements.clear()
+            self._document = document
+        element = self._elements.get(tuple(locator))
+        if element is None:
+            self.misses += 1
+            get_element_cache_stats().count(misses=1)
+        else:
+            self.hits += 1
+            get_element_cache_stats().count(hits=1)
+        return element
+
+    def put(self, locator: Tuple[str, str], element: WebElement) -> None:
+        self._elements[tuple(locator)] = element
+
+    def discard(self, locator: Tuple[str, str], stale: bool = True) -> None:
+        """
+        Drop a cached element that could not be used.
+
+        Args:
+            locator: Locator of the element
+            stale: Whether it went stale, rather than being present but not interactable
+        """
+        self._elements.pop(tuple(locator), None)
+        if stale:
+            self.stale += 1
+            get_element_cache_stats().count(stale=1)
+        else:
+            self.not_interactable += 1
+            get_element_cache_stats().count(not_interactable=1)
+
+    def clear(self) -> None:
+        self._elements.clear()
+
+    def _document_key(self) -> Any:
+        # HttpDriver counts its documents; browsers are tracked by the page's navigations
+        return getattr(self.driver, "document_id", None)
 
 
 class BasePage:
-    """Base page class containing common methods for all page objects."""
+    """
+    Base page class containing common methods for all page objects.
+
+    Elements located by the interaction helpers are kept in a per-page
+    ElementCache, so repeated use of a locator on the same document skips
+    the lookup round-trip.
+    """
 
     def __init__(self, driver: WebDriver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, Config.EXPLICIT_WAIT)
+        self.wait = WaitEngine(driver, Config.EXPLICIT_WAIT)
+        self.elements = ElementCache(driver)
         self.logger = get_logger(self.__class__.__name__)
 
     def open(self, url: str) -> None:
         """Navigate to the specified URL."""
         self.logger.info(f"Opening URL: {url}")
+        self.elements.clear()
+        start = time.perf_counter()
         self.driver.get(url)
+        get_startup_stats().record_navigation(self.driver, time.perf_counter() - start)
 
     def get_title(self) -> str:
         """Get the current page title."""
@@ -41,7 +512,30 @@ class BasePage:
         Returns:
             WebElement if found
         """
-        return self.wait.until(EC.presence_of_element_located(locator))
+        element = self.wait.until(EC.presence_of_element_located(locator))
+        self.elements.put(locator, element)
+        return element
+
+    def _with_element(self, locator: Tuple[str, str], action: Callable[[WebElement], Any]) -> Any:
+        """
+        Run an action on an element, reusing the cached element when there is one.
+
+        A cached element that has gone stale is located again and the action retried.
+
+        Args:
+            locator: Element locator
+            action: Callable taking the element
+
+        Returns:
+            What the action returns
+        """
+        element = self.elements.get(locator)
+        if element is not None:
+            try:
+                return action(element)
+            except StaleElementReferenceException:
+                self.elements.discard(locator)
+        return action(self.find_element(locator))
 
     def find_elements(self, locator: Tuple[str, str]) -> List[WebElement]:
         """
@@ -56,10 +550,30 @@ class BasePage:
         return self.wait.until(EC.presence_of_all_elements_located(locator))
 
     def click(self, locator: Tuple[str, str]) -> None:
-        """Wait for element to be clickable and click it."""
+        """
+        Click an element once it is clickable.
+
+        A cached element that is displayed and enabled is clicked without
+        locating it again; otherwise the page waits for the element to be
+        clickable. The click may navigate, so the element cache is emptied
+        afterwards.
+        """
         self.logger.debug(f"Clicking element: {locator}")
-        element = self.wait.until(EC.element_to_be_clickable(locator))
-        element.click()
+        element = self.elements.get(locator)
+        try:
+            if element is not None:
+                try:
+                    if element.is_displayed() and element.is_enabled():
+                        element.click()
+                        return
+                    self.elements.discard(locator, stale=False)
+                except StaleElementReferenceException:
+                    self.elements.discard(locator)
+                except (ElementNotInteractableException, ElementClickInterceptedException):
+                    self.elements.discard(locator, stale=False)
+            self.wait.until(EC.element_to_be_clickable(locator)).click()
+        finally:
+            self.elements.clear()
 
     def type_text(self, locator: Tuple[str, str], text: str, clear_first: bool = True) -> None:
         """
@@ -71,23 +585,21 @@ class BasePage:
             clear_first: Whether to clear the field first
         """
         self.logger.debug(f"Typing '{text}' into element: {locator}")
-        element = self.find_element(locator)
-        if clear_first:
-            element.clear()
-        element.send_keys(text)
+
+        def type_into(element):
+            if clear_first:
+                element.clear()
+            element.send_keys(text)
+
+        self._with_element(locator, type_into)
 
     def get_text(self, locator: Tuple[str, str]) -> str:
         """Get the text content of an element."""
-        return self.find_element(locator).text
+        return self._with_element(locator, lambda element: element.text)
 
     def is_element_visible(self, locator: Tuple[str, str], timeout: int = None) -> bool:
-        """Check if an element is visible on the page."""
-        try:
-            wait = WebDriverWait(self.driver, timeout or Config.EXPLICIT_WAIT)
-            wait.until(EC.visibility_of_element_located(locator))
-            return True
-        except TimeoutException:
-            return False
+        """Check if an element is visible on the page, waiting up to timeout for it."""
+        return self.wait.for_element(locator, visible=True, timeout=timeout)
 
     def is_element_present(self, locator: Tuple[str, str]) -> bool:
         """Check if an element is present in the DOM."""
@@ -99,46 +611,203 @@ class BasePage:
 
     def wait_for_element_to_disappear(self, locator: Tuple[str, str], timeout: int = None) -> bool:
         """Wait for an element to disappear from the page."""
-        try:
-            wait = WebDriverWait(self.driver, timeout or Config.EXPLICIT_WAIT)
-            wait.until(EC.invisibility_of_element_located(locator))
-            return True
-        except TimeoutException:
-            return False
+        return self.wait.for_element(locator, visible=False, timeout=timeout)
 
     def select_dropdown_by_text(self, locator: Tuple[str, str], text: str) -> None:
         """Select a dropdown option by visible text."""
         from selenium.webdriver.support.ui import Select
-        element = self.find_element(locator)
-        select = Select(element)
-        select.select_by_visible_text(text)
+        self._with_element(locator, lambda element: Select(element).select_by_visible_text(text))
 
     def select_dropdown_by_value(self, locator: Tuple[str, str], value: str) -> None:
         """Select a dropdown option by value attribute."""
         from selenium.webdriver.support.ui import Select
-        element = self.find_element(locator)
-        select = Select(element)
-        select.select_by_value(value)
+        self._with_element(locator, lambda element: Select(element).select_by_value(value))
 
     def hover(self, locator: Tuple[str, str]) -> None:
         """Hover over an element."""
-        element = self.find_element(locator)
-        ActionChains(self.driver).move_to_element(element).perform()
+        self._with_element(
+            locator, lambda element: ActionChains(self.driver).move_to_element(element).perform()
+        )
 
     def scroll_to_element(self, locator: Tuple[str, str]) -> None:
         """Scroll the element into view."""
-        element = self.find_element(locator)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        self._with_element(
+            locator, lambda element: self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        )
 
     def get_attribute(self, locator: Tuple[str, str], attribute: str) -> str:
         """Get an attribute value from an element."""
-        return self.find_element(locator).get_attribute(attribute)
+        return self._with_element(locator, lambda element: element.get_attribute(attribute))
 
-    def wait_for_page_load(self) -> None:
-        """Wait for the page to fully load."""
+    def read_many(self, locators: Dict[str, Tuple[str, str]],
+                  fields: Sequence[str] = ("text",),
+                  wait: bool = True) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Read properties of several elements in a single script round-trip.
+
+        Args:
+            locators: Mapping of result name to element locator
+            fields: Properties to read: text, value, visible, enabled, selected,
+                tag, or any attribute name
+            wait: Whether to wait until every locator resolves to an element
+
+        Returns:
+            Mapping of result name to a dict of field values, or None for
+            locators that did not match any element
+        """
+        args = ({name: list(locator) for name, locator in locators.items()}, list(fields))
+        self.logger.debug(f"Reading {list(fields)} from {len(locators)} elements")
+
+        def read(driver):
+            if self.wait.static:
+                result = {name: self._read_element(locator, fields) for name, locator in locators.items()}
+            else:
+                result = driver.execute_script(READ_MANY_SCRIPT, *args)
+            if wait and any(values is None for values in result.values()):
+                return False
+            return result
+
+        if wait:
+            return self.wait.until(read)
+        return read(self.driver)
+
+    def _read_element(self, locator: Tuple[str, str],
+                      fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """Read fields of one element through the driver, mirroring READ_MANY_SCRIPT."""
+        elements = self.driver.find_elements(*locator)
+        if not elements:
+            return None
+        element = elements[0]
+        readers = {
+            "text": lambda: element.text.strip() if element.is_displayed() else "",
+            "value": lambda: element.get_property("value"),
+            "visible": element.is_displayed,
+            "enabled": element.is_enabled,
+            "selected": element.is_selected,
+            "tag": lambda: element.tag_name.lower(),
+        }
+        return {field: readers[field]() if field in readers else element.get_dom_attribute(field)
+                for field in fields}
+
+    def document_id(self) -> str:
+        """Identify the current document; the ID changes whenever the page navigates."""
+        if self.wait.static:
+            return str(self.driver.document_id)
+        return self.driver.execute_script(DOCUMENT_ID_SCRIPT)
+
+    def read_table(self, rows_locator: Tuple[str, str]) -> TableSnapshot:
+        """
+        Read the text of every cell of the matching table rows in a single round-trip.
+
+        Waits until at least one row is present.
+
+        Args:
+            rows_locator: Locator matching the table rows
+
+        Returns:
+            TableSnapshot with one list of cell texts per row
+        """
+        self.logger.debug(f"Reading table rows: {rows_locator}")
+
+        def read(driver):
+            if self.wait.static:
+                rows = [[cell.text.strip() for cell in row.find_elements(By.TAG_NAME, "td")]
+                        for row in driver.find_elements(*rows_locator)]
+                snapshot = TableSnapshot(str(driver.document_id), rows)
+            else:
+                result = driver.execute_script(READ_TABLE_SCRIPT, *rows_locator)
+                snapshot = TableSnapshot(result["document"], result["rows"])
+            return snapshot if snapshot.rows else False
+
+        return self.wait.until(read, label=f"table rows {rows_locator}")
+
+    def fill_many(self, values: Dict[Tuple[str, str], str]) -> None:
+        """
+        Set several input and dropdown values in a single script round-trip.
+
+        Dropdowns are selected by option value. Input and change events are
+        dispatched for every field, but no keystrokes are sent; use type_text
+        where the typing itself is under test.
+
+        Args:
+            values: Mapping of element locator to the value to set
+        """
+        entries = [[by, value, text] for (by, value), text in values.items()]
+        self.logger.debug(f"Fast filling {len(entries)} fields")
+        if self.wait.static:
+            self._fill_elements(values)
+            return
+        try:
+            self.wait.until(lambda d: not d.execute_script(FILL_MANY_SCRIPT, entries))
+        except TimeoutException:
+            missing = self.driver.execute_script(FILL_MANY_SCRIPT, entries)
+            raise NoSuchElementException(f"Could not fill fields: {missing}")
+
+    def _fill_elements(self, values: Dict[Tuple[str, str], str]) -> None:
+        """Set field values element by element, for drivers that cannot run scripts."""
+        from selenium.webdriver.support.ui import Select
+        elements = {locator: self.driver.find_elements(*locator) for locator in values}
+        missing = [f"{by}={value}" for (by, value), found in elements.items() if not found]
+        if missing:
+            raise NoSuchElementException(f"Could not fill fields: {missing}")
+        for locator, text in values.items():
+            element = elements[locator][0]
+            if element.tag_name.lower() == "select":
+                Select(element).select_by_value(text)
+            else:
+                element.clear()
+                element.send_keys(text)
+
+    def use_fast_fill(self, fast: bool = None) -> bool:
+        """Resolve a per-call fast fill flag against the run-wide setting."""
+        return Config.FAST_FILL if fast is None else fast
+
+    def submit_form(self, url: str, fields: Dict[str, str], method: str = "post") -> None:
+        """
+        Navigate by submitting form data directly, without filling the page's UI.
+
+        Works from any page, including about:blank, and waits for the
+        response page to load.
+
+        Args:
+            url: Absolute form action URL
+            fields: Form field names and values
+            method: 'post' or 'get'
+        """
+        self.logger.info(f"Submitting {method.upper()} {url} with {sorted(fields)}")
+        self.elements.clear()
+        if self.wait.static:
+            self.driver.submit(url, fields, method)
+            self.wait_for_page_load()
+            return
+        self.driver.execute_script(SUBMIT_FORM_SCRIPT, url, method, fields)
         self.wait.until(
-            lambda d: d.execute_script("return document.readyState") == "complete"
+            lambda d: not d.execute_script("return window.__pomFormSubmitted === true;"),
+            label="form submission"
         )
+        self.wait_for_page_load()
+
+    def wait_for_page_load(self) -> None:
+        """
+        Wait for the page to load and record its transfer size and load time.
+
+        With the eager page load strategy the DOM being interactive is enough.
+        Browserless drivers have loaded the page once navigation returns.
+        """
+        if self.wait.static:
+            load = self.driver.last_load
+            if load is not None:
+                get_page_load_stats().record(load.url, load.transferred, load.load_time)
+            return
+
+        ready_states = ("interactive", "complete") if Config.PAGE_LOAD_STRATEGY == "eager" else ("complete",)
+
+        def loaded(driver):
+            result = driver.execute_script(PAGE_LOAD_SCRIPT)
+            return result if result["state"] in ready_states else False
+
+        result = self.wait.until(loaded, label="page load")
+        get_page_load_stats().record(result["url"], result.get("bytes", 0), result.get("load_time", 0))
 
     def accept_alert(self) -> None:
         """Accept a JavaScript alert."""
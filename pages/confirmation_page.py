@@ -1,3 +1,4 @@
+from typing import Dict
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 
@@ -17,6 +18,16 @@ class ConfirmationPage(BasePage):
     TIMESTAMP = (By.CSS_SELECTOR, "tr:nth-child(7) td:nth-child(2)")
     ALL_DETAILS = (By.CSS_SELECTOR, "table tr")
 
+    DETAIL_FIELDS = {
+        "transaction_id": TRANSACTION_ID,
+        "status": STATUS,
+        "amount": AMOUNT,
+        "card_number": CARD_NUMBER,
+        "expiration": EXPIRATION,
+        "auth_code": AUTH_CODE,
+        "timestamp": TIMESTAMP,
+    }
+
     def __init__(self, driver):
         super().__init__(driver)
 
@@ -48,6 +59,17 @@ class ConfirmationPage(BasePage):
         """Get the authorization code."""
         return self.get_text(self.AUTH_CODE)
 
+    def get_confirmation_details(self) -> Dict[str, str]:
+        """
+        Get every confirmation table value in a single round-trip.
+
+        Returns:
+            Dict with keys: transaction_id, status, amount, card_number,
+            expiration, auth_code, timestamp
+        """
+        details = self.read_many(self.DETAIL_FIELDS, fields=("text",))
+        return {name: values["text"] for name, values in details.items()}
+
     def is_purchase_successful(self) -> bool:
         """Check if the purchase was successful."""
         heading = self.get_confirmation_heading().lower()
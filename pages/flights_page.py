@@ -1,5 +1,46 @@
+from datetime import datetime, time
+from decimal import Decimal
+from typing import List, NamedTuple, Optional
 from selenium.webdriver.common.by import By
-from pages.base_page import BasePage
+from pages.base_page import BasePage, TableSnapshot
+from config.config import Config
+
+
+class FlightRecord(NamedTuple):
+    """A row of the flights table."""
+
+    index: int
+    flight: str
+    airline: str
+    departs: time
+    arrives: time
+    price: Decimal
+    price_text: str
+
+    @classmethod
+    def from_cells(cls, index: int, cells: List[str]) -> "FlightRecord":
+        """
+        Build a record from the cell texts of a row.
+
+        Args:
+            index: Position of the row in the table (0-based)
+            cells: Cell texts; columns follow FlightsPage.COLUMNS
+        """
+        columns = FlightsPage.COLUMNS
+        return cls(
+            index=index,
+            flight=cells[columns["flight"]],
+            airline=cells[columns["airline"]],
+            departs=_parse_time(cells[columns["departs"]]),
+            arrives=_parse_time(cells[columns["arrives"]]),
+            price=Decimal(cells[columns["price"]].replace("$", "").replace(",", "").strip()),
+            price_text=cells[columns["price"]].strip(),
+        )
+
+
+def _parse_time(text: str) -> time:
+    """Parse a table time such as '1:43 AM'."""
+    return datetime.strptime(text.strip(), "%I:%M %p").time()
 
 
 class FlightsPage(BasePage):
@@ -13,8 +54,29 @@ class FlightsPage(BasePage):
     AIRLINE_NAMES = (By.CSS_SELECTOR, "table tbody tr td:nth-child(4)")
     FLIGHT_NUMBERS = (By.CSS_SELECTOR, "table tbody tr td:nth-child(3)")
 
+    # Cell index of each FlightRecord field within a flight row
+    COLUMNS = {"flight": 2, "airline": 3, "departs": 4, "arrives": 5, "price": 6}
+
+    PATH = "/reserve.php"
+
     def __init__(self, driver):
         super().__init__(driver)
+        self._flights: Optional[TableSnapshot] = None
+        self._records: List[FlightRecord] = []
+
+    def goto(self, departure: str, destination: str) -> "FlightsPage":
+        """
+        Open the flights list for a route directly, skipping the home page search.
+
+        Args:
+            departure: Departure city
+            destination: Destination city
+        """
+        self.submit_form(Config.BASE_URL + self.PATH, {
+            "fromPort": departure,
+            "toPort": destination,
+        })
+        return self
 
     def is_on_flights_page(self) -> bool:
         """Check if we're on the flights page."""
@@ -24,10 +86,37 @@ class FlightsPage(BasePage):
         """Get the page heading text."""
         return self.get_text(self.PAGE_HEADING)
 
+    def get_flights(self, refresh: bool = False) -> List[FlightRecord]:
+        """
+        Get every flight in the table from a single extraction.
+
+        The records are cached until the browser navigates to another document.
+
+        Args:
+            refresh: Re-read the table even if the cached records are current
+        """
+        if refresh or self._flights is None or self._flights.document != self.document_id():
+            self._flights = self.read_table(self.FLIGHT_ROWS)
+            self._records = [FlightRecord.from_cells(index, cells)
+                             for index, cells in enumerate(self._flights.rows)]
+            self.logger.debug(f"Read {len(self._records)} flights")
+        return list(self._records)
+
+    def get_cheapest_flight(self) -> FlightRecord:
+        """Get the flight with the lowest price (the first one on ties)."""
+        return min(self.get_flights(), key=lambda flight: flight.price)
+
+    def get_flights_by_airline(self, airline: str) -> List[FlightRecord]:
+        """Get the flights operated by an airline."""
+        return [flight for flight in self.get_flights() if flight.airline == airline]
+
+    def get_flight_by_number(self, number: str) -> Optional[FlightRecord]:
+        """Get the flight with the given flight number, or None if it is not listed."""
+        return next((flight for flight in self.get_flights() if flight.flight == number), None)
+
     def get_number_of_flights(self) -> int:
         """Get the number of available flights."""
-        flights = self.find_elements(self.FLIGHT_ROWS)
-        return len(flights)
+        return len(self.get_flights())
 
     def select_flight(self, index: int = 0) -> None:
         """
@@ -39,23 +128,25 @@ class FlightsPage(BasePage):
         self.logger.info(f"Selecting flight at index {index}")
         buttons = self.find_elements(self.CHOOSE_FLIGHT_BUTTONS)
         if index < len(buttons):
+            self.elements.clear()
             buttons[index].click()
         else:
             raise IndexError(f"Flight index {index} out of range")
 
-    def get_flight_prices(self) -> list:
-        """Get all flight prices."""
-        price_elements = self.find_elements(self.FLIGHT_PRICES)
-        return [el.text for el in price_elements]
+    def select_flight_record(self, flight: FlightRecord) -> None:
+        """Select a flight returned by get_flights or one of the lookup helpers."""
+        self.select_flight(flight.index)
+
+    def get_flight_prices(self) -> List[str]:
+        """Get all flight prices as displayed, e.g. '$472.56'."""
+        return [flight.price_text for flight in self.get_flights()]
 
     def get_cheapest_flight_index(self) -> int:
         """Get the index of the cheapest flight."""
-        prices = self.get_flight_prices()
-        price_values = [float(p.replace('$', '')) for p in prices]
-        return price_values.index(min(price_values))
+        return self.get_cheapest_flight().index
 
     def select_cheapest_flight(self) -> None:
         """Select the cheapest available flight."""
-        cheapest_index = self.get_cheapest_flight_index()
-        self.select_flight(cheapest_index)
-        self.logger.info(f"Selected cheapest flight at index {cheapest_index}")
+        cheapest = self.get_cheapest_flight()
+        self.select_flight_record(cheapest)
+        self.logger.info(f"Selected cheapest flight {cheapest.flight} at index {cheapest.index}")
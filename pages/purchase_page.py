@@ -1,5 +1,7 @@
+from typing import Dict
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from config.config import Config
 
 
 class PurchasePage(BasePage):
@@ -22,9 +24,40 @@ class PurchasePage(BasePage):
     FLIGHT_INFO = (By.CSS_SELECTOR, "p:nth-of-type(2)")
     PRICE_INFO = (By.CSS_SELECTOR, "p:nth-of-type(3)")
 
+    PATH = "/purchase.php"
+
+    FORM_FIELDS = {
+        "name": NAME_INPUT,
+        "address": ADDRESS_INPUT,
+        "city": CITY_INPUT,
+        "state": STATE_INPUT,
+        "zip_code": ZIP_INPUT,
+        "card_type": CARD_TYPE_SELECT,
+        "card_number": CREDIT_CARD_INPUT,
+        "month": CREDIT_CARD_MONTH_INPUT,
+        "year": CREDIT_CARD_YEAR_INPUT,
+        "name_on_card": NAME_ON_CARD_INPUT,
+    }
+
     def __init__(self, driver):
         super().__init__(driver)
 
+    def goto(self, flight: dict) -> "PurchasePage":
+        """
+        Open the purchase form for a flight directly, skipping search and flight selection.
+
+        Args:
+            flight: Dict with keys: flight, price, airline, from_port, to_port
+        """
+        self.submit_form(Config.BASE_URL + self.PATH, {
+            "flight": flight['flight'],
+            "price": flight['price'],
+            "airline": flight['airline'],
+            "fromPort": flight['from_port'],
+            "toPort": flight['to_port'],
+        })
+        return self
+
     def is_on_purchase_page(self) -> bool:
         """Check if we're on the purchase page."""
         return "purchase" in self.get_current_url().lower()
@@ -34,7 +67,7 @@ class PurchasePage(BasePage):
         return self.get_text(self.PAGE_HEADING)
 
     def fill_passenger_details(self, name: str, address: str, city: str,
-                               state: str, zip_code: str) -> None:
+                               state: str, zip_code: str, fast: bool = None) -> None:
         """
         Fill in passenger details.
 
@@ -44,8 +77,13 @@ class PurchasePage(BasePage):
             city: City
             state: State
             zip_code: ZIP code
+            fast: Set all fields in one script call instead of typing them
+                (defaults to Config.FAST_FILL)
         """
         self.logger.info(f"Filling passenger details for {name}")
+        if self.use_fast_fill(fast):
+            self.fill_many(self._passenger_values(name, address, city, state, zip_code))
+            return
         self.type_text(self.NAME_INPUT, name)
         self.type_text(self.ADDRESS_INPUT, address)
         self.type_text(self.CITY_INPUT, city)
@@ -53,7 +91,8 @@ class PurchasePage(BasePage):
         self.type_text(self.ZIP_INPUT, zip_code)
 
     def fill_payment_details(self, card_type: str, card_number: str,
-                            month: str, year: str, name_on_card: str) -> None:
+                            month: str, year: str, name_on_card: str,
+                            fast: bool = None) -> None:
         """
         Fill in payment details.
 
@@ -63,43 +102,106 @@ class PurchasePage(BasePage):
             month: Expiry month
             year: Expiry year
             name_on_card: Name on card
+            fast: Set all fields in one script call instead of typing them
+                (defaults to Config.FAST_FILL)
         """
         self.logger.info("Filling payment details")
+        if self.use_fast_fill(fast):
+            self.fill_many(self._payment_values(card_type, card_number, month, year, name_on_card))
+            return
         self.select_dropdown_by_value(self.CARD_TYPE_SELECT, card_type)
         self.type_text(self.CREDIT_CARD_INPUT, card_number)
         self.type_text(self.CREDIT_CARD_MONTH_INPUT, month)
         self.type_text(self.CREDIT_CARD_YEAR_INPUT, year)
         self.type_text(self.NAME_ON_CARD_INPUT, name_on_card)
 
-    def complete_purchase(self, passenger_data: dict, payment_data: dict) -> None:
+    def complete_purchase(self, passenger_data: dict, payment_data: dict,
+                          fast: bool = None) -> None:
         """
         Complete the entire purchase form.
 
         Args:
             passenger_data: Dict with keys: name, address, city, state, zip_code
             payment_data: Dict with keys: card_type, card_number, month, year, name_on_card
+            fast: Fill the whole form in one script call instead of typing it
+                (defaults to Config.FAST_FILL)
         """
+        if self.use_fast_fill(fast):
+            self.logger.info(f"Fast filling purchase form for {passenger_data['name']}")
+            values = self._passenger_values(
+                passenger_data['name'],
+                passenger_data['address'],
+                passenger_data['city'],
+                passenger_data['state'],
+                passenger_data['zip_code']
+            )
+            values.update(self._payment_values(
+                payment_data['card_type'],
+                payment_data['card_number'],
+                payment_data['month'],
+                payment_data['year'],
+                payment_data['name_on_card']
+            ))
+            self.fill_many(values)
+            self.click_purchase()
+            return
+
         self.fill_passenger_details(
             passenger_data['name'],
             passenger_data['address'],
             passenger_data['city'],
             passenger_data['state'],
-            passenger_data['zip_code']
+            passenger_data['zip_code'],
+            fast=False
         )
         self.fill_payment_details(
             payment_data['card_type'],
             payment_data['card_number'],
             payment_data['month'],
             payment_data['year'],
-            payment_data['name_on_card']
+            payment_data['name_on_card'],
+            fast=False
         )
         self.click_purchase()
 
+    def _passenger_values(self, name: str, address: str, city: str,
+                          state: str, zip_code: str) -> dict:
+        """Map passenger details to their form field locators."""
+        return {
+            self.NAME_INPUT: name,
+            self.ADDRESS_INPUT: address,
+            self.CITY_INPUT: city,
+            self.STATE_INPUT: state,
+            self.ZIP_INPUT: zip_code,
+        }
+
+    def _payment_values(self, card_type: str, card_number: str, month: str,
+                        year: str, name_on_card: str) -> dict:
+        """Map payment details to their form field locators."""
+        return {
+            self.CARD_TYPE_SELECT: card_type,
+            self.CREDIT_CARD_INPUT: card_number,
+            self.CREDIT_CARD_MONTH_INPUT: month,
+            self.CREDIT_CARD_YEAR_INPUT: year,
+            self.NAME_ON_CARD_INPUT: name_on_card,
+        }
+
     def click_purchase(self) -> None:
         """Click the Purchase Flight button."""
         self.logger.info("Clicking Purchase Flight button")
         self.click(self.PURCHASE_BUTTON)
 
+    def get_form_values(self) -> Dict[str, str]:
+        """Get the current value of every purchase form field in a single round-trip."""
+        fields = self.read_many(self.FORM_FIELDS, fields=("value",))
+        return {name: values["value"] for name, values in fields.items()}
+
+    def get_form_visibility(self) -> Dict[str, bool]:
+        """Get the visibility of every form field and the purchase button in a single round-trip."""
+        locators = dict(self.FORM_FIELDS, purchase_button=self.PURCHASE_BUTTON)
+        fields = self.read_many(locators, fields=("visible",))
+        return {name: values["visible"] for name, values in fields.items()}
+
     def get_total_price(self) -> str:
         """Get the total price displayed."""
         price_text = self.get_text(self.PRICE_INFO)
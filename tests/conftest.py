@@ -1,18 +1,70 @@
 import pytest
 import os
+import random
+from collections import defaultdict
+from urllib.parse import urlsplit
 from datetime import datetime
-from typing import Generator
+from typing import Dict, Generator, List
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from utilities.async_webdriver import AsyncSessionRunner
+from utilities.browser_contexts import SharedBrowser
 from utilities.driver_factory import DriverFactory
-from utilities.helpers import take_screenshot
+from utilities.driver_pool import DriverPool
+from utilities.driver_startup import format_startup_summary, get_startup_stats, merge_startup_summaries
+from utilities.flake_triage import FlakeStore, format_retry_summary, get_flake_triage, merge_retry_summaries
+from utilities.http_backend import HttpDriver
+from utilities.http_cache import CachingProxyServer, ResponseStore
+from utilities.local_server import LocalBlazeDemoServer
+from utilities.helpers import DataRecordRef, iter_data_refs
+from utilities.logger import set_log_level, stop_logging
+from utilities.browser_profiles import PROFILES
+from utilities.resource_governor import format_memory_summary, get_resource_governor, merge_memory_summaries
+from utilities.data_pool import SyntheticDataPool, get_data_pool
+from utilities.artifacts import get_artifact_pipeline
+from utilities.instrumentation import (
+    get_recorder, load_partial_summaries, merge_summaries, save_partial_summary,
+    write_timing_report
+)
+from utilities.resource_blocking import (
+    apply_chrome_blocking, compare_to_baseline, get_page_load_stats,
+    merge_page_load_summaries, parse_categories
+)
+from utilities.scheduling import DurationScheduling, DurationStore
+from utilities.test_selection import (
+    AffectedTests, DependencyMap, GitError, get_dependency_tracker, git
+)
 from config.config import Config
 from pages import HomePage, FlightsPage, PurchasePage, ConfirmationPage
+from pages.base_page import (
+    format_element_cache_summary, get_element_cache_stats, merge_element_cache_summaries
+)
 
 
 # Ensure directories exist
 Config.ensure_directories()
 
+# Worker timing summaries waiting to be merged by the controller
+TIMING_PARTIALS_DIR = os.path.join(Config.REPORTS_DIR, ".timing")
+PAGE_LOAD_PARTIALS_DIR = os.path.join(Config.REPORTS_DIR, ".page_loads")
+STARTUP_PARTIALS_DIR = os.path.join(Config.REPORTS_DIR, ".startup")
+ELEMENT_CACHE_PARTIALS_DIR = os.path.join(Config.REPORTS_DIR, ".element_cache")
+MEMORY_PARTIALS_DIR = os.path.join(Config.REPORTS_DIR, ".memory")
+DEPENDENCY_PARTIALS_DIR = os.path.join(Config.REPORTS_DIR, ".dependencies")
+RETRY_PARTIALS_DIR = os.path.join(Config.REPORTS_DIR, ".retries")
+PAGE_LOAD_BASELINE = os.path.join(Config.REPORTS_DIR, "page_load_baseline.json")
+
+# Lines printed in the performance section of the terminal summary
+_summary_lines: List[str] = []
+
+# Wall time of each test (setup, call and teardown) and busy time of each worker
+_test_durations: Dict[str, float] = defaultdict(float)
+_worker_busy: Dict[str, float] = defaultdict(float)
+_scheduler: List[DurationScheduling] = []
+
+# Test selection of an --affected-since run
+_affected: List[AffectedTests] = []
+
 
 def pytest_addoption(parser):
     """Add custom command line options."""
@@ -22,12 +74,192 @@ def pytest_addoption(parser):
         default="chrome",
         help="Browser to run tests on: chrome or firefox"
     )
+    parser.addoption(
+        "--backend",
+        action="store",
+        default=Config.BACKEND,
+        choices=["browser", "http"],
+        help="Drive pages through a browser, or load and parse them over plain HTTP"
+    )
+    parser.addoption(
+        "--async-sessions",
+        action="store",
+        type=int,
+        default=Config.ASYNC_SESSIONS,
+        help="Number of concurrent browser sessions run by async flow tests"
+    )
+    parser.addoption(
+        "--async-concurrency",
+        action="store",
+        type=int,
+        default=Config.ASYNC_CONCURRENCY,
+        help="Maximum number of async browser sessions open at once"
+    )
+    parser.addoption(
+        "--scheduler",
+        action="store",
+        default=Config.SCHEDULER,
+        choices=["lpt", "xdist"],
+        help="Distribute -n runs by historical test durations (lpt) or with xdist's --dist mode"
+    )
     parser.addoption(
         "--headless",
         action="store_true",
         default=False,
         help="Run tests in headless mode"
     )
+    parser.addoption(
+        "--target",
+        action="store",
+        default=Config.TARGET,
+        choices=["live", "local"],
+        help="Site to test: live BlazeDemo or the bundled local stand-in server"
+    )
+    parser.addoption(
+        "--http-cache",
+        action="store",
+        default=Config.HTTP_CACHE,
+        choices=["off", "record", "replay"],
+        help="Record site responses through a caching proxy, or replay them without network access"
+    )
+    parser.addoption(
+        "--http-cache-max-mb",
+        action="store",
+        type=int,
+        default=Config.HTTP_CACHE_MAX_MB,
+        help="Size limit of the HTTP cache store; least recently used responses are evicted"
+    )
+    parser.addoption(
+        "--driver-pool-size",
+        action="store",
+        type=int,
+        default=Config.DRIVER_POOL_SIZE,
+        help="Number of warm browsers per worker (0 launches a new browser per test)"
+    )
+    parser.addoption(
+        "--driver-max-reuse",
+        action="store",
+        type=int,
+        default=Config.DRIVER_POOL_MAX_REUSE,
+        help="Number of tests a pooled browser serves before it is replaced"
+    )
+    parser.addoption(
+        "--browser-contexts",
+        action="store_true",
+        default=Config.BROWSER_CONTEXTS,
+        help="Run each test in an isolated browser context of one shared Chrome per worker"
+    )
+    parser.addoption(
+        "--browser-profile",
+        action="store",
+        default=Config.BROWSER_PROFILE,
+        choices=sorted(PROFILES),
+        help="Browser performance profile: window size, cache and renderer limits, tmpfs profile"
+    )
+    parser.addoption(
+        "--memory-budget-mb",
+        action="store",
+        type=int,
+        default=Config.MEMORY_BUDGET_MB,
+        help="Recycle a pooled browser whose process tree uses more memory (0 disables)"
+    )
+    parser.addoption(
+        "--worker-memory-budget-mb",
+        action="store",
+        type=int,
+        default=Config.WORKER_MEMORY_BUDGET_MB,
+        help="Close released browsers while a worker's browsers use more memory (0 disables)"
+    )
+    parser.addoption(
+        "--retries",
+        action="store",
+        type=int,
+        default=Config.RETRIES,
+        help="Retry timeout, stale element and WebDriver failures in the same worker (0 disables)"
+    )
+    parser.addoption(
+        "--retry-budget",
+        action="store",
+        type=int,
+        default=Config.RETRY_BUDGET,
+        help="Retries a worker may spend before failures are reported without retrying"
+    )
+    parser.addoption(
+        "--quarantine-rate",
+        action="store",
+        type=float,
+        default=Config.QUARANTINE_RATE,
+        help="Report retryable failures of tests flaky in this share of recent runs as xfail (0 disables)"
+    )
+    parser.addoption(
+        "--affected-since",
+        action="store",
+        default=None,
+        metavar="GIT_REF",
+        help="Only run tests whose recorded page-object dependencies changed since a git ref"
+    )
+    parser.addoption(
+        "--fast-fill",
+        action="store_true",
+        default=False,
+        help="Fill forms with a single script call instead of typing keystrokes"
+    )
+    parser.addoption(
+        "--no-command-timing",
+        action="store_true",
+        default=False,
+        help="Disable WebDriver command timing and the timing report"
+    )
+    parser.addoption(
+        "--timing-top",
+        action="store",
+        type=int,
+        default=Config.TIMING_TOP,
+        help="Number of slowest commands listed in the timing report"
+    )
+    parser.addoption(
+        "--block-resources",
+        action="store",
+        default=Config.BLOCK_RESOURCES,
+        help="Comma separated resource categories to block: "
+             "images, fonts, css, media, analytics, cdn"
+    )
+    parser.addoption(
+        "--page-load-strategy",
+        action="store",
+        default=Config.PAGE_LOAD_STRATEGY,
+        choices=["normal", "eager", "none"],
+        help="WebDriver page load strategy"
+    )
+    parser.addoption(
+        "--framework-log-level",
+        action="store",
+        default=Config.LOG_LEVEL,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        type=str.upper,
+        help="Level of the framework loggers; lower records are dropped before formatting"
+    )
+    parser.addoption(
+        "--data-seed",
+        action="store",
+        type=int,
+        default=Config.DATA_SEED,
+        help="Seed of the synthetic test data pool (random when unset, shown in the report header)"
+    )
+    parser.addoption(
+        "--artifact-format",
+        action="store",
+        default=Config.ARTIFACT_FORMAT,
+        choices=["png", "webp", "jpeg"],
+        help="Image format of failure screenshots (webp and jpeg need Pillow)"
+    )
+    parser.addoption(
+        "--artifact-scale",
+        action="store",
+        type=float,
+        default=Config.ARTIFACT_SCALE,
+        help="Scale factor of failure screenshots, e.g. 0.5 for half resolution"
+    )
 
 
 @pytest.fixture(scope="session")
@@ -42,19 +274,198 @@ def headless(request) -> bool:
     return request.config.getoption("--headless")
 
 
-@pytest.fixture(scope="function")
-def driver(browser: str, headless: bool) -> Generator[WebDriver, None, None]:
+@pytest.fixture(scope="session", autouse=True)
+def target_site(request) -> Generator[str, None, None]:
     """
-    Create and yield a WebDriver instance for each test.
+    Yield the base URL of the site under test.
 
-    The driver is automatically quit after the test completes.
+    With --target=local the bundled stand-in server is started for the
+    session and Config.BASE_URL points at it.
     """
-    driver = DriverFactory.get_driver(browser=browser, headless=headless)
+    if request.config.getoption("--target") != "local":
+        yield Config.BASE_URL
+        return
+
+    server = LocalBlazeDemoServer(port=Config.LOCAL_SERVER_PORT).start()
+    live_url = Config.BASE_URL
+    Config.BASE_URL = f"http://{Config.LOCAL_HOSTNAME}:{server.port}"
+
+    yield Config.BASE_URL
+
+    Config.BASE_URL = live_url
+    server.stop()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def http_cache(request, target_site: str) -> Generator[CachingProxyServer, None, None]:
+    """
+    Route browser traffic through the record/replay caching proxy.
+
+    The browser is pointed at the plain HTTP version of the site, which the
+    proxy fetches over HTTPS when recording. Yields None when the cache is off.
+    """
+    mode = request.config.getoption("--http-cache")
+    if mode == "off":
+        yield None
+        return
+    if request.config.getoption("--target") == "local":
+        raise pytest.UsageError("--http-cache cannot be combined with --target=local")
+
+    store = ResponseStore(Config.HTTP_CACHE_DIR,
+                          request.config.getoption("--http-cache-max-mb") * 1024 * 1024)
+    site_url = Config.BASE_URL
+    proxy = CachingProxyServer(store, mode=mode, https_hosts=[urlsplit(site_url).hostname]).start()
+    Config.PROXY = f"{proxy.host}:{proxy.port}"
+    Config.BASE_URL = "http://" + site_url.split("://", 1)[1]
+
+    yield proxy
+
+    Config.BASE_URL = site_url
+    Config.PROXY = ""
+    proxy.stop()
+    _summary_lines.append(
+        f"HTTP cache ({mode}): {proxy.hits} hits, {proxy.misses} misses, "
+        f"{proxy.upstream_requests} upstream requests, {store.total_bytes() / 1024:.1f} KB stored"
+    )
+
+
+def _launch_driver(browser: str, headless: bool, block_resources: List[str] = None) -> WebDriver:
+    """Launch a new WebDriver instance with the standard window setup."""
+    driver = DriverFactory.get_driver(browser=browser, headless=headless,
+                                      block_resources=block_resources)
     driver.maximize_window()
+    return driver
+
+
+@pytest.fixture(scope="session")
+def shared_browser(request, browser: str, headless: bool, target_site: str,
+                   http_cache: CachingProxyServer) -> Generator[SharedBrowser, None, None]:
+    """
+    Launch the one Chrome of this worker whose browser contexts isolate the tests.
+
+    Yields None unless --browser-contexts is given with the browser backend.
+    """
+    if not request.config.getoption("--browser-contexts") or Config.BACKEND == "http":
+        yield None
+        return
+    if browser.lower() != "chrome":
+        raise pytest.UsageError("--browser-contexts needs --browser=chrome")
+
+    shared = DriverFactory.get_shared_browser(browser, headless)
+
+    yield shared
+
+    shared.close()
+    _summary_lines.append(shared.summary())
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, browser: str, headless: bool, target_site: str,
+                http_cache: CachingProxyServer,
+                shared_browser: SharedBrowser) -> Generator[DriverPool, None, None]:
+    """
+    Create a pool of warm browsers shared by the tests of this worker.
+
+    Yields None when pooling is disabled with --driver-pool-size=0,
+    tests run in browser contexts or pages are loaded with the HTTP backend.
+    """
+    size = request.config.getoption("--driver-pool-size")
+    if size <= 0 or shared_browser is not None or Config.BACKEND == "http":
+        yield None
+        return
+
+    pool = DriverPool(
+        lambda: _launch_driver(browser, headless),
+        size=size,
+        max_reuse=request.config.getoption("--driver-max-reuse")
+    ).start()
+
+    yield pool
+
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def driver(request, browser: str, headless: bool, driver_pool: DriverPool,
+           shared_browser: SharedBrowser) -> Generator[WebDriver, None, None]:
+    """
+    Yield a WebDriver instance for each test.
+
+    The driver is leased from the session pool and reset when the test
+    completes, or replaced when the test failed with a WebDriver error so a
+    retry gets a fresh browser. It is launched and quit per test when
+    pooling is disabled.
+    With --browser-contexts it drives a new browser context of the shared
+    browser, which is disposed of when the test completes.
+    Tests marked with block_resources get their own blocking profile.
+    With --backend=http a browserless HttpDriver is used instead.
+    """
+    if Config.BACKEND == "http":
+        get_page_load_stats().profile = "http"
+        driver = HttpDriver()
+
+        yield driver
+
+        driver.quit()
+        return
+
+    run_blocking = parse_categories(Config.BLOCK_RESOURCES)
+    marker = request.node.get_closest_marker("block_resources")
+    blocking = parse_categories(marker.args) if marker else run_blocking
+    get_page_load_stats().profile = ",".join(blocking) or "none"
+
+    if shared_browser is not None:
+        driver = shared_browser.new_context()
+        driver.maximize_window()
+        if blocking:
+            apply_chrome_blocking(driver, blocking)
+
+        yield driver
+
+        driver.quit()
+        return
+
+    # Firefox blocking is fixed at launch, so a differing profile needs its own browser
+    if driver_pool is None or (blocking != run_blocking and browser.lower() == "firefox"):
+        driver = _launch_driver(browser, headless, blocking)
+
+        yield driver
+
+        driver.quit()
+        return
+
+    driver = driver_pool.lease()
+    if blocking != run_blocking:
+        apply_chrome_blocking(driver, blocking)
 
     yield driver
 
-    driver.quit()
+    if get_flake_triage().failure_category(request.node.nodeid) == "webdriver":
+        driver_pool.discard(driver)
+        return
+    if blocking != run_blocking:
+        apply_chrome_blocking(driver, run_blocking)
+    driver_pool.release(driver)
+
+
+@pytest.fixture(scope="function")
+def async_session_runner(browser: str, headless: bool,
+                         target_site: str, http_cache: CachingProxyServer) -> Generator[AsyncSessionRunner, None, None]:
+    """
+    Yield a runner that executes an async flow in concurrent browser sessions.
+
+    Sessions share one event loop and one HTTP session to the driver service;
+    --async-sessions and --async-concurrency set how many run and how many
+    may be open at once.
+    """
+    if Config.BACKEND == "http":
+        pytest.skip("Async sessions drive real browsers")
+    runner = AsyncSessionRunner(browser, headless)
+
+    yield runner
+
+    if runner.results:
+        _summary_lines.append(runner.summary())
 
 
 @pytest.fixture(scope="function")
@@ -83,29 +494,347 @@ def confirmation_page(driver: WebDriver) -> ConfirmationPage:
     return ConfirmationPage(driver)
 
 
+@pytest.fixture(scope="session")
+def synthetic_data() -> SyntheticDataPool:
+    """Seeded pool of synthetic users, passengers and payments, unique per xdist worker."""
+    return get_data_pool()
+
+
+@pytest.fixture(scope="function")
+def data_record(request) -> dict:
+    """Load the dataset record a test marked with @pytest.mark.dataset is parametrized with."""
+    ref: DataRecordRef = request.param
+    return ref.load()
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize data_record from the dataset named by the test's dataset marker.
+
+    Only record offsets are collected; each record is read and validated
+    when its test runs, so large JSONL/CSV datasets are never held in memory.
+    """
+    marker = metafunc.definition.get_closest_marker("dataset")
+    if marker is None or "data_record" not in metafunc.fixturenames:
+        return
+    refs = iter_data_refs(*marker.args, **marker.kwargs)
+    metafunc.parametrize("data_record", refs, indirect=True, ids=lambda ref: ref.id)
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    Hook to capture test result and take screenshot on failure.
+    Hook to capture test result and queue failure artifacts.
+
+    The screenshot, page source, URL and console logs are read from the
+    browser here and written by the artifact pipeline in the background.
+    The peak browser memory of the test is attached to its teardown report.
+    Setup and call failures are classified for the flake triage.
     """
+    if call.when == "teardown":
+        peak = get_resource_governor().finish_test(item.nodeid)
+        if peak is not None:
+            item.user_properties.append(("browser_peak_memory_mb", round(peak, 1)))
     outcome = yield
     rep = outcome.get_result()
 
+    if rep.failed:
+        get_dependency_tracker().record_failure(item.nodeid)
+        if rep.when != "teardown":
+            get_flake_triage().record_failure(item.nodeid, call.excinfo.value if call.excinfo else None)
+
     if rep.when == "call" and rep.failed:
         driver = item.funcargs.get("driver")
         if driver:
             test_name = item.name
-            screenshot_path = take_screenshot(driver, f"FAILED_{test_name}")
-            print(f"\nScreenshot saved: {screenshot_path}")
+            artifact_path = get_artifact_pipeline().capture(driver, f"FAILED_{test_name}")
+            print(f"\nFailure artifacts queued: {artifact_path}.*")
 
 
 def pytest_configure(config):
     """Configure pytest with custom markers."""
+    if config.getoption("--fast-fill"):
+        Config.FAST_FILL = True
+    if config.getoption("--no-command-timing"):
+        Config.COMMAND_TIMING = False
+    Config.TIMING_TOP = config.getoption("--timing-top")
+    try:
+        Config.BLOCK_RESOURCES = ",".join(parse_categories(config.getoption("--block-resources")))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    Config.PAGE_LOAD_STRATEGY = config.getoption("--page-load-strategy")
+    Config.BACKEND = config.getoption("--backend")
+    Config.ASYNC_SESSIONS = config.getoption("--async-sessions")
+    Config.ASYNC_CONCURRENCY = config.getoption("--async-concurrency")
+    Config.ARTIFACT_FORMAT = config.getoption("--artifact-format")
+    Config.BROWSER_PROFILE = config.getoption("--browser-profile")
+    Config.MEMORY_BUDGET_MB = config.getoption("--memory-budget-mb")
+    Config.WORKER_MEMORY_BUDGET_MB = config.getoption("--worker-memory-budget-mb")
+    Config.RETRIES = config.getoption("--retries")
+    Config.RETRY_BUDGET = config.getoption("--retry-budget")
+    Config.QUARANTINE_RATE = config.getoption("--quarantine-rate")
+    set_log_level(config.getoption("--framework-log-level"))
+    if hasattr(config, "workerinput"):
+        Config.DATA_SEED = config.workerinput["data_seed"]
+    else:
+        seed = config.getoption("--data-seed")
+        Config.DATA_SEED = seed if seed is not None else random.randrange(1 << 32)
+    Config.ARTIFACT_SCALE = config.getoption("--artifact-scale")
+    if not hasattr(config, "workerinput"):
+        load_partial_summaries(TIMING_PARTIALS_DIR)
+        load_partial_summaries(PAGE_LOAD_PARTIALS_DIR)
+        load_partial_summaries(STARTUP_PARTIALS_DIR)
+        load_partial_summaries(ELEMENT_CACHE_PARTIALS_DIR)
+        load_partial_summaries(MEMORY_PARTIALS_DIR)
+        load_partial_summaries(DEPENDENCY_PARTIALS_DIR)
+        load_partial_summaries(RETRY_PARTIALS_DIR)
+
+    get_dependency_tracker().install()
+    ref = config.getoption("--affected-since")
+    if hasattr(config, "workerinput"):
+        if config.workerinput.get("affected_tests"):
+            _affected.append(AffectedTests.from_dict(config.workerinput["affected_tests"]))
+    elif ref:
+        try:
+            _affected.append(AffectedTests.since(ref))
+        except GitError as e:
+            raise pytest.UsageError(f"--affected-since: {ref} is not a commit ({e.args[0].strip()})")
+        _summary_lines.append(_affected[0].describe())
+
     config.addinivalue_line("markers", "smoke: mark test as smoke test")
     config.addinivalue_line("markers", "regression: mark test as regression test")
     config.addinivalue_line("markers", "flights: mark test as flight selection related")
     config.addinivalue_line("markers", "purchase: mark test as purchase related")
     config.addinivalue_line("markers", "booking: mark test as booking flow related")
+    config.addinivalue_line(
+        "markers", "block_resources(*categories): block resource categories for this test"
+    )
+    config.addinivalue_line(
+        "markers", "dataset(filename, schema=None, limit=None): "
+                   "run the test once per record of a JSONL/CSV file, as data_record"
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Share the run's synthetic data seed and test selection with every xdist worker."""
+    node.workerinput["data_seed"] = Config.DATA_SEED
+    if _affected:
+        node.workerinput["affected_tests"] = _affected[0].to_dict()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect the tests an --affected-since change does not affect."""
+    if not _affected or _affected[0].full_run:
+        return
+    selected = [item for item in items if _affected[0].is_affected(item.nodeid)]
+    deselected = [item for item in items if not _affected[0].is_affected(item.nodeid)]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def pytest_report_teststatus(report, config):
+    """Show failed attempts that were retried as R (RERUN)."""
+    if report.outcome == "rerun":
+        return "rerun", "R", ("RERUN", {"yellow": True})
+
+
+def pytest_report_header(config):
+    """Show the synthetic data seed so a run's generated data can be reproduced."""
+    return f"synthetic data seed: {Config.DATA_SEED} (reproduce with --data-seed={Config.DATA_SEED})"
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Schedule load-balanced xdist runs longest-processing-time first by historical durations."""
+    if config.getoption("--scheduler") != "lpt" or config.getoption("dist") not in ("load", "loadscope"):
+        return None
+    scheduler = DurationScheduling(config, DurationStore(Config.DURATIONS_FILE), log)
+    _scheduler.append(scheduler)
+    return scheduler
+
+
+def pytest_runtest_logreport(report):
+    """Accumulate test and worker durations; reports of xdist workers arrive with their node."""
+    node = getattr(report, "node", None)
+    worker = node.gateway.id if node is not None else "main"
+    if report.outcome != "rerun":
+        _test_durations[report.nodeid] += report.duration
+    _worker_busy[worker] += report.duration
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    Run a test with retries of flaky failures.
+
+    WebDriver command timings, browser memory and page-object calls of
+    every attempt are attributed to the test.
+    """
+    recorder = get_recorder()
+    governor = get_resource_governor()
+    tracker = get_dependency_tracker()
+    recorder.start_test(item.nodeid)
+    governor.start_test(item.nodeid)
+    tracker.start_test(item.nodeid)
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    get_flake_triage().run(item, nextitem)
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    recorder.finish_test(item.nodeid)
+    tracker.finish_test(item.nodeid)
+    return True
+
+
+def pytest_sessionfinish(session):
+    """Flush failure artifacts and write the command timing report, page load, startup, element cache, memory and retry statistics, and update the dependency map and flakiness database."""
+    config = session.config
+    worker_id = config.workerinput["workerid"] if hasattr(config, "workerinput") else None
+
+    if (not worker_id and _affected and not _affected[0].full_run
+            and session.exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED):
+        # The change affects no test; that is a successful run, not an empty one
+        session.exitstatus = pytest.ExitCode.OK
+        _summary_lines.append(f"Affected tests since {_affected[0].ref}: none, every test deselected "
+                              f"(exit status 0 instead of {int(pytest.ExitCode.NO_TESTS_COLLECTED)})")
+
+    artifacts = get_artifact_pipeline()
+    artifacts.close()
+    if artifacts.results and not worker_id:
+        _summary_lines.append(artifacts.summary())
+
+    startup = get_startup_stats().summarize()
+    if worker_id:
+        save_partial_summary(startup, STARTUP_PARTIALS_DIR, worker_id)
+    else:
+        startup = merge_startup_summaries([startup] + load_partial_summaries(STARTUP_PARTIALS_DIR))
+        _summary_lines.extend(format_startup_summary(startup))
+
+    element_cache = get_element_cache_stats().summarize()
+    if worker_id:
+        save_partial_summary(element_cache, ELEMENT_CACHE_PARTIALS_DIR, worker_id)
+    else:
+        element_cache = merge_element_cache_summaries(
+            [element_cache] + load_partial_summaries(ELEMENT_CACHE_PARTIALS_DIR)
+        )
+        line = format_element_cache_summary(element_cache)
+        if line:
+            _summary_lines.append(line)
+
+    governor = get_resource_governor()
+    governor.stop()
+    memory = governor.summarize()
+    if worker_id:
+        save_partial_summary(memory, MEMORY_PARTIALS_DIR, worker_id)
+    else:
+        memory = merge_memory_summaries([memory] + load_partial_summaries(MEMORY_PARTIALS_DIR))
+        _summary_lines.extend(format_memory_summary(memory))
+
+    dependencies = get_dependency_tracker().summarize()
+    if worker_id:
+        save_partial_summary(dependencies, DEPENDENCY_PARTIALS_DIR, worker_id)
+    else:
+        for partial in load_partial_summaries(DEPENDENCY_PARTIALS_DIR):
+            dependencies.update(partial)
+        _save_dependency_map(dependencies)
+
+    retries = get_flake_triage().summarize()
+    if worker_id:
+        save_partial_summary(retries, RETRY_PARTIALS_DIR, worker_id)
+    else:
+        retries = merge_retry_summaries([retries] + load_partial_summaries(RETRY_PARTIALS_DIR))
+        _summary_lines.extend(format_retry_summary(retries, sum(_test_durations.values()),
+                                                   session.testsfailed))
+        _save_flake_outcomes(retries["results"])
+
+    page_loads = get_page_load_stats().summarize()
+    if worker_id:
+        save_partial_summary(page_loads, PAGE_LOAD_PARTIALS_DIR, worker_id)
+    else:
+        page_loads = merge_page_load_summaries(
+            [page_loads] + load_partial_summaries(PAGE_LOAD_PARTIALS_DIR)
+        )
+        if page_loads:
+            _summary_lines.extend(compare_to_baseline(page_loads, PAGE_LOAD_BASELINE))
+        _save_durations()
+
+    if not Config.COMMAND_TIMING:
+        return
+
+    top = config.getoption("--timing-top")
+    summary = get_recorder().summarize(top)
+    if worker_id:
+        save_partial_summary(summary, TIMING_PARTIALS_DIR, worker_id)
+        return
+
+    summaries = [summary] + load_partial_summaries(TIMING_PARTIALS_DIR)
+    report = merge_summaries(summaries, top)
+    if not report["tests"]:
+        return
+
+    html_path = getattr(config.option, "htmlpath", None)
+    report_dir = os.path.dirname(os.path.abspath(html_path)) if html_path else Config.REPORTS_DIR
+    path = write_timing_report(report, report_dir)
+    _summary_lines.append(
+        f"Command timing report: {path} "
+        f"({100 * report['summary']['wait_share']:.1f}% of test time spent waiting)"
+    )
+
+
+def _save_dependency_map(dependencies: dict) -> None:
+    """Merge the page-object calls recorded in this run into the dependency map."""
+    if not dependencies:
+        return
+    try:
+        commit = git("rev-parse", "HEAD").strip()
+    except GitError:
+        return
+    dependency_map = DependencyMap()
+    dependency_map.update(dependencies, commit)
+    dependency_map.save()
+
+
+def _save_flake_outcomes(results: dict) -> None:
+    """Append this run's test outcomes to the flakiness database."""
+    if not results:
+        return
+    store = FlakeStore()
+    store.update(results)
+    store.save()
+
+
+def _save_durations() -> None:
+    """Persist this run's test durations and compare the makespan with the LPT prediction."""
+    if not _test_durations:
+        return
+    store = DurationStore(Config.DURATIONS_FILE)
+    store.update(_test_durations)
+    store.save()
+
+    if _scheduler and _scheduler[0].predicted_loads:
+        scheduler = _scheduler[0]
+        workers = ", ".join(
+            f"{worker} {_worker_busy.get(worker, 0.0):.1f}s/{predicted:.1f}s"
+            for worker, predicted in sorted(scheduler.predicted_loads.items())
+        )
+        _summary_lines.append(
+            f"LPT scheduling: predicted makespan {scheduler.predicted_makespan:.1f}s, "
+            f"actual {max(_worker_busy.values()):.1f}s (actual/predicted per worker: {workers})"
+        )
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Print the performance summary collected during the run."""
+    if _summary_lines:
+        terminalreporter.section("performance")
+        for line in _summary_lines:
+            terminalreporter.write_line(line)
+
+
+def pytest_unconfigure(config):
+    """Stop shared driver services and write out queued log records before the process exits."""
+    DriverFactory.stop_services()
+    stop_logging()
 
 
 def pytest_html_report_title(report):
@@ -0,0 +1,81 @@
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.webdriver import WebDriver
+from utilities.browser_contexts import SharedBrowser
+
+
+class StubExecutor:
+    """Answers the WebDriver commands of a shared browser and logs which tab ran each one."""
+
+    def __init__(self):
+        self.handles = ["default"]
+        self.current = "default"
+        self.log = []
+
+    def execute(self, command: str, params: dict) -> dict:
+        self.log.append((command, self.current))
+        if command == Command.SWITCH_TO_WINDOW:
+            self.current = params["handle"]
+        if command == Command.W3C_GET_CURRENT_WINDOW_HANDLE:
+            return {"value": self.current}
+        if command == Command.W3C_GET_WINDOW_HANDLES:
+            return {"value": list(self.handles)}
+        return {"value": None}
+
+
+class StubChrome(WebDriver):
+    """WebDriver without a browser: commands go to a StubExecutor, CDP targets are made up."""
+
+    def __init__(self):
+        self.command_executor = StubExecutor()
+        self.error_handler = ErrorHandler()
+        self.session_id = "session"
+        self.caps = {}
+        self.contexts = 0
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict) -> dict:
+        if cmd == "Target.createBrowserContext":
+            self.contexts += 1
+            return {"browserContextId": f"context-{self.contexts}"}
+        if cmd == "Target.createTarget":
+            handle = f"tab-{cmd_args['browserContextId']}"
+            self.command_executor.handles.append(handle)
+            return {"targetId": handle}
+        return {}
+
+    def quit(self) -> None:
+        pass
+
+
+class TestBrowserContexts:
+    """Test cases for browser contexts of a shared browser, driven without a browser."""
+
+    def test_context_navigates_its_own_tab(self):
+        """Verify a context's first page loads run in its tab."""
+        shared = SharedBrowser(StubChrome).start()
+        context = shared.new_context()
+
+        context.get("http://blazedemo.localhost/")
+        context.get("http://blazedemo.localhost/reserve.php")
+
+        log = shared.driver.command_executor.log
+        assert [tab for command, tab in log if command == Command.GET] == [context.context_handle] * 2
+        context.quit()
+        shared.close()
+
+    def test_context_shares_only_the_session(self):
+        """Verify a context driver carries nothing set on the shared driver instance but its session."""
+        shared = SharedBrowser(StubChrome).start()
+        shared.driver.get = lambda url: None
+        shared.driver.marker = "shared"
+        context = shared.new_context()
+
+        context.get("http://blazedemo.localhost/")
+
+        assert not hasattr(context, "marker")
+        assert context.command_executor is shared.driver.command_executor
+        assert context.session_id == shared.driver.session_id
+        log = shared.driver.command_executor.log
+        assert [tab for command, tab in log if command == Command.GET] == [context.context_handle]
+        context.quit()
+        shared.close()
@@ -0,0 +1,60 @@
+import pytest
+from pages import AsyncHomePage, AsyncFlightsPage, AsyncPurchasePage, AsyncConfirmationPage
+from utilities.async_webdriver import AsyncSessionRunner, AsyncWebDriver, AsyncWebElement
+from utilities.instrumentation import ELEMENT_KEY
+from utilities.helpers import load_test_data
+
+
+class TestConcurrentBooking:
+    """Test cases for booking flows running concurrently in one process."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup for each test."""
+        self.test_data = load_test_data("bookings.json")
+
+    @pytest.mark.regression
+    @pytest.mark.booking
+    def test_concurrent_booking_flows(self, async_session_runner: AsyncSessionRunner):
+        """Verify concurrent sessions each complete a booking with their own transaction."""
+        route = self.test_data["routes"]["paris_to_berlin"]
+
+        async def book(driver: AsyncWebDriver) -> str:
+            home_page = AsyncHomePage(driver)
+            await home_page.open_home_page()
+            await home_page.search_flights(route["departure"], route["destination"])
+
+            flights_page = AsyncFlightsPage(driver)
+            assert await flights_page.is_on_flights_page()
+            await flights_page.select_cheapest_flight()
+
+            purchase_page = AsyncPurchasePage(driver)
+            assert await purchase_page.is_on_purchase_page()
+            await purchase_page.complete_purchase(self.test_data["passenger"], self.test_data["payment"])
+
+            confirmation_page = AsyncConfirmationPage(driver)
+            assert await confirmation_page.is_purchase_successful()
+            return await confirmation_page.get_transaction_id()
+
+        results = async_session_runner.run(book)
+
+        errors = [result.error for result in results if result.error]
+        assert not errors, errors
+        transaction_ids = [result.value for result in results]
+        assert all(transaction_ids)
+        assert len(set(transaction_ids)) == len(transaction_ids)
+
+
+class TestAsyncElementReferences:
+    """Test cases for element references of the asynchronous WebDriver client, without a browser."""
+
+    def test_element_references_round_trip(self):
+        """Verify W3C element references in responses become AsyncWebElements and back."""
+        driver = AsyncWebDriver(http=None, server_url="http://127.0.0.1:9515")
+        response = {"value": [{ELEMENT_KEY: "a"}, {ELEMENT_KEY: "b"}], "other": 1}
+
+        wrapped = driver.wrap(response)
+
+        assert [type(element) for element in wrapped["value"]] == [AsyncWebElement, AsyncWebElement]
+        assert [element.id for element in wrapped["value"]] == ["a", "b"]
+        assert driver._unwrap(wrapped) == response
@@ -0,0 +1,88 @@
+from http.cookiejar import Cookie
+from benchmarks.fake_webdriver import FakeWebDriver
+from utilities.driver_pool import DriverPool
+
+
+class CdpFakeWebDriver(FakeWebDriver):
+    """FakeWebDriver that answers the CDP commands of a Chrome reset and logs them."""
+
+    def __init__(self):
+        super().__init__()
+        self.cdp = []
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict) -> dict:
+        self.cdp.append((cmd, cmd_args))
+        if cmd == "Page.getNavigationHistory":
+            return {"entries": [{"url": "about:blank"}, {"url": "http://blazedemo.fake/reserve.php"},
+                                {"url": "https://payments.fake:8443/pay?id=1"}]}
+        return {}
+
+
+class TestDriverPool:
+    """Test cases for leasing, releasing and recycling pooled drivers, driven without a browser."""
+
+    def test_released_driver_is_reset_and_leased_again(self):
+        """Verify a released driver is reset to a blank page without cookies and reused."""
+        pool = DriverPool(FakeWebDriver, size=1).start()
+        driver = pool.lease()
+        driver.get("http://blazedemo.fake/")
+        driver.cookies.set_cookie(_cookie("session", "blazedemo.fake"))
+
+        pool.release(driver)
+
+        assert pool.lease() is driver
+        assert driver.current_url == DriverPool.BLANK_PAGE
+        assert not driver.get_cookies()
+        assert pool.launched == 1
+        pool.close()
+
+    def test_driver_is_replaced_after_max_reuse(self):
+        """Verify a driver that served max_reuse leases is quit and replaced."""
+        pool = DriverPool(FakeWebDriver, size=1, max_reuse=2).start()
+        first = pool.lease()
+        pool.release(first)
+        assert pool.lease() is first
+        pool.release(first)
+
+        assert pool.lease() is not first
+        assert (pool.launched, pool.recycled) == (2, 1)
+        pool.close()
+
+    def test_discarded_driver_is_replaced(self):
+        """Verify a discarded driver is not leased again and a fresh one is launched in its place."""
+        pool = DriverPool(FakeWebDriver, size=1).start()
+        driver = pool.lease()
+
+        pool.discard(driver)
+
+        assert pool.lease() is not driver
+        assert (pool.launched, pool.recycled) == (2, 1)
+        pool.close()
+
+    def test_unhealthy_idle_driver_is_recycled_on_lease(self):
+        """Verify an idle driver failing its health check is replaced when leased."""
+        pool = DriverPool(FakeWebDriver, size=1).start()
+        stale = pool.lease()
+        pool.release(stale)
+        stale.script_results["return 1;"] = 0
+
+        assert pool.lease() is not stale
+        assert pool.recycled == 1
+        pool.close()
+
+    def test_chrome_reset_clears_storage_of_every_visited_origin(self):
+        """Verify a Chrome reset clears the storage of each origin in the history and the HTTP cache."""
+        pool = DriverPool(CdpFakeWebDriver, size=1).start()
+        driver = pool.lease()
+
+        pool.release(driver)
+
+        cleared = [args["origin"] for cmd, args in driver.cdp if cmd == "Storage.clearDataForOrigin"]
+        assert cleared == ["http://blazedemo.fake", "https://payments.fake:8443"]
+        assert ("Network.clearBrowserCache", {}) in driver.cdp
+        pool.close()
+
+
+def _cookie(name: str, domain: str) -> Cookie:
+    return Cookie(0, name, "1", None, False, domain, True, False, "/", True, False, None, False,
+                  None, None, {})
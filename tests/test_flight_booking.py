@@ -71,7 +71,8 @@ class TestFlightBooking:
             self.test_data["payment"]
         )
 
-        assert confirmation_page.get_transaction_id()
-        assert confirmation_page.get_status()
-        assert confirmation_page.get_amount()
-        assert confirmation_page.get_auth_code()
+        details = confirmation_page.get_confirmation_details()
+        assert details["transaction_id"]
+        assert details["status"]
+        assert details["amount"]
+        assert details["auth_code"]
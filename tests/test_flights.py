@@ -1,5 +1,6 @@
 import pytest
-from pages import HomePage, FlightsPage
+from decimal import Decimal
+from pages import FlightsPage
 from utilities.helpers import load_test_data
 
 
@@ -7,12 +8,12 @@ class TestFlights:
     """Test cases for flight selection functionality."""
 
     @pytest.fixture(autouse=True)
-    def setup(self, driver, home_page: HomePage):
-        """Setup for each test."""
+    def setup(self, driver, flights_page: FlightsPage):
+        """Setup for each test: open the flights list directly."""
         self.driver = driver
         self.test_data = load_test_data("bookings.json")
         route = self.test_data["routes"]["paris_to_berlin"]
-        home_page.search_flights(route["departure"], route["destination"])
+        flights_page.goto(route["departure"], route["destination"])
 
     @pytest.mark.smoke
     @pytest.mark.flights
@@ -53,3 +54,20 @@ class TestFlights:
         assert cheapest_index >= 0
         prices = flights_page.get_flight_prices()
         assert cheapest_index < len(prices)
+
+    @pytest.mark.regression
+    @pytest.mark.flights
+    def test_flight_records(self, flights_page: FlightsPage):
+        """Verify the flights table is parsed into typed records with working lookups."""
+        flights = flights_page.get_flights()
+        assert len(flights) == flights_page.get_number_of_flights()
+        for flight in flights:
+            assert flight.flight and flight.airline
+            assert isinstance(flight.price, Decimal) and flight.price > 0
+            assert flight.price_text.startswith("$")
+
+        cheapest = flights_page.get_cheapest_flight()
+        assert cheapest.price == min(flight.price for flight in flights)
+        assert flights_page.get_flight_by_number(cheapest.flight) == cheapest
+        assert cheapest in flights_page.get_flights_by_airline(cheapest.airline)
+        assert flights_page.get_flight_by_number("no-such-flight") is None
@@ -54,3 +54,10 @@ class TestHomePage:
             home_page.open_home_page()
             home_page.search_flights(route["departure"], route["destination"])
             assert "reserve" in home_page.get_current_url().lower()
+
+    @pytest.mark.regression
+    @pytest.mark.dataset("routes.jsonl", schema="route")
+    def test_search_dataset_route(self, home_page: HomePage, data_record: dict):
+        """Verify searching works for every route of the routes dataset."""
+        home_page.search_flights(data_record["departure"], data_record["destination"])
+        assert "reserve" in home_page.get_current_url().lower()
@@ -0,0 +1,36 @@
+import threading
+from config.config import Config
+from utilities.instrumentation import CommandRecorder
+
+
+class TestCommandRecorder:
+    """Test cases for WebDriver command timing, driven without a browser."""
+
+    def test_commands_are_attributed_per_thread_in_bounded_memory(self, monkeypatch):
+        """Verify concurrent threads' commands go to their own test and only the slowest are kept."""
+        monkeypatch.setattr(Config, "TIMING_TOP", 5)
+        recorder = CommandRecorder()
+        barrier = threading.Barrier(2)
+
+        def run(nodeid: str, duration: float):
+            recorder.start_test(nodeid)
+            barrier.wait()
+            for _ in range(100):
+                recorder.record_command("findElement", {"using": "css selector", "value": "#a"},
+                                        None, duration)
+            barrier.wait()
+            recorder.finish_test(nodeid)
+
+        threads = [threading.Thread(target=run, args=("test_fast", 0.001)),
+                   threading.Thread(target=run, args=("test_slow", 0.01))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        summary = recorder.summarize(top=10)
+        assert summary["tests"]["test_fast"]["commands"] == 100
+        assert summary["tests"]["test_slow"]["by_command"]["findElement"]["count"] == 100
+        assert len(recorder.commands) == 2
+        assert [r["test"] for r in summary["slowest_commands"]] == ["test_slow"] * 5
+        assert recorder.current_test is None
@@ -1,5 +1,6 @@
 import pytest
-from pages import HomePage, FlightsPage, PurchasePage
+from pages import PurchasePage
+from utilities.data_pool import SyntheticDataPool
 from utilities.helpers import load_test_data
 
 
@@ -7,13 +8,11 @@ class TestPurchase:
     """Test cases for purchase functionality."""
 
     @pytest.fixture(autouse=True)
-    def setup(self, driver, home_page: HomePage, flights_page: FlightsPage):
-        """Setup for each test."""
+    def setup(self, driver, purchase_page: PurchasePage):
+        """Setup for each test: open the purchase form directly."""
         self.driver = driver
         self.test_data = load_test_data("bookings.json")
-        route = self.test_data["routes"]["paris_to_berlin"]
-        home_page.search_flights(route["departure"], route["destination"])
-        flights_page.select_flight(0)
+        purchase_page.goto(self.test_data["flight"])
 
     @pytest.mark.smoke
     @pytest.mark.purchase
@@ -26,13 +25,14 @@ class TestPurchase:
     @pytest.mark.purchase
     def test_purchase_page_elements_visible(self, purchase_page: PurchasePage):
         """Verify all purchase page form elements are visible."""
-        assert purchase_page.is_element_visible(PurchasePage.NAME_INPUT)
-        assert purchase_page.is_element_visible(PurchasePage.ADDRESS_INPUT)
-        assert purchase_page.is_element_visible(PurchasePage.CITY_INPUT)
-        assert purchase_page.is_element_visible(PurchasePage.STATE_INPUT)
-        assert purchase_page.is_element_visible(PurchasePage.ZIP_INPUT)
-        assert purchase_page.is_element_visible(PurchasePage.CREDIT_CARD_INPUT)
-        assert purchase_page.is_element_visible(PurchasePage.PURCHASE_BUTTON)
+        visibility = purchase_page.get_form_visibility()
+        assert visibility["name"]
+        assert visibility["address"]
+        assert visibility["city"]
+        assert visibility["state"]
+        assert visibility["zip_code"]
+        assert visibility["card_number"]
+        assert visibility["purchase_button"]
 
     @pytest.mark.regression
     @pytest.mark.purchase
@@ -44,11 +44,67 @@ class TestPurchase:
             passenger["address"],
             passenger["city"],
             passenger["state"],
-            passenger["zip_code"]
+            passenger["zip_code"],
+            fast=False
         )
         assert purchase_page.get_attribute(PurchasePage.NAME_INPUT, "value") == passenger["name"]
         assert purchase_page.get_attribute(PurchasePage.CITY_INPUT, "value") == passenger["city"]
 
+    @pytest.mark.regression
+    @pytest.mark.purchase
+    def test_element_cache_reuses_elements(self, purchase_page: PurchasePage):
+        """Verify repeated use of a locator reuses the element until the page navigates."""
+        passenger = self.test_data["passenger"]
+        purchase_page.type_text(PurchasePage.NAME_INPUT, passenger["name"])
+        hits = purchase_page.elements.hits
+        assert purchase_page.get_attribute(PurchasePage.NAME_INPUT, "value") == passenger["name"]
+        assert purchase_page.elements.hits == hits + 1
+
+        purchase_page.goto(self.test_data["flight"])
+        assert purchase_page.get_attribute(PurchasePage.NAME_INPUT, "value") == ""
+        assert purchase_page.elements.hits == hits + 1
+
+    @pytest.mark.regression
+    @pytest.mark.purchase
+    @pytest.mark.dataset("passengers.csv", schema="passenger")
+    def test_fill_dataset_passenger(self, purchase_page: PurchasePage, data_record: dict):
+        """Verify the form accepts every passenger of the passengers dataset."""
+        purchase_page.fill_passenger_details(
+            data_record["name"],
+            data_record["address"],
+            data_record["city"],
+            data_record["state"],
+            data_record["zip_code"]
+        )
+        values = purchase_page.get_form_values()
+        assert values["name"] == data_record["name"]
+        assert values["address"] == data_record["address"]
+
+    @pytest.mark.regression
+    @pytest.mark.purchase
+    def test_fill_generated_passenger(self, purchase_page: PurchasePage, synthetic_data: SyntheticDataPool):
+        """Verify the form accepts a generated passenger and payment."""
+        passenger = next(synthetic_data.passengers())
+        payment = next(synthetic_data.payments())
+        purchase_page.fill_passenger_details(
+            passenger["name"],
+            passenger["address"],
+            passenger["city"],
+            passenger["state"],
+            passenger["zip_code"]
+        )
+        purchase_page.fill_payment_details(
+            payment["card_type"],
+            payment["card_number"],
+            payment["month"],
+            payment["year"],
+            payment["name_on_card"]
+        )
+        values = purchase_page.get_form_values()
+        assert values["name"] == passenger["name"]
+        assert values["card_type"] == payment["card_type"]
+        assert values["card_number"] == payment["card_number"]
+
     @pytest.mark.regression
     @pytest.mark.purchase
     def test_fill_payment_details(self, purchase_page: PurchasePage):
@@ -59,10 +115,28 @@ class TestPurchase:
             payment["card_number"],
             payment["month"],
             payment["year"],
-            payment["name_on_card"]
+            payment["name_on_card"],
+            fast=False
         )
         assert purchase_page.get_attribute(PurchasePage.CREDIT_CARD_INPUT, "value") == payment["card_number"]
 
+    @pytest.mark.regression
+    @pytest.mark.purchase
+    def test_form_values_snapshot(self, purchase_page: PurchasePage):
+        """Verify the bulk form snapshot reflects filled values."""
+        passenger = self.test_data["passenger"]
+        purchase_page.fill_passenger_details(
+            passenger["name"],
+            passenger["address"],
+            passenger["city"],
+            passenger["state"],
+            passenger["zip_code"]
+        )
+        values = purchase_page.get_form_values()
+        assert values["name"] == passenger["name"]
+        assert values["address"] == passenger["address"]
+        assert values["zip_code"] == passenger["zip_code"]
+
     @pytest.mark.smoke
     @pytest.mark.purchase
     def test_complete_purchase_form(self, purchase_page: PurchasePage, confirmation_page):
@@ -72,3 +146,33 @@ class TestPurchase:
             self.test_data["payment"]
         )
         assert confirmation_page.is_on_confirmation_page()
+
+    @pytest.mark.regression
+    @pytest.mark.purchase
+    def test_fast_fill_purchase_form(self, purchase_page: PurchasePage, confirmation_page):
+        """Verify the single-script fast fill sets every field and completes the purchase."""
+        passenger = self.test_data["passenger"]
+        payment = self.test_data["payment"]
+        purchase_page.fill_passenger_details(
+            passenger["name"],
+            passenger["address"],
+            passenger["city"],
+            passenger["state"],
+            passenger["zip_code"],
+            fast=True
+        )
+        purchase_page.fill_payment_details(
+            payment["card_type"],
+            payment["card_number"],
+            payment["month"],
+            payment["year"],
+            payment["name_on_card"],
+            fast=True
+        )
+        values = purchase_page.get_form_values()
+        assert values["name"] == passenger["name"]
+        assert values["card_type"] == payment["card_type"]
+        assert values["card_number"] == payment["card_number"]
+
+        purchase_page.click_purchase()
+        assert confirmation_page.is_on_confirmation_page()
@@ -0,0 +1,216 @@
+import base64
+import io
+import itertools
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional
+from selenium.common.exceptions import WebDriverException
+from config.config import Config
+from utilities.logger import get_logger
+
+
+IMAGE_FORMATS = ("png", "webp", "jpeg")
+
+
+class CapturedState(NamedTuple):
+    """Browser state read on the test thread, before the driver is reset."""
+
+    name: str
+    url: str
+    title: str
+    page_source: str
+    console_logs: List[Dict[str, Any]]
+    screenshot: Optional[str]
+    captured_at: str
+
+
+class ArtifactSet(NamedTuple):
+    """Files written for one capture."""
+
+    name: str
+    files: List[str]
+    bytes_written: int
+
+
+class ArtifactPipeline:
+    """
+    Captures failure artifacts without blocking test teardown.
+
+    Only the reads that need the live browser happen on the test thread:
+    the screenshot (as base64, skipping the browser-side PNG file write),
+    page source, current URL, title and browser console logs. Decoding,
+    optional downscaling and WebP/JPEG compression, and all file writes
+    run on a background thread pool. ``flush`` waits for pending writes
+    and is called at session end.
+    """
+
+    def __init__(self, directory: str = None, max_workers: int = None,
+                 image_format: str = None, scale: float = None, quality: int = None):
+        """
+        Args:
+            directory: Where artifacts are written (defaults to Config.SCREENSHOTS_DIR)
+            max_workers: Background writer threads
+            image_format: Screenshot format: png, webp or jpeg
+            scale: Screenshot scale factor, e.g. 0.5 for half resolution
+            quality: WebP/JPEG quality (1-100)
+        """
+        self.directory = directory or Config.SCREENSHOTS_DIR
+        self.max_workers = max_workers or Config.ARTIFACT_WORKERS
+        self.image_format = (image_format or Config.ARTIFACT_FORMAT).lower()
+        self.scale = scale or Config.ARTIFACT_SCALE
+        self.quality = quality or Config.ARTIFACT_QUALITY
+        if self.image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unsupported artifact format: {self.image_format} "
+                             f"(choose from {', '.join(IMAGE_FORMATS)})")
+        self.logger = get_logger(self.__class__.__name__)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self.results: List[ArtifactSet] = []
+        self.capture_time = 0.0
+        self.failures = 0
+
+    def capture(self, driver, name: str) -> str:
+        """
+        Read the browser state and queue it to be written in the background.
+
+        Args:
+            driver: WebDriver (or HttpDriver) of the failed test
+            name: Artifact base name, e.g. FAILED_test_name
+
+        Returns:
+            Base path the artifacts are written to, without extension; a
+            per-process sequence number keeps captures within one second apart
+        """
+        start = time.perf_counter()
+        state = self._read_state(driver, name)
+        with self._lock:
+            base_path = os.path.join(
+                self.directory,
+                f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{next(self._sequence):03d}"
+            )
+            if self._executor is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="artifacts")
+            self._pending.append(self._executor.submit(self._write, state, base_path))
+        self.capture_time += time.perf_counter() - start
+        return base_path
+
+    def flush(self) -> List[ArtifactSet]:
+        """
+        Wait for every queued capture to be written.
+
+        Returns:
+            Artifact sets written since the last flush
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        written = []
+        for future in pending:
+            try:
+                written.append(future.result())
+            except Exception as e:
+                self.failures += 1
+                self.logger.warning(f"Could not write failure artifacts: {e}")
+        self.results.extend(written)
+        return written
+
+    def close(self) -> None:
+        """Flush pending captures and stop the writer threads."""
+        self.flush()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def summary(self) -> str:
+        """One-line summary of the artifacts written this session."""
+        size = sum(result.bytes_written for result in self.results)
+        line = (f"Failure artifacts: {len(self.results)} capture(s), {size / 1024:.0f} KB in "
+                f"{self.directory} (tests blocked {self.capture_time:.2f}s capturing)")
+        if self.failures:
+            line += f", {self.failures} failed to write"
+        return line
+
+    def _read_state(self, driver, name: str) -> CapturedState:
+        """Read everything that needs the live driver; each read is best effort."""
+        def read(getter, default=None):
+            try:
+                return getter()
+            except (WebDriverException, AttributeError) as e:
+                self.logger.debug(f"Artifact read failed for {name}: {e}")
+                return default
+
+        screenshot = None
+        if getattr(driver, "supports_javascript", True):
+            screenshot = read(driver.get_screenshot_as_base64)
+        return CapturedState(
+            name=name,
+            url=read(lambda: driver.current_url, ""),
+            title=read(lambda: driver.title, ""),
+            page_source=read(lambda: driver.page_source, ""),
+            console_logs=read(lambda: driver.get_log("browser"), []),
+            screenshot=screenshot,
+            captured_at=datetime.now().isoformat(timespec="seconds"),
+        )
+
+    def _write(self, state: CapturedState, base_path: str) -> ArtifactSet:
+        files = []
+        if state.screenshot:
+            image_path, image = self._encode_image(base64.b64decode(state.screenshot), base_path)
+            files.append(self._write_file(image_path, image))
+        files.append(self._write_file(base_path + ".html", state.page_source.encode("utf-8")))
+        metadata = {
+            "test": state.name,
+            "url": state.url,
+            "title": state.title,
+            "captured_at": state.captured_at,
+            "console_logs": state.console_logs,
+        }
+        files.append(self._write_file(base_path + ".json", json.dumps(metadata, indent=2).encode("utf-8")))
+        return ArtifactSet(state.name, files, sum(os.path.getsize(path) for path in files))
+
+    def _encode_image(self, png: bytes, base_path: str):
+        """Downscale and re-encode a PNG screenshot as configured."""
+        if self.image_format == "png" and self.scale >= 1:
+            return base_path + ".png", png
+        try:
+            from PIL import Image
+        except ImportError:
+            self.logger.warning("Pillow is not installed, keeping the full-size PNG screenshot")
+            return base_path + ".png", png
+
+        image = Image.open(io.BytesIO(png))
+        if self.scale < 1:
+            size = (max(int(image.width * self.scale), 1), max(int(image.height * self.scale), 1))
+            image = image.resize(size, Image.LANCZOS)
+        if self.image_format == "jpeg":
+            image = image.convert("RGB")
+        output = io.BytesIO()
+        options = {} if self.image_format == "png" else {"quality": self.quality}
+        image.save(output, format=self.image_format.upper(), **options)
+        extension = "jpg" if self.image_format == "jpeg" else self.image_format
+        return f"{base_path}.{extension}", output.getvalue()
+
+    @staticmethod
+    def _write_file(path: str, data: bytes) -> str:
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+
+_pipeline: Optional[ArtifactPipeline] = None
+
+
+def get_artifact_pipeline() -> ArtifactPipeline:
+    """Return the process-wide artifact pipeline, created on first use."""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = ArtifactPipeline()
+    return _pipeline
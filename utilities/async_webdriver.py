@@ -0,0 +1,441 @@
+import asyncio
+import json
+import time
+from statistics import median
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from config.config import Config
+from utilities.driver_factory import DriverFactory
+from utilities.instrumentation import ELEMENT_KEY
+from utilities.logger import get_logger
+from utilities.resource_blocking import blocked_url_patterns, parse_categories
+
+
+class AsyncHttpSession:
+    """
+    Minimal asyncio HTTP/1.1 client with keep-alive connections shared by every caller.
+
+    All drivers of an event loop send their commands through one session, so
+    commands to the same driver service reuse a handful of open connections.
+    """
+
+    def __init__(self, max_idle_per_host: int = 32, timeout: float = 120):
+        """
+        Args:
+            max_idle_per_host: Idle connections kept open per host
+            timeout: Seconds to wait for a response
+        """
+        self.max_idle_per_host = max_idle_per_host
+        self.timeout = timeout
+        self._idle: Dict[Tuple[str, int], List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+        self.connections_opened = 0
+
+    async def request(self, method: str, url: str, body: Optional[bytes] = None,
+                      headers: Optional[Dict[str, str]] = None) -> Tuple[int, bytes]:
+        """
+        Send a request and read the whole response.
+
+        Returns:
+            Status code and body
+        """
+        parts = urlsplit(url)
+        key = (parts.hostname, parts.port or 80)
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        head = f"{method} {target} HTTP/1.1\r\nHost: {parts.netloc}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in (headers or {}).items())
+        head += f"Content-Length: {len(body or b'')}\r\n\r\n"
+        payload = head.encode("latin-1") + (body or b"")
+
+        for attempt in range(2):
+            reader, writer, reused = await self._acquire(key)
+            try:
+                writer.write(payload)
+                await writer.drain()
+                status, response_body, keep_alive = await asyncio.wait_for(
+                    self._read_response(reader), self.timeout
+                )
+            except (asyncio.IncompleteReadError, ConnectionError) as e:
+                writer.close()
+                if reused and attempt == 0:
+                    continue
+                raise WebDriverException(f"{method} {url} failed: {e}")
+            except (OSError, asyncio.TimeoutError) as e:
+                writer.close()
+                raise WebDriverException(f"{method} {url} failed: {e!r}")
+            if keep_alive:
+                self._release(key, reader, writer)
+            else:
+                writer.close()
+            return status, response_body
+
+    async def close(self) -> None:
+        """Close every idle connection."""
+        idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for _, writer in connections:
+                writer.close()
+
+    async def _acquire(self, key: Tuple[str, int]):
+        idle = self._idle.get(key)
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+        reader, writer = await asyncio.open_connection(*key)
+        self.connections_opened += 1
+        return reader, writer, False
+
+    def _release(self, key: Tuple[str, int], reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter) -> None:
+        idle = self._idle.setdefault(key, [])
+        if len(idle) < self.max_idle_per_host:
+            idle.append((reader, writer))
+        else:
+            writer.close()
+
+    @staticmethod
+    async def _read_response(reader: asyncio.StreamReader) -> Tuple[int, bytes, bool]:
+        head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        status = int(head[0].split(" ", 2)[1])
+        headers = {}
+        for line in head[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        keep_alive = headers.get("connection", "").lower() != "close"
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readuntil(b"\r\n")
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            return status, b"".join(chunks), keep_alive
+        if "content-length" in headers:
+            return status, await reader.readexactly(int(headers["content-length"])), keep_alive
+        return status, await reader.read(), False
+
+
+class AsyncWebElement:
+    """Reference to an element of an AsyncWebDriver session."""
+
+    def __init__(self, driver: "AsyncWebDriver", element_id: str):
+        self.driver = driver
+        self.id = element_id
+
+    async def _execute(self, method: str, command: str, payload: Dict[str, Any] = None) -> Any:
+        return await self.driver.execute(method, f"/element/{self.id}{command}", payload)
+
+    async def click(self) -> None:
+        await self._execute("POST", "/click", {})
+
+    async def clear(self) -> None:
+        await self._execute("POST", "/clear", {})
+
+    async def send_keys(self, text: str) -> None:
+        await self._execute("POST", "/value", {"text": text})
+
+    async def text(self) -> str:
+        return await self._execute("GET", "/text")
+
+    async def tag_name(self) -> str:
+        return await self._execute("GET", "/name")
+
+    async def get_property(self, name: str) -> Any:
+        return await self._execute("GET", f"/property/{name}")
+
+    async def get_dom_attribute(self, name: str) -> Optional[str]:
+        return await self._execute("GET", f"/attribute/{name}")
+
+    async def is_displayed(self) -> bool:
+        return await self._execute("GET", "/displayed")
+
+    async def is_enabled(self) -> bool:
+        return await self._execute("GET", "/enabled")
+
+    async def is_selected(self) -> bool:
+        return await self._execute("GET", "/selected")
+
+    async def find_element(self, by: str = By.ID, value: str = None) -> "AsyncWebElement":
+        by, value = AsyncWebDriver.w3c_locator(by, value)
+        return await self._execute("POST", "/element", {"using": by, "value": value})
+
+    async def find_elements(self, by: str = By.ID, value: str = None) -> List["AsyncWebElement"]:
+        by, value = AsyncWebDriver.w3c_locator(by, value)
+        return await self._execute("POST", "/elements", {"using": by, "value": value})
+
+    def __repr__(self) -> str:
+        return f"<AsyncWebElement {self.id}>"
+
+
+class AsyncWebDriver:
+    """
+    asyncio client for a W3C WebDriver session.
+
+    Sends commands straight to a driver service (e.g. chromedriver) over a
+    shared AsyncHttpSession, so many sessions can be driven concurrently
+    from one event loop. Counts commands and their total latency.
+    """
+
+    def __init__(self, http: AsyncHttpSession, server_url: str):
+        """
+        Args:
+            http: Shared HTTP session
+            server_url: Base URL of the driver service
+        """
+        self.http = http
+        self.server_url = server_url.rstrip("/")
+        self.session_id: Optional[str] = None
+        self.capabilities: Dict[str, Any] = {}
+        self.commands = 0
+        self.command_time = 0.0
+        self._errors = ErrorHandler()
+
+    async def start(self, capabilities: Dict[str, Any]) -> "AsyncWebDriver":
+        """Create the browser session."""
+        value = await self._request("POST", "/session", {"capabilities": {"alwaysMatch": capabilities}})
+        self.session_id = value["sessionId"]
+        self.capabilities = value.get("capabilities", {})
+        return self
+
+    async def quit(self) -> None:
+        """End the browser session."""
+        if self.session_id is not None:
+            await self._request("DELETE", f"/session/{self.session_id}")
+            self.session_id = None
+
+    async def execute(self, method: str, command: str, payload: Dict[str, Any] = None) -> Any:
+        """
+        Send a session command.
+
+        Args:
+            method: HTTP method
+            command: Path below /session/{id}, e.g. '/url'
+            payload: JSON payload
+
+        Returns:
+            The command's value, with element references wrapped
+        """
+        return self.wrap(await self._request(method, f"/session/{self.session_id}{command}", payload))
+
+    async def get(self, url: str) -> None:
+        await self.execute("POST", "/url", {"url": url})
+
+    async def current_url(self) -> str:
+        return await self.execute("GET", "/url")
+
+    async def title(self) -> str:
+        return await self.execute("GET", "/title")
+
+    async def page_source(self) -> str:
+        return await self.execute("GET", "/source")
+
+    async def find_element(self, by: str = By.ID, value: str = None) -> AsyncWebElement:
+        by, value = self.w3c_locator(by, value)
+        return await self.execute("POST", "/element", {"using": by, "value": value})
+
+    async def find_elements(self, by: str = By.ID, value: str = None) -> List[AsyncWebElement]:
+        by, value = self.w3c_locator(by, value)
+        return await self.execute("POST", "/elements", {"using": by, "value": value})
+
+    async def execute_script(self, script: str, *args) -> Any:
+        return await self.execute("POST", "/execute/sync", {"script": script, "args": self._unwrap(args)})
+
+    async def execute_async_script(self, script: str, *args) -> Any:
+        return await self.execute("POST", "/execute/async", {"script": script, "args": self._unwrap(args)})
+
+    async def execute_cdp_cmd(self, cmd: str, params: Dict[str, Any]) -> Any:
+        """Run a Chrome DevTools Protocol command (Chrome only)."""
+        return await self.execute("POST", "/goog/cdp/execute", {"cmd": cmd, "params": params})
+
+    async def delete_all_cookies(self) -> None:
+        await self.execute("DELETE", "/cookie")
+
+    @staticmethod
+    def w3c_locator(by: str, value: str) -> Tuple[str, str]:
+        """Translate id, name and class locators to CSS, as Selenium does."""
+        if by == By.ID:
+            return By.CSS_SELECTOR, f'[id="{value}"]'
+        if by == By.CLASS_NAME:
+            return By.CSS_SELECTOR, f".{value}"
+        if by == By.NAME:
+            return By.CSS_SELECTOR, f'[name="{value}"]'
+        return by, value
+
+    def wrap(self, value: Any) -> Any:
+        """Replace element references in a response value with AsyncWebElements."""
+        if isinstance(value, list):
+            return [self.wrap(item) for item in value]
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncWebElement(self, value[ELEMENT_KEY])
+            return {key: self.wrap(item) for key, item in value.items()}
+        return value
+
+    def _unwrap(self, value: Any) -> Any:
+        if isinstance(value, AsyncWebElement):
+            return {ELEMENT_KEY: value.id}
+        if isinstance(value, (list, tuple)):
+            return [self._unwrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._unwrap(item) for key, item in value.items()}
+        return value
+
+    async def _request(self, method: str, path: str, payload: Dict[str, Any] = None) -> Any:
+        body = json.dumps(payload).encode() if payload is not None else None
+        headers = {"Content-Type": "application/json;charset=UTF-8", "Accept": "application/json"}
+        start = time.monotonic()
+        try:
+            status, response = await self.http.request(method, self.server_url + path, body, headers)
+        finally:
+            self.commands += 1
+            self.command_time += time.monotonic() - start
+        text = response.decode("utf-8")
+        if status >= 400:
+            self._errors.check_response({"status": status, "value": text})
+            raise WebDriverException(f"{method} {path} returned {status}: {text}")
+        return json.loads(text)["value"] if text else None
+
+
+class SessionResult(NamedTuple):
+    """Outcome of one concurrent session."""
+
+    index: int
+    startup: float
+    duration: float
+    commands: int
+    command_time: float
+    value: Any
+    error: Optional[str]
+
+
+class AsyncSessionRunner:
+    """
+    Runs a flow in many concurrent browser sessions from one event loop.
+
+    A semaphore limits how many sessions are open at once. Chrome sessions
+    share a single chromedriver; geckodriver only serves one session, so
+    Firefox sessions each get their own.
+    """
+
+    def __init__(self, browser: str = None, headless: bool = None,
+                 concurrency: int = None, block_resources: List[str] = None):
+        """
+        Args:
+            browser: Browser type ('chrome' or 'firefox')
+            headless: Run browsers in headless mode
+            concurrency: Maximum number of simultaneous sessions (defaults to Config.ASYNC_CONCURRENCY)
+            block_resources: Resource categories to block (defaults to Config.BLOCK_RESOURCES)
+        """
+        self.browser = (browser or Config.BROWSER).lower()
+        self.concurrency = concurrency or Config.ASYNC_CONCURRENCY
+        self.block_resources = parse_categories(
+            block_resources if block_resources is not None else Config.BLOCK_RESOURCES
+        )
+        self.options = DriverFactory.get_options(self.browser, headless, self.block_resources)
+        self.logger = get_logger(self.__class__.__name__)
+        self.results: List[SessionResult] = []
+
+    def capabilities(self) -> Dict[str, Any]:
+        """New session capabilities, including the configured timeouts."""
+        capabilities = self.options.to_capabilities()
+        capabilities["timeouts"] = {
+            "implicit": int(Config.IMPLICIT_WAIT * 1000),
+            "pageLoad": int(Config.PAGE_LOAD_TIMEOUT * 1000),
+        }
+        return capabilities
+
+    def run(self, flow: Callable[[AsyncWebDriver], Awaitable[Any]],
+            sessions: int = None) -> List[SessionResult]:
+        """
+        Run a flow once in each of several sessions and wait for all of them.
+
+        Args:
+            flow: Coroutine function receiving a started AsyncWebDriver
+            sessions: Number of sessions to run (defaults to Config.ASYNC_SESSIONS)
+
+        Returns:
+            One SessionResult per session, in session order
+        """
+        sessions = sessions or Config.ASYNC_SESSIONS
+        shared_service = DriverFactory.start_service(self.browser, self.options) if self.browser == "chrome" else None
+        try:
+            results = asyncio.run(self._run_all(flow, sessions, shared_service))
+        finally:
+            if shared_service is not None:
+                shared_service.stop()
+        self.results.extend(results)
+        return results
+
+    async def _run_all(self, flow, sessions: int, shared_service) -> List[SessionResult]:
+        http = AsyncHttpSession()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        try:
+            return list(await asyncio.gather(*(
+                self._run_session(index, flow, http, semaphore, shared_service)
+                for index in range(sessions)
+            )))
+        finally:
+            await http.close()
+
+    async def _run_session(self, index: int, flow, http: AsyncHttpSession,
+                           semaphore: asyncio.Semaphore, shared_service) -> SessionResult:
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            start = time.monotonic()
+            service = shared_service
+            driver = None
+            value = error = None
+            startup = 0.0
+            try:
+                if service is None:
+                    service = await loop.run_in_executor(
+                        None, DriverFactory.start_service, self.browser, self.options
+                    )
+                driver = await AsyncWebDriver(http, service.service_url).start(self.capabilities())
+                if self.block_resources and self.browser == "chrome":
+                    await driver.execute_cdp_cmd("Network.enable", {})
+                    await driver.execute_cdp_cmd(
+                        "Network.setBlockedURLs", {"urls": blocked_url_patterns(self.block_resources)}
+                    )
+                startup = time.monotonic() - start
+                value = await flow(driver)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                self.logger.error(f"Session {index} failed: {error}")
+            finally:
+                if driver is not None:
+                    try:
+                        await driver.quit()
+                    except WebDriverException as e:
+                        self.logger.warning(f"Session {index} did not quit cleanly: {e}")
+                if service is not None and service is not shared_service:
+                    await loop.run_in_executor(None, service.stop)
+            return SessionResult(
+                index=index,
+                startup=startup,
+                duration=time.monotonic() - start,
+                commands=driver.commands if driver else 0,
+                command_time=driver.command_time if driver else 0.0,
+                value=value,
+                error=error,
+            )
+
+    def summary(self) -> str:
+        """One-line summary of every session run so far."""
+        if not self.results:
+            return "Async sessions: none run"
+        durations = sorted(result.duration for result in self.results)
+        failed = sum(1 for result in self.results if result.error)
+        commands = sum(result.commands for result in self.results)
+        return (
+            f"Async sessions: {len(self.results)} run ({failed} failed) at concurrency {self.concurrency}, "
+            f"median {median(durations):.2f}s, max {durations[-1]:.2f}s, "
+            f"median startup {median(r.startup for r in self.results):.2f}s, {commands} commands"
+        )
@@ -0,0 +1,177 @@
+import threading
+from typing import Callable, Dict, Optional
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.file_detector import LocalFileDetector
+from selenium.webdriver.remote.mobile import Mobile
+from selenium.webdriver.remote.switch_to import SwitchTo
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+from config.config import Config
+from utilities.instrumentation import get_recorder
+from utilities.logger import get_logger
+
+
+class ContextDriver(WebDriver):
+    """
+    Driver for one browser context of a SharedBrowser.
+
+    It is built without starting a session and shares only the command
+    executor and session ID of the shared driver, so nothing set on the
+    shared driver instance carries over. Every command goes through the
+    SharedBrowser, which switches the session to the context's tab first.
+    """
+
+    def __init__(self, browser: "SharedBrowser", context_id: str, handle: str):
+        """
+        Args:
+            browser: Shared browser the context lives in
+            context_id: CDP browser context ID
+            handle: Window handle of the context's tab
+        """
+        shared = browser.driver
+        self.command_executor = shared.command_executor
+        self.session_id = shared.session_id
+        self.caps = dict(shared.caps)
+        self._is_remote = True
+        self.pinned_scripts = {}
+        self.error_handler = ErrorHandler()
+        self._switch_to = SwitchTo(self)
+        self._mobile = Mobile(self)
+        self.file_detector = LocalFileDetector()
+        self._authenticator_id = None
+        self.shared_browser = browser
+        self.browser_context_id = context_id
+        self.context_handle = handle
+
+    def execute(self, driver_command: str, params: dict = None) -> dict:
+        """Run a command on the shared session, in the context's tab."""
+        return self.shared_browser._execute(self, driver_command, params)
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict) -> dict:
+        """Run a Chrome DevTools Protocol command against the context's tab."""
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def quit(self) -> None:
+        """Dispose of the browser context; the shared browser keeps running."""
+        self.shared_browser.close_context(self)
+
+
+class SharedBrowser:
+    """
+    One browser process whose isolated browsing contexts are handed out as drivers.
+
+    Every context is a CDP browser context (Target.createBrowserContext): an
+    incognito-style profile with its own cookies, storage and cache, holding
+    one tab. Context drivers share the browser's WebDriver session. A lock
+    serializes their commands and switches the session to the caller's tab
+    when another context used it last, so threads may use their contexts at
+    the same time, but their commands, page loads included, run one after
+    the other. The saving is memory and one browser launch instead of one
+    per test, not wall time. Quitting a context driver disposes of its
+    browser context and leaves the browser running.
+
+    Only Chrome exposes browser contexts through WebDriver in the supported
+    Selenium version. Context drivers see every tab of the browser in
+    window_handles, so they must not close tabs they did not open.
+    """
+
+    def __init__(self, factory: Callable[[], WebDriver]):
+        """
+        Args:
+            factory: Callable that launches the Chrome WebDriver all contexts live in
+        """
+        self.factory = factory
+        self.logger = get_logger(self.__class__.__name__)
+        self.driver: Optional[WebDriver] = None
+        self._lock = threading.RLock()
+        self._default_handle: Optional[str] = None
+        self._current_handle: Optional[str] = None
+        self._contexts: Dict[str, ContextDriver] = {}
+        self.opened = 0
+        self.peak = 0
+
+    def start(self) -> "SharedBrowser":
+        """Launch the browser."""
+        self.driver = self.factory()
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            self.driver.quit()
+            raise WebDriverException("Browser contexts need Chrome (CDP Target domain)")
+        self._default_handle = self._current_handle = self.driver.current_window_handle
+        return self
+
+    def new_context(self) -> ContextDriver:
+        """
+        Open a new isolated browser context with one blank tab.
+
+        Returns:
+            Driver for the context's tab; quit() disposes of the context
+        """
+        with self._lock:
+            self._switch(self._default_handle)
+            before = set(self.driver.window_handles)
+            context_id = self.driver.execute_cdp_cmd(
+                "Target.createBrowserContext", {"disposeOnDetach": False}
+            )["browserContextId"]
+            target_id = self.driver.execute_cdp_cmd(
+                "Target.createTarget", {"url": "about:blank", "browserContextId": context_id}
+            )["targetId"]
+            handles = self.driver.window_handles
+            handle = target_id if target_id in handles else next(iter(set(handles) - before))
+
+            context = ContextDriver(self, context_id, handle)
+            self._contexts[context_id] = context
+            self.opened += 1
+            self.peak = max(self.peak, len(self._contexts))
+
+        if Config.COMMAND_TIMING:
+            get_recorder().instrument(context)
+        self.logger.debug(f"Opened browser context {context_id} ({len(self._contexts)} open)")
+        return context
+
+    def close_context(self, context: ContextDriver) -> None:
+        """Dispose of a context with its tabs, cookies and storage."""
+        with self._lock:
+            if self._contexts.pop(context.browser_context_id, None) is None:
+                return
+            try:
+                self._switch(self._default_handle)
+                self.driver.execute_cdp_cmd(
+                    "Target.disposeBrowserContext", {"browserContextId": context.browser_context_id}
+                )
+            except WebDriverException as e:
+                self.logger.debug(f"Error while disposing browser context: {e}")
+
+    def close(self) -> None:
+        """Dispose of every open context and quit the browser."""
+        with self._lock:
+            contexts = list(self._contexts.values())
+        for context in contexts:
+            self.close_context(context)
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except WebDriverException as e:
+                self.logger.debug(f"Error while quitting shared browser: {e}")
+            self.driver = None
+        self.logger.info(f"Shared browser closed (contexts: {self.opened}, peak concurrent: {self.peak})")
+
+    def summary(self) -> str:
+        """One-line summary of the contexts this browser served."""
+        return (f"Browser contexts: {self.opened} isolated context(s) in one browser, "
+                f"peak {self.peak} open at once")
+
+    def _execute(self, context: ContextDriver, driver_command: str, params: dict = None) -> dict:
+        """Run a context's command on the shared session, switched to the context's tab."""
+        with self._lock:
+            if driver_command != Command.SWITCH_TO_WINDOW:
+                self._switch(context.context_handle)
+            response = WebDriver.execute(context, driver_command, params)
+            if driver_command == Command.SWITCH_TO_WINDOW:
+                context.context_handle = self._current_handle = params["handle"]
+            return response
+
+    def _switch(self, handle: str) -> None:
+        if self._current_handle != handle:
+            WebDriver.execute(self.driver, Command.SWITCH_TO_WINDOW, {"handle": handle})
+            self._current_handle = handle
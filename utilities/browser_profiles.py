@@ -0,0 +1,85 @@
+import os
+import tempfile
+from typing import Any, Dict, List, NamedTuple, Optional
+from config.config import Config
+
+
+class BrowserProfile(NamedTuple):
+    """Memory-related launch settings of a browser."""
+
+    name: str
+    window_size: tuple
+    # Disk cache limit in MB, or None for the browser default
+    disk_cache_mb: Optional[int]
+    # Maximum number of renderer (content) processes, or None for the browser default
+    renderer_process_limit: Optional[int]
+    disable_background_networking: bool
+    # Keep the browser profile on tmpfs (Config.TMPFS_DIR) instead of disk
+    tmpfs_profile: bool
+
+
+PROFILES = {
+    "default": BrowserProfile("default", (1920, 1080), None, None, False, False),
+    "lean": BrowserProfile("lean", (1366, 768), 32, 4, True, True),
+    "minimal": BrowserProfile("minimal", (1024, 768), 1, 2, True, True),
+}
+
+# Firefox preferences that stop update checks, prefetching and other traffic
+# the tests do not need
+FIREFOX_BACKGROUND_NETWORKING_PREFS = {
+    "app.update.auto": False,
+    "browser.search.update": False,
+    "network.prefetch-next": False,
+    "network.dns.disablePrefetch": True,
+    "network.http.speculative-parallel-limit": 0,
+    "network.captive-portal-service.enabled": False,
+    "browser.safebrowsing.update.enabled": False,
+}
+
+
+def get_profile(name: str = None) -> BrowserProfile:
+    """
+    Look up a performance profile by name.
+
+    Args:
+        name: Profile name (defaults to Config.BROWSER_PROFILE)
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    name = (name or Config.BROWSER_PROFILE).lower()
+    if name not in PROFILES:
+        raise ValueError(f"Unknown browser profile: {name} (choose from {sorted(PROFILES)})")
+    return PROFILES[name]
+
+
+def make_profile_dir(prefix: str) -> str:
+    """Create a browser profile directory on tmpfs, or in the temp directory if there is none."""
+    root = Config.TMPFS_DIR if os.path.isdir(Config.TMPFS_DIR) and os.access(Config.TMPFS_DIR, os.W_OK) else None
+    return tempfile.mkdtemp(prefix=prefix, dir=root)
+
+
+def chrome_profile_arguments(profile: BrowserProfile) -> List[str]:
+    """Get the Chrome command line switches of a profile."""
+    width, height = profile.window_size
+    arguments = [f"--window-size={width},{height}"]
+    if profile.disk_cache_mb is not None:
+        arguments.append(f"--disk-cache-size={profile.disk_cache_mb * 1024 * 1024}")
+    if profile.renderer_process_limit is not None:
+        arguments.append(f"--renderer-process-limit={profile.renderer_process_limit}")
+    if profile.disable_background_networking:
+        arguments.extend(["--disable-background-networking", "--disable-component-update"])
+    return arguments
+
+
+def firefox_profile_prefs(profile: BrowserProfile) -> Dict[str, Any]:
+    """Get the Firefox preferences of a profile."""
+    prefs = {}
+    if profile.disk_cache_mb is not None:
+        prefs["browser.cache.disk.capacity"] = profile.disk_cache_mb * 1024
+        prefs["browser.cache.disk.smart_size.enabled"] = False
+    if profile.renderer_process_limit is not None:
+        prefs["dom.ipc.processCount"] = profile.renderer_process_limit
+    if profile.disable_background_networking:
+        prefs.update(FIREFOX_BACKGROUND_NETWORKING_PREFS)
+    return prefs
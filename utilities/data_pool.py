@@ -0,0 +1,160 @@
+import os
+import random
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+from config.config import Config
+from utilities.logger import get_logger
+
+
+# Faker card types for the card types the purchase form offers
+CARD_TYPES = {"visa": "visa16", "amex": "amex", "dinersclub": "diners"}
+
+
+def worker_index(worker_id: str = None) -> int:
+    """
+    Index of the current xdist worker ("gw3" -> 3), or 0 outside of xdist.
+
+    Args:
+        worker_id: Worker ID (defaults to PYTEST_XDIST_WORKER)
+    """
+    worker_id = worker_id if worker_id is not None else os.getenv("PYTEST_XDIST_WORKER", "")
+    digits = "".join(c for c in worker_id if c.isdigit())
+    return int(digits) if digits else 0
+
+
+class SyntheticDataPool:
+    """
+    Seeded, process-wide source of synthetic users, passengers and payments.
+
+    One Faker instance is built per pool (instead of one per call) and
+    records are generated in batches, then handed out through iterators.
+    The same seed and worker produce the same records, and every email
+    carries the worker index and a sequence number, so records are unique
+    across xdist workers of a run.
+    """
+
+    def __init__(self, seed: int = None, worker: int = None, batch_size: int = None,
+                 locale: str = "en_US"):
+        """
+        Args:
+            seed: Run seed (defaults to Config.DATA_SEED, or a random seed when unset)
+            worker: xdist worker index (defaults to the current worker)
+            batch_size: Records generated per batch
+            locale: Faker locale
+        """
+        from faker import Faker
+        self.seed = Config.DATA_SEED if seed is None else seed
+        self.worker = worker_index() if worker is None else worker
+        self.batch_size = batch_size or Config.DATA_POOL_BATCH_SIZE
+        if self.seed is None:
+            self.seed = random.randrange(1 << 32)
+        self.logger = get_logger(self.__class__.__name__)
+        self.logger.info(f"Synthetic data seed {self.seed} (worker {self.worker})")
+        self.faker = Faker(locale)
+        self.faker.seed_instance(f"{self.seed}-{self.worker}")
+        self._random = random.Random(f"{self.seed}-{self.worker}")
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._batches: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._factories: Dict[str, Callable[[], Dict[str, Any]]] = {
+            "user": self._user,
+            "passenger": self._passenger,
+            "payment": self._payment,
+        }
+        self.generated = 0
+
+    def next_record(self, kind: str) -> Dict[str, Any]:
+        """
+        Take the next record of a kind, generating a new batch when needed.
+
+        Args:
+            kind: "user", "passenger" or "payment"
+
+        Returns:
+            A new dict owned by the caller
+        """
+        with self._lock:
+            batch = self._batches.setdefault(kind, deque())
+            if not batch:
+                factory = self._factories[kind]
+                batch.extend(factory() for _ in range(self.batch_size))
+                self.generated += self.batch_size
+            return batch.popleft()
+
+    def records(self, kind: str, count: int = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over records of a kind.
+
+        Args:
+            kind: "user", "passenger" or "payment"
+            count: Number of records, or None for an endless iterator
+        """
+        produced = 0
+        while count is None or produced < count:
+            yield self.next_record(kind)
+            produced += 1
+
+    def users(self, count: int = None) -> Iterator[Dict[str, str]]:
+        """Registration users: first_name, last_name, email, telephone, password."""
+        return self.records("user", count)
+
+    def passengers(self, count: int = None) -> Iterator[Dict[str, str]]:
+        """Passengers in the bookings.json passenger format."""
+        return self.records("passenger", count)
+
+    def payments(self, count: int = None) -> Iterator[Dict[str, str]]:
+        """Payments in the bookings.json payment format."""
+        return self.records("payment", count)
+
+    def take(self, kind: str, count: int) -> List[Dict[str, Any]]:
+        """Take a list of records of a kind."""
+        return list(self.records(kind, count))
+
+    def _unique_email(self, first_name: str, last_name: str) -> str:
+        self._sequence += 1
+        local = f"{first_name}.{last_name}".lower().replace(" ", "").replace("'", "")
+        return f"{local}.{self.worker}-{self._sequence}@example.com"
+
+    def _user(self) -> Dict[str, str]:
+        first_name, last_name = self.faker.first_name(), self.faker.last_name()
+        return {
+            "first_name": first_name,
+            "last_name": last_name,
+            "email": self._unique_email(first_name, last_name),
+            "telephone": self.faker.phone_number()[:15],
+            "password": self.faker.password(length=12),
+        }
+
+    def _passenger(self) -> Dict[str, str]:
+        return {
+            "name": self.faker.name(),
+            "address": self.faker.street_address(),
+            "city": self.faker.city(),
+            "state": self.faker.state_abbr(),
+            "zip_code": self.faker.zipcode(),
+        }
+
+    def _payment(self) -> Dict[str, str]:
+        card_type = self._random.choice(sorted(CARD_TYPES))
+        month, year = self.faker.credit_card_expire(date_format="%m/%Y").split("/")
+        return {
+            "card_type": card_type,
+            "card_number": self.faker.credit_card_number(card_type=CARD_TYPES[card_type]),
+            "month": month,
+            "year": year,
+            "name_on_card": self.faker.name(),
+        }
+
+
+_pool: Optional[SyntheticDataPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_data_pool() -> SyntheticDataPool:
+    """Return the process-wide synthetic data pool, created on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SyntheticDataPool()
+        return _pool
@@ -1,36 +1,332 @@
+import atexit
+import shutil
+import threading
+import time
+from typing import Dict, List, Union
 from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.service import Service
+from selenium.webdriver.firefox.remote_connection import FirefoxRemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
 from config.config import Config
+from utilities.browser_contexts import SharedBrowser
+from utilities.browser_profiles import (
+    BrowserProfile, chrome_profile_arguments, firefox_profile_prefs, get_profile, make_profile_dir
+)
+from utilities.driver_startup import StartupRecord, get_binary_cache, get_startup_stats
+from utilities.instrumentation import get_recorder
+from utilities.logger import get_logger
+from utilities.resource_governor import get_resource_governor
+from utilities.resource_blocking import (
+    apply_chrome_blocking, firefox_blocking_prefs, parse_categories
+)
+
+
+class _ServiceChrome(webdriver.Chrome):
+    """
+    Chrome session on a chromedriver the factory has already started.
+
+    A shared service serves the other sessions of the process too, so
+    quitting the session leaves it running.
+    """
+
+    def __init__(self, service: Service, options: webdriver.ChromeOptions, shared: bool,
+                 profile_dir: str = None):
+        self.service = service
+        self._shared_service = shared
+        self.profile_dir = profile_dir
+        executor = ChromiumRemoteConnection(
+            remote_server_addr=service.service_url,
+            browser_name="chrome",
+            vendor_prefix="goog",
+            keep_alive=True,
+            ignore_proxy=options._ignore_local_proxy,
+        )
+        try:
+            RemoteWebDriver.__init__(self, command_executor=executor, options=options)
+        except Exception:
+            self.quit()
+            raise
+        self._is_remote = False
+
+    def quit(self) -> None:
+        try:
+            if not self._shared_service:
+                super().quit()
+                return
+            try:
+                RemoteWebDriver.quit(self)
+            except Exception:
+                pass
+        finally:
+            _release_resources(self)
+
+
+class _ServiceFirefox(webdriver.Firefox):
+    """Firefox session on a geckodriver the factory has already started."""
+
+    def __init__(self, service: Service, options: webdriver.FirefoxOptions, profile_dir: str = None):
+        self.service = service
+        self.profile_dir = profile_dir
+        executor = FirefoxRemoteConnection(
+            remote_server_addr=service.service_url,
+            keep_alive=True,
+            ignore_proxy=options._ignore_local_proxy,
+        )
+        try:
+            RemoteWebDriver.__init__(self, command_executor=executor, options=options)
+        except Exception:
+            self.quit()
+            raise
+        self._is_remote = False
+
+    def quit(self) -> None:
+        try:
+            super().quit()
+        finally:
+            _release_resources(self)
+
+
+def _release_resources(driver: webdriver.Remote) -> None:
+    """Stop sampling a quit driver's memory and remove its tmpfs profile."""
+    get_resource_governor().unwatch(driver)
+    if driver.profile_dir:
+        shutil.rmtree(driver.profile_dir, ignore_errors=True)
 
 
 class DriverFactory:
-    """Factory class for creating WebDriver instances."""
+    """
+    Factory class for creating WebDriver instances.
+
+    Driver and browser binaries are resolved once and cached on disk, Chrome
+    sessions share one running chromedriver (Config.SHARED_DRIVER_SERVICE),
+    and every launch records its resolve, spawn, session and first
+    navigation times. Named performance profiles (Config.BROWSER_PROFILE)
+    bound the memory each browser uses, and launched browsers are watched by
+    the resource governor.
+    """
+
+    # Running driver services shared by the sessions of this process
+    _shared_services: Dict[str, Service] = {}
+    _services_lock = threading.Lock()
 
     @staticmethod
-    def get_driver(browser: str = None, headless: bool = None) -> webdriver.Remote:
+    def get_driver(browser: str = None, headless: bool = None,
+                   block_resources: List[str] = None,
+                   page_load_strategy: str = None,
+                   profile: str = None) -> webdriver.Remote:
         """
         Create and return a WebDriver instance.
 
         Args:
             browser: Browser type ('chrome' or 'firefox')
             headless: Run browser in headless mode
+            block_resources: Resource categories to block (defaults to Config.BLOCK_RESOURCES)
+            page_load_strategy: 'normal', 'eager' or 'none' (defaults to Config.PAGE_LOAD_STRATEGY)
+            profile: Performance profile name (defaults to Config.BROWSER_PROFILE)
 
         Returns:
             WebDriver instance
         """
         browser = browser or Config.BROWSER
         headless = headless if headless is not None else Config.HEADLESS
+        block_resources = parse_categories(
+            block_resources if block_resources is not None else Config.BLOCK_RESOURCES
+        )
+        page_load_strategy = page_load_strategy or Config.PAGE_LOAD_STRATEGY
+        browser_profile = get_profile(profile)
 
         if browser.lower() == "chrome":
-            return DriverFactory._get_chrome_driver(headless)
+            driver = DriverFactory._get_chrome_driver(headless, block_resources, page_load_strategy,
+                                                      browser_profile)
         elif browser.lower() == "firefox":
-            return DriverFactory._get_firefox_driver(headless)
+            driver = DriverFactory._get_firefox_driver(headless, block_resources, page_load_strategy,
+                                                       browser_profile)
         else:
             raise ValueError(f"Unsupported browser: {browser}")
 
+        get_resource_governor().watch(driver)
+        if Config.COMMAND_TIMING:
+            get_recorder().instrument(driver)
+
+        return driver
+
     @staticmethod
-    def _get_chrome_driver(headless: bool) -> webdriver.Chrome:
-        """Create Chrome WebDriver instance."""
+    def get_shared_browser(browser: str = None, headless: bool = None,
+                           page_load_strategy: str = None) -> SharedBrowser:
+        """
+        Launch one browser whose isolated browser contexts are handed out as drivers.
+
+        Args:
+            browser: Browser type; only 'chrome' supports browser contexts
+            headless: Run browser in headless mode
+            page_load_strategy: 'normal', 'eager' or 'none' (defaults to Config.PAGE_LOAD_STRATEGY)
+
+        Returns:
+            Started SharedBrowser; new_context() returns a driver per context
+        """
+        browser = (browser or Config.BROWSER).lower()
+        if browser != "chrome":
+            raise ValueError(f"Browser contexts are not supported on {browser}, use chrome")
+        return SharedBrowser(
+            lambda: DriverFactory.get_driver(browser, headless, page_load_strategy=page_load_strategy)
+        ).start()
+
+    @staticmethod
+    def get_options(browser: str = None, headless: bool = None,
+                    block_resources: List[str] = None,
+                    page_load_strategy: str = None,
+                    profile: str = None) -> Union[webdriver.ChromeOptions, webdriver.FirefoxOptions]:
+        """
+        Build the browser options used for new sessions, e.g. for clients that
+        talk to a driver service directly.
+
+        Args:
+            browser: Browser type ('chrome' or 'firefox')
+            headless: Run browser in headless mode
+            block_resources: Resource categories to block; only Firefox applies them at launch
+            page_load_strategy: 'normal', 'eager' or 'none' (defaults to Config.PAGE_LOAD_STRATEGY)
+            profile: Performance profile name (defaults to Config.BROWSER_PROFILE); its
+                tmpfs profile directory is only created for sessions the factory launches
+
+        Returns:
+            Options instance
+        """
+        browser = (browser or Config.BROWSER).lower()
+        headless = headless if headless is not None else Config.HEADLESS
+        page_load_strategy = page_load_strategy or Config.PAGE_LOAD_STRATEGY
+        if browser == "chrome":
+            return DriverFactory._chrome_options(headless, page_load_strategy, get_profile(profile))
+        if browser == "firefox":
+            return DriverFactory._firefox_options(
+                headless, parse_categories(block_resources or []), page_load_strategy, get_profile(profile)
+            )
+        raise ValueError(f"Unsupported browser: {browser}")
+
+    @staticmethod
+    def start_service(browser: str = None,
+                      options: Union[webdriver.ChromeOptions, webdriver.FirefoxOptions] = None) -> Service:
+        """
+        Start a standalone chromedriver or geckodriver process.
+
+        The driver binary comes from the binary cache. chromedriver serves any
+        number of sessions; geckodriver serves one session at a time.
+
+        Returns:
+            Started service; its service_url accepts W3C WebDriver commands
+        """
+        browser = (browser or Config.BROWSER).lower()
+        options = options or DriverFactory.get_options(browser)
+        service = DriverFactory._new_service(browser, get_binary_cache().resolve(browser, options).driver_path)
+        service.start()
+        return service
+
+    @staticmethod
+    def stop_services() -> None:
+        """Stop the driver services shared by this process's sessions."""
+        with DriverFactory._services_lock:
+            services = list(DriverFactory._shared_services.values())
+            DriverFactory._shared_services.clear()
+        for service in services:
+            service.stop()
+
+    @staticmethod
+    def _new_service(browser: str, driver_path: str, service_args: List[str] = None) -> Service:
+        if browser == "chrome":
+            from selenium.webdriver.chrome.service import Service as ChromeService
+            return ChromeService(executable_path=driver_path, service_args=service_args)
+        if browser == "firefox":
+            from selenium.webdriver.firefox.service import Service as FirefoxService
+            return FirefoxService(executable_path=driver_path, service_args=service_args)
+        raise ValueError(f"Unsupported browser: {browser}")
+
+    @staticmethod
+    def _shared_service(browser: str, driver_path: str) -> Service:
+        """Return the running shared service of a browser, starting it on first use."""
+        with DriverFactory._services_lock:
+            service = DriverFactory._shared_services.get(browser)
+            if service is None or service.process is None or service.process.poll() is not None:
+                service = DriverFactory._new_service(browser, driver_path)
+                service.start()
+                if not DriverFactory._shared_services:
+                    atexit.register(DriverFactory.stop_services)
+                DriverFactory._shared_services[browser] = service
+            return service
+
+    @staticmethod
+    def _launch(browser: str, options: Union[webdriver.ChromeOptions, webdriver.FirefoxOptions],
+                profile: BrowserProfile) -> webdriver.Remote:
+        """
+        Start a session, timing binary resolution, driver spawn and session creation.
+
+        A launch is warm when the binaries were already resolved in this process.
+        When a cached driver cannot create a session, e.g. because the browser
+        updated itself, the cached binaries are resolved again once.
+        Profiles with tmpfs_profile get a browser profile directory on tmpfs,
+        removed when the driver quits.
+        """
+        profile_dir = make_profile_dir(f"{browser}-profile-") if profile.tmpfs_profile else None
+        if profile_dir and browser == "chrome":
+            options.add_argument(f"--user-data-dir={profile_dir}")
+        cache = get_binary_cache()
+        warm = cache.is_resolved(browser)
+        shared = browser == "chrome" and Config.SHARED_DRIVER_SERVICE
+        for attempt in range(2):
+            start = time.perf_counter()
+            driver_path = cache.resolve(browser, options).driver_path
+            resolved = time.perf_counter()
+
+            if shared:
+                service = DriverFactory._shared_service(browser, driver_path)
+            else:
+                # geckodriver creates the session's Firefox profile under --profile-root
+                service_args = ["--profile-root", profile_dir] if profile_dir and browser == "firefox" else None
+                service = DriverFactory._new_service(browser, driver_path, service_args)
+                service.start()
+            spawned = time.perf_counter()
+
+            try:
+                if browser == "chrome":
+                    driver = _ServiceChrome(service, options, shared, profile_dir)
+                else:
+                    driver = _ServiceFirefox(service, options, profile_dir)
+                cache.confirm(browser)
+                break
+            except SessionNotCreatedException as e:
+                if attempt or not cache.invalidate(browser):
+                    if profile_dir:
+                        shutil.rmtree(profile_dir, ignore_errors=True)
+                    raise
+                get_logger("DriverFactory").warning(
+                    f"Cached {browser} driver could not create a session, resolving it again: {e.msg}"
+                )
+                # No session has run on the stale driver, so its service can go
+                DriverFactory._stop_service(browser, service, shared)
+            except Exception:
+                if profile_dir:
+                    shutil.rmtree(profile_dir, ignore_errors=True)
+                raise
+        record = StartupRecord(browser, warm, resolved - start, spawned - resolved,
+                               time.perf_counter() - spawned, 0.0)
+        get_startup_stats().record(record, driver)
+        return driver
+
+    @staticmethod
+    def _stop_service(browser: str, service: Service, shared: bool) -> None:
+        """Stop the service of a stale driver, removing it from the shared services."""
+        if shared:
+            with DriverFactory._services_lock:
+                if DriverFactory._shared_services.get(browser) is service:
+                    del DriverFactory._shared_services[browser]
+        service.stop()
+
+    @staticmethod
+    def _chrome_options(headless: bool, page_load_strategy: str,
+                        profile: BrowserProfile) -> webdriver.ChromeOptions:
+        """Build Chrome options."""
         options = webdriver.ChromeOptions()
+        options.page_load_strategy = page_load_strategy
 
         if headless:
             options.add_argument("--headless=new")
@@ -38,59 +334,82 @@ class DriverFactory:
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
+        for argument in chrome_profile_arguments(profile):
+            options.add_argument(argument)
         options.add_argument("--disable-extensions")
         options.add_argument("--disable-infobars")
 
+        if Config.PROXY:
+            options.add_argument(f"--proxy-server=http://{Config.PROXY}")
+            # Keep http:// navigations on the proxy instead of trying HTTPS first
+            options.add_argument("--disable-features=HttpsUpgrades")
+
         # Suppress logging
         options.add_experimental_option("excludeSwitches", ["enable-logging"])
+        # Keep the page's console messages for failure artifacts
+        options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
 
-        # Selenium Manager will automatically handle driver download
-        driver = webdriver.Chrome(options=options)
+        return options
+
+    @staticmethod
+    def _get_chrome_driver(headless: bool, block_resources: List[str],
+                           page_load_strategy: str, profile: BrowserProfile) -> webdriver.Chrome:
+        """Create Chrome WebDriver instance."""
+        options = DriverFactory._chrome_options(headless, page_load_strategy, profile)
+        driver = DriverFactory._launch("chrome", options, profile)
 
         driver.implicitly_wait(Config.IMPLICIT_WAIT)
         driver.set_page_load_timeout(Config.PAGE_LOAD_TIMEOUT)
 
+        if block_resources:
+            apply_chrome_blocking(driver, block_resources)
+
         return driver
 
     @staticmethod
-    def _get_firefox_driver(headless: bool) -> webdriver.Firefox:
-        """Create Firefox WebDriver instance."""
-        import os
-        from selenium.webdriver.firefox.service import Service
-
+    def _firefox_options(headless: bool, block_resources: List[str],
+                         page_load_strategy: str, profile: BrowserProfile) -> webdriver.FirefoxOptions:
+        """Build Firefox options."""
         options = webdriver.FirefoxOptions()
+        options.page_load_strategy = page_load_strategy
 
         if headless:
             options.add_argument("--headless")
-            # Set environment variable for headless mode
-            os.environ["MOZ_HEADLESS"] = "1"
 
-        options.add_argument("--width=1920")
-        options.add_argument("--height=1080")
+        width, height = profile.window_size
+        options.add_argument(f"--width={width}")
+        options.add_argument(f"--height={height}")
+        for name, value in firefox_profile_prefs(profile).items():
+            options.set_preference(name, value)
 
         # Disable logging
         options.set_preference("devtools.console.stdout.content", False)
 
-        # Set Firefox binary location (handles snap installations)
-        # Check multiple possible Firefox binary locations
-        firefox_paths = [
-            "/snap/firefox/current/usr/lib/firefox/firefox",  # Snap package actual binary
-            "/snap/bin/firefox",  # Snap wrapper
-            "/usr/bin/firefox-esr",  # ESR installation
-            "/usr/lib/firefox/firefox",  # Standard installation
-        ]
-
-        for path in firefox_paths:
-            if os.path.exists(path):
-                options.binary_location = path
-                break
+        if Config.PROXY:
+            proxy_host, proxy_port = Config.PROXY.rsplit(":", 1)
+            options.set_preference("network.proxy.type", 1)
+            options.set_preference("network.proxy.http", proxy_host)
+            options.set_preference("network.proxy.http_port", int(proxy_port))
+            options.set_preference("network.proxy.ssl", proxy_host)
+            options.set_preference("network.proxy.ssl_port", int(proxy_port))
+            options.set_preference("dom.security.https_first", False)
 
-        # Create a service object to configure geckodriver
-        service = Service()
+        # Resolve the local stand-in site's hostname to loopback
+        options.set_preference("network.dns.localDomains", Config.LOCAL_HOSTNAME)
 
-        # Selenium Manager will automatically handle driver download
-        driver = webdriver.Firefox(service=service, options=options)
+        for name, value in firefox_blocking_prefs(block_resources).items():
+            options.set_preference(name, value)
+
+        # The Firefox binary (including snap installations) is located by the
+        # binary cache when the session is launched
+        return options
+
+    @staticmethod
+    def _get_firefox_driver(headless: bool, block_resources: List[str],
+                            page_load_strategy: str, profile: BrowserProfile) -> webdriver.Firefox:
+        """Create Firefox WebDriver instance."""
+        options = DriverFactory._firefox_options(headless, block_resources, page_load_strategy, profile)
+        driver = DriverFactory._launch("firefox", options, profile)
 
         driver.implicitly_wait(Config.IMPLICIT_WAIT)
         driver.set_page_load_timeout(Config.PAGE_LOAD_TIMEOUT)
@@ -0,0 +1,221 @@
+import threading
+from typing import Callable, Dict, List, Set
+from urllib.parse import urlsplit
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from utilities.logger import get_logger
+from utilities.resource_governor import get_resource_governor
+
+
+# Clears the web storage of the page's own origin, for browsers without CDP
+STORAGE_CLEAR_SCRIPT = (
+    "try { window.localStorage.clear(); } catch (e) {}"
+    "try { window.sessionStorage.clear(); } catch (e) {}"
+    "try { indexedDB.databases().then(function (databases) {"
+    " databases.forEach(function (db) { indexedDB.deleteDatabase(db.name); }); }); } catch (e) {}"
+)
+
+
+class DriverPool:
+    """
+    Pool of pre-launched WebDriver instances that are leased to tests.
+
+    Drivers are reset between leases so each test starts from a blank
+    browser state, and a driver is recycled once it fails a health check,
+    has served ``max_reuse`` tests or is over the resource governor's
+    memory budget.
+    """
+
+    BLANK_PAGE = "about:blank"
+
+    def __init__(self, factory: Callable[[], WebDriver], size: int = 1, max_reuse: int = 50):
+        """
+        Args:
+            factory: Callable that launches a new WebDriver instance
+            size: Number of drivers to pre-launch
+            max_reuse: Number of leases after which a driver is replaced
+        """
+        self.factory = factory
+        self.size = max(size, 1)
+        self.max_reuse = max(max_reuse, 1)
+        self.logger = get_logger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._idle: List[WebDriver] = []
+        self._leased: List[WebDriver] = []
+        self._uses: Dict[int, int] = {}
+        self.launched = 0
+        self.recycled = 0
+
+    def start(self) -> "DriverPool":
+        """Pre-launch the configured number of drivers."""
+        self.logger.info(f"Warming driver pool with {self.size} driver(s)")
+        for _ in range(self.size):
+            self._idle.append(self._launch())
+        return self
+
+    def lease(self) -> WebDriver:
+        """
+        Take a healthy driver out of the pool, launching one if none is idle.
+
+        Returns:
+            WebDriver instance reserved for the caller
+        """
+        with self._lock:
+            driver = self._idle.pop() if self._idle else None
+
+        if driver is not None and not self.is_healthy(driver):
+            self.logger.warning("Idle driver failed health check, recycling it")
+            self._discard(driver)
+            driver = None
+
+        if driver is None:
+            driver = self._launch()
+
+        with self._lock:
+            self._leased.append(driver)
+        return driver
+
+    def release(self, driver: WebDriver) -> None:
+        """
+        Return a leased driver to the pool.
+
+        The driver is reset and kept warm, unless it has reached its reuse
+        limit, is over its memory budget or cannot be reset, in which case it
+        is replaced. While the worker's browsers are over the worker memory
+        budget, the driver is closed instead.
+        """
+        governor = get_resource_governor()
+        with self._lock:
+            if driver in self._leased:
+                self._leased.remove(driver)
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+            exhausted = self._uses[id(driver)] >= self.max_reuse
+
+        if exhausted:
+            self.logger.info("Driver reached its reuse limit, replacing it")
+            self._replace(driver)
+        elif governor.over_budget(driver):
+            self.logger.info(f"Driver uses {governor.usage_mb(driver):.0f} MB, "
+                             f"over the {governor.budget_mb} MB budget, replacing it")
+            governor.recycled += 1
+            self._replace(driver)
+        elif governor.over_worker_budget():
+            self.logger.info(f"Worker browsers are over the {governor.worker_budget_mb} MB budget, "
+                             f"closing the released driver")
+            governor.throttled += 1
+            self._discard(driver)
+        elif not self.reset(driver):
+            self.logger.warning("Driver could not be reset, replacing it")
+            self._replace(driver)
+        else:
+            with self._lock:
+                self._idle.append(driver)
+
+    def discard(self, driver: WebDriver) -> None:
+        """Remove a leased driver from the pool and replace it with a fresh one."""
+        with self._lock:
+            if driver in self._leased:
+                self._leased.remove(driver)
+        self._replace(driver)
+
+    def close(self) -> None:
+        """Quit every driver owned by the pool."""
+        with self._lock:
+            drivers = self._idle + self._leased
+            self._idle, self._leased = [], []
+        for driver in drivers:
+            self._quit(driver)
+        self.logger.info(
+            f"Driver pool closed (launched: {self.launched}, recycled: {self.recycled})"
+        )
+
+    def reset(self, driver: WebDriver) -> bool:
+        """
+        Bring a driver back to a blank state between leases.
+
+        Dismisses open alerts, moves to a fresh tab (no history, no
+        sessionStorage) and closes every other window, clears cookies and
+        navigates to about:blank. Chrome clears the storage (localStorage,
+        IndexedDB, cache storage, service workers) of every origin in the
+        history of the closed windows and its HTTP cache through CDP; other
+        browsers clear the web storage of the origin they were left on.
+
+        Returns:
+            True if the driver was reset successfully
+        """
+        try:
+            try:
+                driver.switch_to.alert.dismiss()
+            except NoAlertPresentException:
+                pass
+
+            cdp = hasattr(driver, "execute_cdp_cmd")
+            handles = driver.window_handles
+            origins = self._visited_origins(driver, handles) if cdp else set()
+            if not cdp and getattr(driver, "supports_javascript", True):
+                driver.execute_script(STORAGE_CLEAR_SCRIPT)
+
+            driver.switch_to.new_window("tab")
+            fresh = driver.current_window_handle
+            for handle in handles:
+                if handle != fresh:
+                    driver.switch_to.window(handle)
+                    driver.close()
+            driver.switch_to.window(fresh)
+
+            driver.delete_all_cookies()
+            if cdp:
+                for origin in sorted(origins):
+                    driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                           {"origin": origin, "storageTypes": "all"})
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+
+            driver.get(self.BLANK_PAGE)
+            return True
+        except WebDriverException as e:
+            self.logger.debug(f"Driver reset failed: {e}")
+            return False
+
+    @staticmethod
+    def _visited_origins(driver: WebDriver, handles: List[str]) -> Set[str]:
+        """Origins in the navigation history of the given windows of a Chrome driver."""
+        origins = set()
+        for handle in handles:
+            driver.switch_to.window(handle)
+            history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+            for entry in history.get("entries", []):
+                parts = urlsplit(entry.get("url", ""))
+                if parts.scheme in ("http", "https"):
+                    origins.add(f"{parts.scheme}://{parts.netloc}")
+        return origins
+
+    @staticmethod
+    def is_healthy(driver: WebDriver) -> bool:
+        """Check that the driver session is still responsive."""
+        try:
+            return driver.execute_script("return 1;") == 1
+        except WebDriverException:
+            return False
+
+    def _launch(self) -> WebDriver:
+        driver = self.factory()
+        self.launched += 1
+        return driver
+
+    def _replace(self, driver: WebDriver) -> None:
+        self._discard(driver)
+        replacement = self._launch()
+        with self._lock:
+            self._idle.append(replacement)
+
+    def _discard(self, driver: WebDriver) -> None:
+        self.recycled += 1
+        self._quit(driver)
+
+    def _quit(self, driver: WebDriver) -> None:
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            self.logger.debug(f"Error while quitting driver: {e}")
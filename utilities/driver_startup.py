@@ -0,0 +1,247 @@
+import json
+import os
+import threading
+import weakref
+from typing import Any, Dict, List, NamedTuple, Optional, Set
+import selenium
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+from config.config import Config
+from utilities.logger import get_logger
+
+
+# Firefox installations Selenium Manager may not find on its own (snap packages)
+FIREFOX_BINARY_PATHS = [
+    "/snap/firefox/current/usr/lib/firefox/firefox",  # Snap package actual binary
+    "/snap/bin/firefox",  # Snap wrapper
+    "/usr/bin/firefox-esr",  # ESR installation
+    "/usr/lib/firefox/firefox",  # Standard installation
+]
+
+STARTUP_PHASES = ("resolve", "spawn", "session", "first_navigation")
+
+
+class ResolvedBinaries(NamedTuple):
+    """Driver and browser executables of one browser."""
+
+    driver_path: str
+    browser_path: str
+
+
+class BinaryCache:
+    """
+    Resolves driver and browser binaries once and persists them across runs.
+
+    Lookups hit an in-process dict first, then the cache file; Selenium
+    Manager only runs when neither has a usable entry, i.e. the cached
+    files are gone or Selenium was upgraded. A cached driver that no longer
+    matches an updated browser is invalidated by the caller.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Args:
+            path: JSON cache file (defaults to Config.DRIVER_CACHE_FILE)
+        """
+        self.path = path or Config.DRIVER_CACHE_FILE
+        self.logger = get_logger(self.__class__.__name__)
+        self._resolved: Dict[str, ResolvedBinaries] = {}
+        self._trusted: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def is_resolved(self, browser: str) -> bool:
+        """Whether the browser's binaries were already resolved in this process."""
+        return browser in self._resolved
+
+    def resolve(self, browser: str, options: ArgOptions) -> ResolvedBinaries:
+        """
+        Resolve the binaries of a browser and set the browser path on options.
+
+        Args:
+            browser: 'chrome' or 'firefox'
+            options: Options of the session to start
+
+        Returns:
+            Driver and browser paths
+        """
+        with self._lock:
+            binaries = self._resolved.get(browser) or self._load(browser)
+            if binaries is None:
+                binaries = self._discover(browser, options)
+                self._trusted.add(browser)
+                self._save(browser, binaries)
+            self._resolved[browser] = binaries
+        if binaries.browser_path and not getattr(options, "binary_location", ""):
+            options.binary_location = binaries.browser_path
+        return binaries
+
+    def confirm(self, browser: str) -> None:
+        """Mark the binaries of a browser as working once a session was created with them."""
+        self._trusted.add(browser)
+
+    def invalidate(self, browser: str) -> bool:
+        """
+        Forget the cached binaries of a browser, e.g. after the browser updated itself.
+
+        Returns:
+            True if the binaries were dropped, False if Selenium Manager resolved
+            them in this process or a session already started with them, so
+            resolving again would not help
+        """
+        with self._lock:
+            if browser in self._trusted:
+                return False
+            self._resolved.pop(browser, None)
+            cache = self._read()
+            if cache.pop(browser, None) is not None:
+                self._write(cache)
+        self.logger.info(f"Dropped cached {browser} binaries")
+        return True
+
+    def _discover(self, browser: str, options: ArgOptions) -> ResolvedBinaries:
+        if browser == "firefox" and not options.binary_location:
+            options.binary_location = next(
+                (path for path in FIREFOX_BINARY_PATHS if os.path.exists(path)), ""
+            )
+        self.logger.info(f"Resolving {browser} driver and browser binaries with Selenium Manager")
+        driver_path = SeleniumManager().driver_location(options)
+        return ResolvedBinaries(driver_path, getattr(options, "binary_location", "") or "")
+
+    def _read(self) -> Dict[str, Any]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _load(self, browser: str) -> Optional[ResolvedBinaries]:
+        entry = self._read().get(browser)
+        if not entry or entry.get("selenium") != selenium.__version__:
+            return None
+        binaries = ResolvedBinaries(entry["driver_path"], entry.get("browser_path", ""))
+        if not os.path.isfile(binaries.driver_path):
+            return None
+        if binaries.browser_path and not os.path.exists(binaries.browser_path):
+            return None
+        return binaries
+
+    def _save(self, browser: str, binaries: ResolvedBinaries) -> None:
+        cache = self._read()
+        cache[browser] = dict(binaries._asdict(), selenium=selenium.__version__)
+        self._write(cache)
+
+    def _write(self, cache: Dict[str, Any]) -> None:
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Could not write driver cache {self.path}: {e}")
+
+
+class StartupRecord(NamedTuple):
+    """Time spent in each phase of one browser startup, in seconds."""
+
+    browser: str
+    warm: bool
+    resolve: float
+    spawn: float
+    session: float
+    first_navigation: float
+
+
+class StartupStats:
+    """Collects the startup breakdown of every browser launched by this process."""
+
+    def __init__(self):
+        self.records: List[StartupRecord] = []
+        self._lock = threading.Lock()
+        self._first_navigation = weakref.WeakKeyDictionary()
+
+    def record(self, record: StartupRecord, driver=None) -> None:
+        """
+        Add the startup record of a launch.
+
+        Args:
+            record: Startup breakdown
+            driver: Launched driver whose first page load completes the record
+        """
+        with self._lock:
+            self.records.append(record)
+            if driver is not None:
+                self._first_navigation[driver] = record
+
+    def record_navigation(self, driver, duration: float) -> None:
+        """Complete the startup record of a driver with its first page load; later loads are ignored."""
+        if not self._first_navigation:
+            return
+        with self._lock:
+            record = self._first_navigation.pop(driver, None)
+            if record is None:
+                return
+            index = next((i for i, r in enumerate(self.records) if r is record), None)
+            if index is not None:
+                self.records[index] = record._replace(first_navigation=duration)
+
+    def summarize(self) -> Dict[str, Dict[str, float]]:
+        """
+        Total startup time per phase for cold and warm launches.
+
+        Returns:
+            {"cold" | "warm": {"launches", "resolve", "spawn", "session", "first_navigation"}}
+        """
+        summary = {}
+        for record in self.records:
+            kind = "warm" if record.warm else "cold"
+            totals = summary.setdefault(kind, dict.fromkeys(("launches",) + STARTUP_PHASES, 0.0))
+            totals["launches"] += 1
+            for phase in STARTUP_PHASES:
+                totals[phase] += getattr(record, phase)
+        return summary
+
+
+def merge_startup_summaries(summaries: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """Merge StartupStats.summarize results from several workers."""
+    merged = {}
+    for summary in summaries:
+        for kind, totals in summary.items():
+            target = merged.setdefault(kind, dict.fromkeys(("launches",) + STARTUP_PHASES, 0.0))
+            for key, value in totals.items():
+                target[key] += value
+    return merged
+
+
+def format_startup_summary(summary: Dict[str, Dict[str, float]]) -> List[str]:
+    """Describe the average startup breakdown of cold and warm launches."""
+    lines = []
+    for kind in ("cold", "warm"):
+        totals = summary.get(kind)
+        if not totals or not totals["launches"]:
+            continue
+        launches = int(totals["launches"])
+        phases = ", ".join(
+            f"{phase.replace('_', ' ')} {totals[phase] / launches:.2f}s" for phase in STARTUP_PHASES
+        )
+        total = sum(totals[phase] for phase in STARTUP_PHASES) / launches
+        lines.append(f"Driver startup ({kind}, {launches} launch(es)): {total:.2f}s average ({phases})")
+    return lines
+
+
+_binary_cache: Optional[BinaryCache] = None
+_startup_stats = StartupStats()
+
+
+def get_binary_cache() -> BinaryCache:
+    """Return the process-wide binary cache, created on first use."""
+    global _binary_cache
+    if _binary_cache is None:
+        _binary_cache = BinaryCache()
+    return _binary_cache
+
+
+def get_startup_stats() -> StartupStats:
+    """Return the process-wide startup statistics."""
+    return _startup_stats
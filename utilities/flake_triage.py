@@ -0,0 +1,334 @@
+import json
+import os
+from collections import Counter
+from typing import Any, Dict, List, Optional
+import urllib3
+from selenium.common.exceptions import (
+    InvalidArgumentException, InvalidSelectorException, JavascriptException,
+    NoSuchElementException, StaleElementReferenceException, TimeoutException,
+    WebDriverException
+)
+from config.config import Config
+from utilities.logger import get_logger
+
+
+# Failure categories worth retrying; any other failure fails the test at once
+RETRYABLE = ("timeout", "stale_element", "webdriver")
+
+# WebDriver errors that fail the same way on every attempt
+DETERMINISTIC_ERRORS = (InvalidArgumentException, InvalidSelectorException,
+                        JavascriptException, NoSuchElementException)
+
+# Outcomes kept in the flakiness database
+PASSED, FLAKY, FAILED, BROKEN = "passed", "flaky", "failed", "broken"
+
+# A test whose last runs all failed despite retries is not retried any more
+BROKEN_STREAK = 3
+
+
+def classify_failure(error: Optional[BaseException]) -> str:
+    """
+    Failure category of an exception.
+
+    Returns:
+        "timeout", "stale_element", "webdriver" or "other"
+    """
+    if error is None or isinstance(error, DETERMINISTIC_ERRORS):
+        return "other"
+    if isinstance(error, (TimeoutException, TimeoutError, urllib3.exceptions.TimeoutError)):
+        return "timeout"
+    if isinstance(error, StaleElementReferenceException):
+        return "stale_element"
+    # Lost connections to the driver service surface as urllib3 or socket errors
+    if isinstance(error, (WebDriverException, ConnectionError, urllib3.exceptions.HTTPError)):
+        return "webdriver"
+    return "other"
+
+
+class FlakeStore:
+    """
+    Outcome history of every test persisted across runs: the flakiness database.
+
+    Each test keeps its last ``history`` outcomes, "passed", "flaky" (passed
+    on a retry), "failed" (not retried) or "broken" (failed every retry),
+    and counts of the failure categories it has hit.
+    """
+
+    def __init__(self, path: str = None, history: int = None):
+        """
+        Args:
+            path: JSON file (defaults to Config.FLAKE_DB_FILE)
+            history: Number of outcomes kept per test (defaults to Config.FLAKE_HISTORY)
+        """
+        self.path = path or Config.FLAKE_DB_FILE
+        self.history = history or Config.FLAKE_HISTORY
+        self.tests: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path) as f:
+                    self.tests = json.load(f)
+            except (OSError, ValueError):
+                self.tests = {}
+
+    def outcomes(self, nodeid: str) -> List[str]:
+        """Recorded outcomes of a test, oldest first."""
+        return self.tests.get(nodeid, {}).get("outcomes", [])
+
+    def flake_rate(self, nodeid: str) -> float:
+        """Share of a test's recorded runs that only passed on a retry."""
+        outcomes = self.outcomes(nodeid)
+        return outcomes.count(FLAKY) / len(outcomes) if outcomes else 0.0
+
+    def is_quarantined(self, nodeid: str, rate: float, min_runs: int) -> bool:
+        """Whether a test was flaky in at least `rate` of at least `min_runs` recorded runs."""
+        return bool(rate) and len(self.outcomes(nodeid)) >= min_runs and self.flake_rate(nodeid) >= rate
+
+    def retries(self, nodeid: str, default: int) -> int:
+        """
+        Retry budget of a test.
+
+        Known flaky tests get one retry more than the default; tests whose
+        last BROKEN_STREAK runs failed every retry get none, since retrying
+        them only costs time.
+        """
+        if not default:
+            return 0
+        outcomes = self.outcomes(nodeid)
+        if len(outcomes) >= BROKEN_STREAK and set(outcomes[-BROKEN_STREAK:]) == {BROKEN}:
+            return 0
+        return default + 1 if FLAKY in outcomes else default
+
+    def update(self, results: Dict[str, Dict[str, Any]]) -> None:
+        """Append the outcomes of a run ({nodeid: {"outcome", "categories"}}) to the history."""
+        for nodeid, result in results.items():
+            entry = self.tests.setdefault(nodeid, {"outcomes": [], "categories": {}})
+            entry["outcomes"] = (entry["outcomes"] + [result["outcome"]])[-self.history:]
+            for category in result["categories"]:
+                entry["categories"][category] = entry["categories"].get(category, 0) + 1
+
+    def save(self) -> None:
+        """Write the store atomically."""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(dict(sorted(self.tests.items())), f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class FlakeTriage:
+    """
+    Runs tests with in-worker retries of flaky failures.
+
+    A test that fails in setup or call with a timeout, stale element or
+    other WebDriver error is run again in the same worker, up to its retry
+    budget from the flakiness database; assertion errors and deterministic
+    WebDriver errors fail at once. Only the test's function-scoped fixtures
+    are torn down before a retry; class, module and session fixtures stay up
+    until the final attempt. The driver fixture resets a pooled driver
+    between attempts and replaces it after WebDriver errors. Failed
+    attempts are reported with the "rerun" outcome. Once the worker has
+    spent Config.RETRY_BUDGET retries, failures are no longer retried, so a
+    broken site fails fast instead of doubling the run.
+
+    Quarantined tests, flaky in at least Config.QUARANTINE_RATE of their
+    recent runs, have retryable failures reported as xfail.
+    """
+
+    def __init__(self, store: FlakeStore = None, retries: int = None, budget: int = None,
+                 quarantine_rate: float = None):
+        """
+        Args:
+            store: Flakiness database (defaults to a FlakeStore at Config.FLAKE_DB_FILE)
+            retries: Default retries per test, 0 disables retries (defaults to Config.RETRIES)
+            budget: Retries this worker may spend in total (defaults to Config.RETRY_BUDGET)
+            quarantine_rate: Flake rate that quarantines a test, 0 for none
+        """
+        self.store = store or FlakeStore()
+        self.retries = Config.RETRIES if retries is None else retries
+        self.budget = Config.RETRY_BUDGET if budget is None else budget
+        self.quarantine_rate = Config.QUARANTINE_RATE if quarantine_rate is None else quarantine_rate
+        self.logger = get_logger(self.__class__.__name__)
+        self._failures: Dict[str, str] = {}
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.spent = 0
+        self.retry_seconds = 0.0
+        self.retried_categories: Counter = Counter()
+        self.quarantined = 0
+        self.not_retried = 0
+
+    def record_failure(self, nodeid: str, error: Optional[BaseException]) -> str:
+        """
+        Classify the setup or call failure of the running attempt.
+
+        Returns:
+            Failure category
+        """
+        category = classify_failure(error)
+        self._failures[nodeid] = category
+        return category
+
+    def failure_category(self, nodeid: str) -> Optional[str]:
+        """Failure category of the running attempt of a test, or None if it has not failed."""
+        return self._failures.get(nodeid)
+
+    def run(self, item, nextitem) -> None:
+        """Run a test's setup, call and teardown, retrying flaky failures, and log its reports."""
+        nodeid = item.nodeid
+        allowed = self.store.retries(nodeid, self.retries)
+        categories = []
+        attempt = 0
+        while True:
+            self._failures.pop(nodeid, None)
+            reports = self._setup_and_call(item)
+            category = self._failures.get(nodeid)
+            failed = any(report.failed for report in reports)
+            retry = False
+            if failed:
+                category = category or "other"
+                categories.append(category)
+                retry = category in RETRYABLE and attempt < allowed
+                if retry and self.spent >= self.budget:
+                    self.not_retried += 1
+                    retry = False
+            # Only the final attempt tears down towards the next test; a retry
+            # keeps the fixtures above function scope
+            reports.append(self._teardown(item, item.parent if retry else nextitem))
+            self._failures.pop(nodeid, None)
+            if attempt:
+                self.retry_seconds += sum(report.duration for report in reports)
+            if not retry:
+                break
+            self.spent += 1
+            self.retried_categories[category] += 1
+            attempt += 1
+            self.logger.info(f"Retrying {nodeid} after a {category} failure "
+                             f"(attempt {attempt + 1} of {allowed + 1})")
+            self._log_rerun(item, reports)
+
+        if failed and category in RETRYABLE and self.store.is_quarantined(
+                nodeid, self.quarantine_rate, Config.QUARANTINE_MIN_RUNS):
+            self._quarantine(nodeid, reports)
+        for report in reports:
+            item.ihook.pytest_runtest_logreport(report=report)
+
+        if not failed and any(report.skipped for report in reports):
+            return
+        if not failed:
+            outcome = FLAKY if attempt else PASSED
+        else:
+            outcome = BROKEN if attempt else FAILED
+        self.results[nodeid] = {"outcome": outcome, "categories": categories}
+
+    def summarize(self) -> Dict[str, Any]:
+        """
+        Retries spent by this process and the outcomes for the flakiness database.
+
+        Returns:
+            {"retries", "retry_seconds", "categories", "quarantined", "not_retried", "results"}
+        """
+        return {
+            "retries": self.spent,
+            "retry_seconds": self.retry_seconds,
+            "categories": dict(self.retried_categories),
+            "quarantined": self.quarantined,
+            "not_retried": self.not_retried,
+            "results": self.results,
+        }
+
+    @staticmethod
+    def _setup_and_call(item) -> List:
+        """Run a test's setup and, if it passed, its call, as runtestprotocol does."""
+        runner = item.config.pluginmanager.get_plugin("runner")
+        if hasattr(item, "_request") and not item._request:
+            # The request of the previous attempt was cleared by its teardown
+            item._initrequest()
+        reports = [runner.call_and_report(item, "setup", log=False)]
+        if reports[0].passed:
+            if item.config.getoption("setupshow", False):
+                runner.show_test_item(item)
+            if not item.config.getoption("setuponly", False):
+                reports.append(runner.call_and_report(item, "call", log=False))
+        return reports
+
+    @staticmethod
+    def _teardown(item, nextitem):
+        """
+        Tear a test down up to the nodes nextitem shares with it.
+
+        Passing the test's parent tears down its function-scoped fixtures only.
+        """
+        runner = item.config.pluginmanager.get_plugin("runner")
+        report = runner.call_and_report(item, "teardown", log=False, nextitem=nextitem)
+        if hasattr(item, "_request"):
+            item._request = False
+            item.funcargs = None
+        return report
+
+    def _log_rerun(self, item, reports) -> None:
+        for report in reports:
+            if report.when != "teardown" and report.failed:
+                report.outcome = "rerun"
+                item.ihook.pytest_runtest_logreport(report=report)
+                return
+            item.ihook.pytest_runtest_logreport(report=report)
+
+    def _quarantine(self, nodeid: str, reports) -> None:
+        rate = self.store.flake_rate(nodeid)
+        for report in reports:
+            if report.when != "teardown" and report.failed:
+                report.outcome = "skipped"
+                report.wasxfail = f"quarantined, flaky in {rate:.0%} of recent runs"
+        self.quarantined += 1
+
+
+def merge_retry_summaries(summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge FlakeTriage.summarize results from several workers."""
+    merged = {"retries": 0, "retry_seconds": 0.0, "categories": Counter(),
+              "quarantined": 0, "not_retried": 0, "results": {}}
+    for summary in summaries:
+        for key in ("retries", "retry_seconds", "quarantined", "not_retried"):
+            merged[key] += summary[key]
+        merged["categories"].update(summary["categories"])
+        merged["results"].update(summary["results"])
+    merged["categories"] = dict(merged["categories"])
+    return merged
+
+
+def format_retry_summary(summary: Dict[str, Any], suite_seconds: float, failures: int) -> List[str]:
+    """
+    Describe the retries of a run and the time they cost against the suite rerun they avoided.
+
+    Args:
+        summary: Merged retry summary
+        suite_seconds: Test time of the run without retries, i.e. what a rerun would cost
+        failures: Number of failures left after retries
+    """
+    if not (summary["retries"] or summary["quarantined"] or summary["not_retried"]):
+        return []
+    outcomes = Counter(result["outcome"] for result in summary["results"].values())
+    categories = ", ".join(f"{category} {count}"
+                           for category, count in sorted(summary["categories"].items()))
+    lines = [f"Retries: {summary['retries']} attempt(s) retried ({categories or 'none'}), "
+             f"{outcomes[FLAKY]} test(s) passed on a retry, {outcomes[BROKEN]} failed every retry"]
+    if outcomes[FLAKY] and not failures:
+        saved = f"saved a {suite_seconds:.1f}s rerun of the suite"
+    elif failures:
+        saved = f"saved nothing, {failures} failure(s) still need a rerun"
+    else:
+        saved = "saved nothing"
+    lines.append(f"Retry time: {summary['retry_seconds']:.1f}s spent, {saved}")
+    if summary["quarantined"]:
+        lines.append(f"Quarantined: {summary['quarantined']} flaky failure(s) reported as xfail")
+    if summary["not_retried"]:
+        lines.append(f"Retry budget spent: {summary['not_retried']} flaky failure(s) not retried")
+    return lines
+
+
+_triage: Optional[FlakeTriage] = None
+
+
+def get_flake_triage() -> FlakeTriage:
+    """Return the process-wide flake triage, created on first use."""
+    global _triage
+    if _triage is None:
+        _triage = FlakeTriage()
+    return _triage
@@ -1,8 +1,33 @@
 import os
+import csv
 import json
+import threading
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple
 from config.config import Config
+from utilities.data_pool import get_data_pool
+
+
+# Record schemas of the test data: field name -> expected type. Extra fields are allowed.
+SCHEMAS: Dict[str, Dict[str, type]] = {
+    "passenger": {"name": str, "address": str, "city": str, "state": str, "zip_code": str},
+    "payment": {"card_type": str, "card_number": str, "month": str, "year": str, "name_on_card": str},
+    "flight": {"flight": str, "price": str, "airline": str, "from_port": str, "to_port": str},
+    "route": {"departure": str, "destination": str},
+}
+
+# Top-level blocks of JSON test data files and the schema they follow.
+# Collections map record names to records, e.g. "routes" -> {"paris_to_berlin": {...}}.
+BLOCK_SCHEMAS = {"passenger": "passenger", "payment": "payment", "flight": "flight"}
+COLLECTION_SCHEMAS = {"routes": "route"}
+
+# Parsed JSON test data per path, with the modification time it was read at
+_data_cache: Dict[str, Tuple[int, Any]] = {}
+_data_cache_lock = threading.Lock()
+
+
+class InvalidTestDataError(ValueError):
+    """Raised when test data does not match its declared schema."""
 
 
 def take_screenshot(driver, name: str) -> str:
@@ -28,32 +53,202 @@ def load_test_data(filename: str) -> Dict[str, Any]:
     """
     Load test data from a JSON file.
 
+    Each file is parsed and validated once per process; later calls return
+    the same object until the file's modification time changes, so treat
+    the result as read-only and copy it before changing values.
+
     Args:
         filename: Name of the JSON file in test_data directory
 
     Returns:
         Dictionary containing the test data
+
+    Raises:
+        InvalidTestDataError: If a block does not match its schema
     """
     filepath = os.path.join(Config.TEST_DATA_DIR, filename)
-    with open(filepath, "r") as f:
-        return json.load(f)
+    mtime = os.stat(filepath).st_mtime_ns
+    cached = _data_cache.get(filepath)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with _data_cache_lock:
+        cached = _data_cache.get(filepath)
+        if cached is None or cached[0] != mtime:
+            with open(filepath, "r") as f:
+                data = json.load(f)
+            validate_test_data(data, filename)
+            cached = _data_cache[filepath] = (mtime, data)
+    return cached[1]
+
+
+def validate_test_data(data: Dict[str, Any], source: str = "test data") -> None:
+    """
+    Check the known blocks of a test data file against their schemas.
+
+    Args:
+        data: Parsed test data
+        source: Name used in error messages
+
+    Raises:
+        InvalidTestDataError: If a block does not match its schema
+    """
+    if not isinstance(data, dict):
+        raise InvalidTestDataError(f"{source}: expected a JSON object, got {type(data).__name__}")
+    for block, schema in BLOCK_SCHEMAS.items():
+        if block in data:
+            validate_record(data[block], schema, f"{source}: {block}")
+    for block, schema in COLLECTION_SCHEMAS.items():
+        if block not in data:
+            continue
+        if not isinstance(data[block], dict):
+            raise InvalidTestDataError(f"{source}: {block} must map names to records")
+        for name, record in data[block].items():
+            validate_record(record, schema, f"{source}: {block}.{name}")
+
+
+def validate_record(record: Any, schema: str, source: str = "record") -> Dict[str, Any]:
+    """
+    Check that a record has every field of a schema with the expected type.
+
+    Args:
+        record: Record to check
+        schema: Schema name in SCHEMAS, e.g. "passenger"
+        source: Name used in error messages
+
+    Returns:
+        The record, for use in generator expressions
+
+    Raises:
+        InvalidTestDataError: If a field is missing, has the wrong type or is empty
+    """
+    if not isinstance(record, dict):
+        raise InvalidTestDataError(f"{source}: expected a {schema} object, got {type(record).__name__}")
+    errors = []
+    for field, expected in SCHEMAS[schema].items():
+        if field not in record:
+            errors.append(f"missing '{field}'")
+        elif not isinstance(record[field], expected):
+            errors.append(f"'{field}' should be {expected.__name__}, got {type(record[field]).__name__}")
+        elif expected is str and not record[field].strip():
+            errors.append(f"'{field}' is empty")
+    if errors:
+        raise InvalidTestDataError(f"{source}: invalid {schema}: {', '.join(errors)}")
+    return record
+
+
+class DataRecordRef(NamedTuple):
+    """
+    Location of one record in a JSONL or CSV dataset.
+
+    Parametrizing tests with references instead of records keeps only
+    file offsets in memory; the record is read when the test runs.
+    """
+
+    path: str
+    offset: int
+    line: int
+    schema: Optional[str] = None
+    header: Optional[Tuple[str, ...]] = None
+
+    @property
+    def id(self) -> str:
+        """Test ID of the record: dataset name and line number."""
+        return f"{os.path.splitext(os.path.basename(self.path))[0]}:{self.line}"
+
+    def load(self) -> Dict[str, Any]:
+        """Read and validate the referenced record."""
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            raw = f.readline().decode("utf-8")
+        record = _parse_record(raw, self.header, f"{self.path}:{self.line}")
+        if self.schema:
+            validate_record(record, self.schema, f"{self.path}:{self.line}")
+        return record
+
+
+def iter_data_refs(filename: str, schema: str = None, limit: int = None) -> Iterator[DataRecordRef]:
+    """
+    Scan a JSONL or CSV dataset for record offsets without parsing the records.
+
+    CSV files need a header row and one record per line.
+
+    Args:
+        filename: Dataset file in the test_data directory
+        schema: Schema name the records are validated against when loaded
+        limit: Stop after this many records
+
+    Yields:
+        A reference per non-blank record line
+    """
+    path = os.path.join(Config.TEST_DATA_DIR, filename)
+    _dataset_format(path)
+    header = None
+    count = 0
+    with open(path, "rb") as f:
+        if path.endswith(".csv"):
+            header = tuple(next(csv.reader([f.readline().decode("utf-8-sig")]), []))
+        line = 1 if header else 0
+        while limit is None or count < limit:
+            offset = f.tell()
+            raw = f.readline()
+            if not raw:
+                break
+            line += 1
+            if raw.strip():
+                count += 1
+                yield DataRecordRef(path, offset, line, schema, header)
+
+
+def stream_test_data(filename: str, schema: str = None, limit: int = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily read the records of a JSONL or CSV dataset, one line at a time.
+
+    Args:
+        filename: Dataset file in the test_data directory
+        schema: Schema name to validate each record against
+        limit: Stop after this many records
+
+    Yields:
+        One dict per record
+    """
+    path = os.path.join(Config.TEST_DATA_DIR, filename)
+    is_csv = _dataset_format(path) == "csv"
+    with open(path, "r", encoding="utf-8-sig" if is_csv else "utf-8", newline="") as f:
+        records = csv.DictReader(f) if is_csv else (
+            _parse_record(raw, None, f"{path}:{line}")
+            for line, raw in enumerate(f, start=1) if raw.strip()
+        )
+        for count, record in enumerate(records):
+            if limit is not None and count >= limit:
+                return
+            if schema:
+                validate_record(record, schema, f"{path}: record {count + 1}")
+            yield record
+
+
+def _dataset_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in (".jsonl", ".csv"):
+        raise ValueError(f"Unsupported dataset format: {path} (use .jsonl or .csv)")
+    return extension[1:]
+
+
+def _parse_record(raw: str, header: Optional[Tuple[str, ...]], source: str) -> Dict[str, Any]:
+    if header is not None:
+        values = next(csv.reader([raw]), [])
+        return dict(zip(header, values))
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError as e:
+        raise InvalidTestDataError(f"{source}: invalid JSON: {e}")
 
 
 def generate_random_email() -> str:
-    """Generate a random email address for testing."""
-    from faker import Faker
-    fake = Faker()
-    return fake.email()
+    """Generate a unique random email address for testing."""
+    return get_data_pool().next_record("user")["email"]
 
 
 def generate_random_user() -> Dict[str, str]:
     """Generate random user data for registration tests."""
-    from faker import Faker
-    fake = Faker()
-    return {
-        "first_name": fake.first_name(),
-        "last_name": fake.last_name(),
-        "email": fake.email(),
-        "telephone": fake.phone_number()[:15],
-        "password": fake.password(length=12)
-    }
+    return get_data_pool().next_record("user")
@@ -0,0 +1,309 @@
+import re
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+# Elements that never have content or an end tag
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+    "meta", "param", "source", "track", "wbr",
+}
+
+# Start tags that implicitly close an open element of the listed types
+IMPLIED_END_TAGS = {
+    "p": {"p"},
+    "li": {"li"},
+    "option": {"option"},
+    "tr": {"tr", "td", "th"},
+    "td": {"td", "th"},
+    "th": {"td", "th"},
+}
+
+# Elements rendered on their own line or cell, separated from adjacent text
+BLOCK_ELEMENTS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "fieldset", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+    "hr", "li", "nav", "ol", "p", "pre", "section", "table", "tbody", "td",
+    "tfoot", "th", "thead", "tr", "ul",
+}
+
+# Elements whose text is never rendered
+HIDDEN_ELEMENTS = {"head", "title", "script", "style", "template", "noscript"}
+
+
+class Node:
+    """An element of a parsed HTML document."""
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: Optional["Node"] = None):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children: List["Node"] = []
+        # Live form state, initialized from the markup
+        self.value = attrs.get("value", "")
+        self.checked = "checked" in attrs
+        self.selected = "selected" in attrs
+
+    @property
+    def element_children(self) -> List["Node"]:
+        return [child for child in self.children if isinstance(child, Node)]
+
+    def iter(self) -> Iterator["Node"]:
+        """Iterate over this element's descendants in document order."""
+        for child in self.children:
+            if isinstance(child, Node):
+                yield child
+                yield from child.iter()
+
+    def text_content(self) -> str:
+        """Concatenated text of this element and its descendants."""
+        return "".join(
+            child if isinstance(child, str) else child.text_content()
+            for child in self.children
+        )
+
+    def rendered_text(self) -> str:
+        """Approximation of the visible text, with whitespace collapsed."""
+        if self.tag in HIDDEN_ELEMENTS or not self.is_displayed():
+            return ""
+        parts = []
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(child)
+            elif child.tag in BLOCK_ELEMENTS:
+                parts.append(f" {child.rendered_text()} ")
+            else:
+                parts.append(child.rendered_text())
+        return " ".join("".join(parts).split())
+
+    def is_displayed(self) -> bool:
+        """Whether the element would be rendered, judging by markup alone."""
+        node = self
+        while node is not None:
+            style = node.attrs.get("style", "").replace(" ", "").lower()
+            if (node.tag in HIDDEN_ELEMENTS or "hidden" in node.attrs or "display:none" in style
+                    or "visibility:hidden" in style):
+                return False
+            if node.tag == "input" and node.attrs.get("type", "").lower() == "hidden":
+                return False
+            node = node.parent
+        return True
+
+    def __repr__(self) -> str:
+        return f"<{self.tag} {self.attrs}>"
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document", {})
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        closes = IMPLIED_END_TAGS.get(tag, set())
+        while closes and self.stack[-1].tag in closes:
+            self.stack.pop()
+        node = Node(tag, {name: value if value is not None else "" for name, value in attrs},
+                    self.stack[-1])
+        self.stack[-1].children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS and self.stack[-1].tag == tag:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                del self.stack[index:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+def parse_html(markup: str) -> Node:
+    """Parse an HTML document into a tree of Nodes."""
+    builder = _TreeBuilder()
+    builder.feed(markup)
+    builder.close()
+    for node in builder.root.iter():
+        if node.tag == "textarea":
+            node.value = node.text_content()
+        elif node.tag == "select":
+            options = [option for option in node.iter() if option.tag == "option"]
+            for option in options:
+                if "value" not in option.attrs:
+                    option.value = " ".join(option.text_content().split())
+            if options and not any(option.selected for option in options) and "multiple" not in node.attrs:
+                options[0].selected = True
+    return builder.root
+
+
+# CSS selector support: compound selectors joined by descendant or child
+# combinators, with tag, #id, .class, [attr], [attr op value] and the
+# :nth-child, :nth-of-type, :first-child, :first-of-type, :last-child pseudo-classes
+_TOKEN = re.compile(r"""
+    \s*(?P<combinator>>)\s*
+  | (?P<space>\s+)
+  | (?P<tag>\*|[a-zA-Z][\w-]*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[~^$*|]?=)\s*(?P<val>"[^"]*"|'[^']*'|[^\]\s]+)\s*)?\]
+  | :(?P<pseudo>[\w-]+)(?:\(\s*(?P<arg>[^)]*)\s*\))?
+""", re.VERBOSE)
+
+_ATTRIBUTE_OPERATORS: Dict[str, Callable[[str, str], bool]] = {
+    "=": lambda actual, expected: actual == expected,
+    "~=": lambda actual, expected: expected in actual.split(),
+    "^=": lambda actual, expected: actual.startswith(expected),
+    "$=": lambda actual, expected: actual.endswith(expected),
+    "*=": lambda actual, expected: expected in actual,
+    "|=": lambda actual, expected: actual == expected or actual.startswith(expected + "-"),
+}
+
+
+class InvalidSelector(ValueError):
+    """Raised for selectors outside the supported subset."""
+
+
+def _nth_matches(position: int, argument: str) -> bool:
+    argument = argument.strip().lower()
+    if argument == "odd":
+        return position % 2 == 1
+    if argument == "even":
+        return position % 2 == 0
+    try:
+        return position == int(argument)
+    except ValueError:
+        raise InvalidSelector(f"Unsupported nth argument: {argument}")
+
+
+def _compile_compound(tokens: List[re.Match]) -> Callable[[Node], bool]:
+    checks: List[Callable[[Node], bool]] = []
+    for token in tokens:
+        if token.group("tag"):
+            tag = token.group("tag").lower()
+            if tag != "*":
+                checks.append(lambda node, tag=tag: node.tag == tag)
+        elif token.group("id"):
+            checks.append(lambda node, value=token.group("id"): node.attrs.get("id") == value)
+        elif token.group("cls"):
+            checks.append(lambda node, value=token.group("cls"):
+                          value in node.attrs.get("class", "").split())
+        elif token.group("attr"):
+            name, op, value = token.group("attr").lower(), token.group("op"), token.group("val")
+            if op is None:
+                checks.append(lambda node, name=name: name in node.attrs)
+            else:
+                if value[0] in "'\"":
+                    value = value[1:-1]
+                test = _ATTRIBUTE_OPERATORS[op]
+                checks.append(lambda node, name=name, value=value, test=test:
+                              name in node.attrs and test(node.attrs[name], value))
+        else:
+            pseudo, argument = token.group("pseudo").lower(), token.group("arg") or ""
+            checks.append(_compile_pseudo(pseudo, argument))
+    return lambda node: all(check(node) for check in checks)
+
+
+def _compile_pseudo(pseudo: str, argument: str) -> Callable[[Node], bool]:
+    def siblings(node: Node, same_type: bool) -> List[Node]:
+        if node.parent is None:
+            return [node]
+        return [s for s in node.parent.element_children if not same_type or s.tag == node.tag]
+
+    if pseudo == "nth-child":
+        return lambda node: _nth_matches(siblings(node, False).index(node) + 1, argument)
+    if pseudo == "nth-of-type":
+        return lambda node: _nth_matches(siblings(node, True).index(node) + 1, argument)
+    if pseudo == "first-child":
+        return lambda node: siblings(node, False)[0] is node
+    if pseudo == "first-of-type":
+        return lambda node: siblings(node, True)[0] is node
+    if pseudo == "last-child":
+        return lambda node: siblings(node, False)[-1] is node
+    if pseudo == "last-of-type":
+        return lambda node: siblings(node, True)[-1] is node
+    raise InvalidSelector(f"Unsupported pseudo-class: :{pseudo}")
+
+
+def _compile_complex(selector: str) -> Callable[[Node], bool]:
+    """Compile one selector (no commas) into a matcher(node, scope)."""
+    steps: List[tuple] = []
+    compound: List[re.Match] = []
+    combinator = " "
+    position = 0
+    selector = selector.strip()
+    while position < len(selector):
+        token = _TOKEN.match(selector, position)
+        if token is None or token.end() == position:
+            raise InvalidSelector(f"Unsupported selector: {selector}")
+        position = token.end()
+        if token.group("combinator") or token.group("space"):
+            if compound:
+                steps.append((combinator, _compile_compound(compound)))
+                compound = []
+            combinator = ">" if token.group("combinator") else " "
+            continue
+        compound.append(token)
+    if not compound:
+        raise InvalidSelector(f"Unsupported selector: {selector}")
+    steps.append((combinator, _compile_compound(compound)))
+
+    def matches(node: Node, index: int = len(steps) - 1) -> bool:
+        step_combinator, test = steps[index]
+        if not test(node):
+            return False
+        if index == 0:
+            return True
+        ancestor = node.parent
+        while ancestor is not None:
+            if matches(ancestor, index - 1):
+                return True
+            if step_combinator == ">":
+                return False
+            ancestor = ancestor.parent
+        return False
+
+    return matches
+
+
+def select(scope: Node, selector: str) -> List[Node]:
+    """
+    Find the descendants of scope matching a CSS selector, in document order.
+
+    As with querySelectorAll, ancestors outside scope may satisfy the
+    selector's combinators.
+
+    Raises:
+        InvalidSelector: If the selector is outside the supported subset
+    """
+    matchers = [_compile_complex(part) for part in selector.split(",")]
+    return [node for node in scope.iter() if any(m(node) for m in matchers)]
+
+
+# XPath support is limited to the expressions Selenium's Select helper emits
+_OPTION_XPATH = re.compile(
+    r"""^\.//option\[(?:normalize-space\(\.\)\s*=\s*|contains\(\.,\s*)(?P<q>["'])(?P<text>.*)(?P=q)\)?\]$"""
+)
+
+
+def select_xpath(scope: Node, expression: str) -> List[Node]:
+    """
+    Evaluate the option lookups used by Selenium's Select helper.
+
+    Raises:
+        InvalidSelector: For any other XPath expression
+    """
+    match = _OPTION_XPATH.match(expression.strip())
+    if match is None:
+        raise InvalidSelector(f"Unsupported XPath expression: {expression}")
+    text = match.group("text")
+    contains = "contains(" in expression
+    options = [node for node in scope.iter() if node.tag == "option"]
+    if contains:
+        return [node for node in options if text in node.text_content()]
+    return [node for node in options if " ".join(node.text_content().split()) == text]
@@ -0,0 +1,579 @@
+import gzip
+import http.client
+import os
+import threading
+import time
+import zlib
+from http.cookiejar import CookieJar
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlencode, urljoin, urlsplit, urlunsplit
+from urllib.request import Request
+from selenium.common.exceptions import (
+    InvalidSelectorException, JavascriptException, NoAlertPresentException,
+    NoSuchElementException, StaleElementReferenceException, WebDriverException
+)
+from selenium.webdriver.common.by import By
+from config.config import Config
+from utilities.html_dom import InvalidSelector, Node, parse_html, select, select_xpath
+from utilities.logger import get_logger
+
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 10
+
+# Input types that are never submitted as form fields, unless they are the submitter
+BUTTON_INPUT_TYPES = {"submit", "button", "image", "reset"}
+
+
+class PooledResponse(NamedTuple):
+    """A fully read HTTP response."""
+
+    status: int
+    headers: http.client.HTTPMessage
+    body: bytes
+    transferred: int
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of keep-alive HTTP connections, keyed by scheme, host and port.
+
+    Hosts under ``.localhost`` are connected to on the loopback interface,
+    as browsers do, while the original host is kept in the Host header.
+    Requests go through ``proxy`` ("host:port") when one is given.
+    """
+
+    def __init__(self, max_idle_per_host: int = 8, timeout: float = 30):
+        """
+        Args:
+            max_idle_per_host: Idle connections kept open per host
+            timeout: Socket timeout in seconds
+        """
+        self.max_idle_per_host = max_idle_per_host
+        self.timeout = timeout
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self.requests_sent = 0
+
+    def request(self, method: str, url: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None, proxy: str = "") -> PooledResponse:
+        """
+        Send a request over a pooled connection and read the whole response.
+
+        A request on a reused connection the server has meanwhile closed is
+        retried once on a fresh connection.
+        """
+        parts = urlsplit(url)
+        headers = dict(headers or {})
+        headers.setdefault("Host", parts.netloc)
+        if proxy:
+            host, _, port = proxy.rpartition(":")
+            key, target = ("http", host, int(port)), url
+        else:
+            default_port = 443 if parts.scheme == "https" else 80
+            key = (parts.scheme, parts.hostname, parts.port or default_port)
+            target = urlunsplit(("", "", parts.path or "/", parts.query, ""))
+
+        for attempt in range(2):
+            connection, reused = self._acquire(key)
+            try:
+                connection.request(method, target, body=body, headers=headers)
+                response = connection.getresponse()
+                raw = response.read()
+            except (http.client.HTTPException, ConnectionError) as e:
+                connection.close()
+                if reused and attempt == 0:
+                    continue
+                raise WebDriverException(f"{method} {url} failed: {e}")
+            except OSError as e:
+                connection.close()
+                raise WebDriverException(f"{method} {url} failed: {e}")
+            self.requests_sent += 1
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(key, connection)
+            return PooledResponse(response.status, response.headers,
+                                  self._decode(raw, response.headers), len(raw))
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def _acquire(self, key: Tuple[str, str, int]) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, host, port = key
+        if host == "localhost" or host.endswith(".localhost"):
+            host = "127.0.0.1"
+        connection_class = (http.client.HTTPSConnection if scheme == "https"
+                            else http.client.HTTPConnection)
+        self.connections_opened += 1
+        return connection_class(host, port, timeout=self.timeout), False
+
+    def _release(self, key: Tuple[str, str, int], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    @staticmethod
+    def _decode(raw: bytes, headers: http.client.HTTPMessage) -> bytes:
+        encoding = headers.get("Content-Encoding", "").lower()
+        if encoding == "gzip":
+            return gzip.decompress(raw)
+        if encoding == "deflate":
+            return zlib.decompress(raw)
+        return raw
+
+
+_connection_pool = ConnectionPool()
+
+
+def get_connection_pool() -> ConnectionPool:
+    """Return the process-wide connection pool shared by every HttpDriver."""
+    return _connection_pool
+
+
+class PageLoad(NamedTuple):
+    """Timing of the navigation that produced the current document."""
+
+    url: str
+    status: int
+    transferred: int
+    load_time: float
+
+
+class _CookieResponse:
+    """Adapts a PooledResponse to the interface CookieJar.extract_cookies expects."""
+
+    def __init__(self, headers: http.client.HTTPMessage):
+        self._headers = headers
+
+    def info(self) -> http.client.HTTPMessage:
+        return self._headers
+
+
+class HttpElement:
+    """
+    Element of a document loaded by HttpDriver.
+
+    Implements the WebElement methods the page objects and Selenium's Select
+    helper rely on, against the parsed HTML instead of a rendered page.
+    """
+
+    def __init__(self, driver: "HttpDriver", node: Node, document_id: int):
+        self._driver = driver
+        self._node = node
+        self._document_id = document_id
+
+    @property
+    def node(self) -> Node:
+        """The underlying DOM node; raises if the document has been replaced."""
+        if self._document_id != self._driver.document_id:
+            raise StaleElementReferenceException(f"<{self._node.tag}> belongs to a previous document")
+        return self._node
+
+    @property
+    def id(self) -> str:
+        return f"{self._document_id}:{id(self._node)}"
+
+    @property
+    def parent(self) -> "HttpDriver":
+        return self._driver
+
+    @property
+    def tag_name(self) -> str:
+        return self.node.tag
+
+    @property
+    def text(self) -> str:
+        return self.node.rendered_text()
+
+    def get_dom_attribute(self, name: str) -> Optional[str]:
+        """Get an attribute as written in the markup."""
+        return self.node.attrs.get(name.lower())
+
+    def get_property(self, name: str):
+        """Get the live value, checked or selected state, or fall back to the attribute."""
+        node = self.node
+        if name == "value":
+            return self._value(node)
+        if name == "checked":
+            return node.checked
+        if name == "selected":
+            return node.selected
+        if name in ("textContent", "innerText"):
+            return node.text_content() if name == "textContent" else node.rendered_text()
+        if name == "tagName":
+            return node.tag.upper()
+        return node.attrs.get(name.lower())
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """Get an attribute with the property-first semantics of WebElement.get_attribute."""
+        node = self.node
+        if name == "value" and node.tag in ("input", "select", "textarea", "option", "button"):
+            return self._value(node)
+        if name in ("checked", "selected"):
+            return "true" if getattr(node, name) else None
+        return node.attrs.get(name.lower())
+
+    def value_of_css_property(self, name: str) -> str:
+        """Only visibility can be judged without a renderer."""
+        if name == "display":
+            return "block" if self.node.is_displayed() else "none"
+        return ""
+
+    def is_displayed(self) -> bool:
+        return self.node.is_displayed()
+
+    def is_enabled(self) -> bool:
+        node = self.node
+        while node is not None:
+            if "disabled" in node.attrs and node.tag in ("input", "select", "textarea",
+                                                         "option", "button", "fieldset"):
+                return False
+            node = node.parent
+        return True
+
+    def is_selected(self) -> bool:
+        node = self.node
+        return node.selected if node.tag == "option" else node.checked
+
+    def clear(self) -> None:
+        self.node.value = ""
+
+    def send_keys(self, *value: str) -> None:
+        """Append text to the element's value; special keys are ignored."""
+        text = "".join(str(v) for v in value)
+        self.node.value += "".join(c for c in text if not "\ue000" <= c <= "\uf8ff")
+
+    def click(self) -> None:
+        """Select options, toggle checkboxes, submit forms and follow links."""
+        node = self.node
+        input_type = node.attrs.get("type", "").lower()
+        if node.tag == "option":
+            self._select_option(node)
+        elif node.tag == "input" and input_type in ("checkbox", "radio"):
+            self._toggle(node, input_type)
+        elif ((node.tag == "input" and input_type in ("submit", "image"))
+              or (node.tag == "button" and input_type in ("", "submit"))):
+            form = self._form_owner(node)
+            if form is not None:
+                self._driver._submit_form(form, submitter=node)
+        elif node.tag == "a" and "href" in node.attrs:
+            self._driver.get(urljoin(self._driver.current_url, node.attrs["href"]))
+
+    def submit(self) -> None:
+        """Submit the form this element belongs to."""
+        form = self.node if self.node.tag == "form" else self._form_owner(self.node)
+        if form is None:
+            raise WebDriverException("Element is not in a form")
+        self._driver._submit_form(form)
+
+    def find_element(self, by: str = By.ID, value: str = None) -> "HttpElement":
+        return self._driver._find(self.node, by, value, first=True)[0]
+
+    def find_elements(self, by: str = By.ID, value: str = None) -> List["HttpElement"]:
+        return self._driver._find(self.node, by, value, first=False)
+
+    @staticmethod
+    def _value(node: Node) -> str:
+        if node.tag == "select":
+            selected = [o for o in node.iter() if o.tag == "option" and o.selected]
+            return selected[0].value if selected else ""
+        return node.value
+
+    def _form_owner(self, node: Node) -> Optional[Node]:
+        form_id = node.attrs.get("form")
+        if form_id:
+            return next((n for n in self._driver._document.iter()
+                         if n.tag == "form" and n.attrs.get("id") == form_id), None)
+        ancestor = node.parent
+        while ancestor is not None and ancestor.tag != "form":
+            ancestor = ancestor.parent
+        return ancestor
+
+    @staticmethod
+    def _select_option(option: Node) -> None:
+        dropdown = option.parent
+        while dropdown is not None and dropdown.tag != "select":
+            dropdown = dropdown.parent
+        if dropdown is not None and "multiple" in dropdown.attrs:
+            option.selected = not option.selected
+            return
+        if dropdown is not None:
+            for other in dropdown.iter():
+                if other.tag == "option":
+                    other.selected = False
+        option.selected = True
+
+    def _toggle(self, node: Node, input_type: str) -> None:
+        if input_type == "checkbox":
+            node.checked = not node.checked
+            return
+        name = node.attrs.get("name")
+        form = self._form_owner(node)
+        for other in (form or self._driver._document).iter():
+            if other.tag == "input" and other.attrs.get("name") == name and other.attrs.get("type") == "radio":
+                other.checked = False
+        node.checked = True
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, HttpElement) and other._node is self._node
+
+    def __hash__(self) -> int:
+        return id(self._node)
+
+    def __repr__(self) -> str:
+        return f"<HttpElement {self._node!r}>"
+
+
+class _SwitchTo:
+    """Browserless documents never raise JavaScript alerts."""
+
+    @property
+    def alert(self):
+        raise NoAlertPresentException("The HTTP backend does not run JavaScript")
+
+    def window(self, handle: str) -> None:
+        """There is only ever the one window."""
+
+    def new_window(self, type_hint: str = None) -> None:
+        """The one window is kept; the driver has no history or storage to leave behind."""
+
+
+class HttpDriver:
+    """
+    Browserless stand-in for WebDriver that loads pages over HTTP and parses their HTML.
+
+    Supports the subset of the WebDriver API used by the page objects:
+    navigation, element lookup (id, name, tag, class, CSS, link text and
+    the XPath expressions of Selenium's Select helper), text and attribute
+    reads, typing, dropdown selection and form submission. Nothing is
+    rendered and no JavaScript runs, so documents only change when the
+    driver navigates. Connections come from a process-wide keep-alive pool
+    and cookies are kept per driver.
+    """
+
+    name = "http"
+    supports_javascript = False
+
+    def __init__(self, pool: ConnectionPool = None, proxy: str = None):
+        """
+        Args:
+            pool: Connection pool (defaults to the process-wide pool)
+            proxy: HTTP proxy "host:port" (defaults to Config.PROXY)
+        """
+        self.pool = pool or get_connection_pool()
+        self.proxy = Config.PROXY if proxy is None else proxy
+        self.cookies = CookieJar()
+        self.logger = get_logger(self.__class__.__name__)
+        self.document_id = 0
+        self.last_load: Optional[PageLoad] = None
+        self.switch_to = _SwitchTo()
+        self._url = "about:blank"
+        self._source = ""
+        self._document = parse_html("")
+
+    @property
+    def current_url(self) -> str:
+        return self._url
+
+    @property
+    def page_source(self) -> str:
+        return self._source
+
+    @property
+    def title(self) -> str:
+        title = next((node for node in self._document.iter() if node.tag == "title"), None)
+        return " ".join(title.text_content().split()) if title is not None else ""
+
+    @property
+    def window_handles(self) -> List[str]:
+        return ["http"]
+
+    @property
+    def current_window_handle(self) -> str:
+        return "http"
+
+    def get(self, url: str) -> None:
+        """Load a page."""
+        self._navigate("GET", url)
+
+    def refresh(self) -> None:
+        """Reload the current page."""
+        self._navigate("GET", self._url)
+
+    def submit(self, url: str, fields: Dict[str, str], method: str = "post") -> None:
+        """
+        Navigate by submitting form fields directly, as a browser form would.
+
+        Args:
+            url: Absolute form action URL
+            fields: Form field names and values
+            method: 'post' or 'get'
+        """
+        self._send_form(url, list(fields.items()), method)
+
+    def find_element(self, by: str = By.ID, value: str = None) -> HttpElement:
+        return self._find(self._document, by, value, first=True)[0]
+
+    def find_elements(self, by: str = By.ID, value: str = None) -> List[HttpElement]:
+        return self._find(self._document, by, value, first=False)
+
+    def execute_script(self, script: str, *args):
+        raise JavascriptException("The HTTP backend does not run JavaScript")
+
+    def execute_async_script(self, script: str, *args):
+        raise JavascriptException("The HTTP backend does not run JavaScript")
+
+    def get_cookies(self) -> List[Dict[str, str]]:
+        return [{"name": c.name, "value": c.value, "domain": c.domain, "path": c.path}
+                for c in self.cookies]
+
+    def delete_all_cookies(self) -> None:
+        self.cookies.clear()
+
+    def save_screenshot(self, filename: str) -> bool:
+        """
+        Save the page source next to the requested screenshot path.
+
+        Returns:
+            False, as no image can be taken without a browser
+        """
+        path = os.path.splitext(filename)[0] + ".html"
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self._source)
+        self.logger.info(f"No screenshot without a browser, saved page source to {path}")
+        return False
+
+    def implicitly_wait(self, time_to_wait: float) -> None:
+        pass
+
+    def set_page_load_timeout(self, time_to_wait: float) -> None:
+        pass
+
+    def maximize_window(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        """Forget the session state; pooled connections stay open for other drivers."""
+        self.cookies.clear()
+        self._url, self._source, self._document = "about:blank", "", parse_html("")
+        self.document_id += 1
+
+    def _find(self, scope: Node, by: str, value: str, first: bool) -> List[HttpElement]:
+        if by == By.ID:
+            nodes = (n for n in scope.iter() if n.attrs.get("id") == value)
+        elif by == By.NAME:
+            nodes = (n for n in scope.iter() if n.attrs.get("name") == value)
+        elif by == By.TAG_NAME:
+            nodes = (n for n in scope.iter() if n.tag == value.lower())
+        elif by == By.CLASS_NAME:
+            nodes = (n for n in scope.iter() if value in n.attrs.get("class", "").split())
+        elif by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+            exact = by == By.LINK_TEXT
+            nodes = (n for n in scope.iter() if n.tag == "a" and (
+                n.rendered_text() == value if exact else value in n.rendered_text()))
+        elif by in (By.CSS_SELECTOR, By.XPATH):
+            try:
+                nodes = select(scope, value) if by == By.CSS_SELECTOR else select_xpath(scope, value)
+            except InvalidSelector as e:
+                raise InvalidSelectorException(str(e))
+        else:
+            raise InvalidSelectorException(f"Unsupported locator strategy: {by}")
+
+        document_id = self.document_id
+        if first:
+            node = next(iter(nodes), None)
+            if node is None:
+                raise NoSuchElementException(f"Unable to locate element: {by}={value}")
+            return [HttpElement(self, node, document_id)]
+        return [HttpElement(self, node, document_id) for node in nodes]
+
+    def _submit_form(self, form: Node, submitter: Node = None) -> None:
+        form_id = form.attrs.get("id")
+        controls = list(form.iter())
+        if form_id:
+            controls += [n for n in self._document.iter()
+                         if n.attrs.get("form") == form_id and n not in controls]
+
+        fields = []
+        for node in controls:
+            name = node.attrs.get("name")
+            if not name or "disabled" in node.attrs:
+                continue
+            input_type = node.attrs.get("type", "text").lower()
+            if node.tag == "input":
+                if input_type in BUTTON_INPUT_TYPES:
+                    if node is submitter:
+                        fields.append((name, node.value))
+                elif input_type in ("checkbox", "radio"):
+                    if node.checked:
+                        fields.append((name, node.attrs.get("value", "on")))
+                else:
+                    fields.append((name, node.value))
+            elif node.tag == "select":
+                fields.extend((name, o.value) for o in node.iter() if o.tag == "option" and o.selected)
+            elif node.tag == "textarea":
+                fields.append((name, node.value))
+            elif node.tag == "button" and node is submitter:
+                fields.append((name, node.value))
+
+        action = urljoin(self._url, form.attrs.get("action", ""))
+        self._send_form(action, fields, form.attrs.get("method", "get"))
+
+    def _send_form(self, url: str, fields: List[Tuple[str, str]], method: str) -> None:
+        encoded = urlencode(fields)
+        if method.lower() == "post":
+            self._navigate("POST", url, encoded.encode(),
+                           {"Content-Type": "application/x-www-form-urlencoded"})
+        else:
+            parts = urlsplit(url)
+            self._navigate("GET", urlunsplit(parts._replace(query=encoded, fragment="")))
+
+    def _navigate(self, method: str, url: str, body: bytes = None,
+                  headers: Dict[str, str] = None) -> None:
+        self.logger.debug(f"{method} {url}")
+        start = time.monotonic()
+        transferred = 0
+        for _ in range(MAX_REDIRECTS + 1):
+            request_headers = {
+                "User-Agent": "selenium-pytest-framework (http backend)",
+                "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
+                "Accept-Encoding": "gzip, deflate",
+            }
+            request_headers.update(headers or {})
+            cookie_request = Request(url, headers=request_headers)
+            self.cookies.add_cookie_header(cookie_request)
+            request_headers.update(cookie_request.unredirected_hdrs)
+
+            response = self.pool.request(method, url, body, request_headers, self.proxy)
+            transferred += response.transferred
+            self.cookies.extract_cookies(_CookieResponse(response.headers), cookie_request)
+
+            location = response.headers.get("Location")
+            if response.status not in REDIRECT_STATUSES or not location:
+                break
+            url = urljoin(url, location)
+            if response.status in (301, 302, 303) and method != "GET":
+                method, body, headers = "GET", None, None
+        else:
+            raise WebDriverException(f"Too many redirects loading {url}")
+
+        charset = response.headers.get_content_charset() or "utf-8"
+        self._source = response.body.decode(charset, "replace")
+        self._document = parse_html(self._source)
+        self._url = url
+        self.document_id += 1
+        self.last_load = PageLoad(url, response.status, transferred, time.monotonic() - start)
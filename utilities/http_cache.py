@@ -0,0 +1,299 @@
+import asyncio
+import hashlib
+import http.client
+import json
+import os
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+from utilities.http_server import BackgroundHttpServer, HttpRequest, HttpResponse, encode_response
+
+
+# Headers that only apply to a single connection and must not be forwarded
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "proxy-connection", "te", "trailers", "transfer-encoding", "upgrade",
+}
+
+
+class ResponseStore:
+    """
+    On-disk, content-addressed store of recorded HTTP responses.
+
+    Bodies are stored once per SHA-256 digest under ``objects/``; ``index.json``
+    maps each request key to the response status, headers and body digest.
+    Entries are evicted least recently used first once the stored bodies
+    exceed ``max_bytes``. Index changes, including the last use of replayed
+    responses, are written at most once per ``flush_interval`` and on close.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 200 * 1024 * 1024,
+                 flush_interval: float = 5.0):
+        """
+        Args:
+            directory: Directory holding the index and objects
+            max_bytes: Upper bound for the total size of stored bodies
+            flush_interval: Minimum seconds between index writes
+        """
+        self.directory = directory
+        self.objects_dir = os.path.join(directory, "objects")
+        self.index_path = os.path.join(directory, "index.json")
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self.index: Dict[str, dict] = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as f:
+                self.index = json.load(f)
+
+    @staticmethod
+    def make_key(method: str, url: str, body: bytes) -> str:
+        """Build the cache key for a request from its method, URL and body."""
+        digest = hashlib.sha256()
+        for part in (method.upper().encode(), url.encode(), hashlib.sha256(body).digest()):
+            digest.update(part)
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[HttpResponse]:
+        """Look up a recorded response and mark it as recently used."""
+        with self._lock:
+            entry = self.index.get(key)
+            if entry is None:
+                return None
+            path = os.path.join(self.objects_dir, entry["body"])
+            self._dirty = True
+            if not os.path.exists(path):
+                del self.index[key]
+                return None
+            entry["last_used"] = time.time()
+        with open(path, "rb") as f:
+            body = f.read()
+        return HttpResponse(entry["status"], dict(entry["headers"]), body)
+
+    def put(self, key: str, url: str, response: HttpResponse) -> None:
+        """Store a response, evicting old entries if the size limit is exceeded."""
+        body_hash = hashlib.sha256(response.body).hexdigest()
+        path = os.path.join(self.objects_dir, body_hash)
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(response.body)
+        with self._lock:
+            self.index[key] = {
+                "url": url,
+                "status": response.status,
+                "headers": response.headers,
+                "body": body_hash,
+                "size": len(response.body),
+                "last_used": time.time(),
+            }
+            self._evict()
+            self._dirty = True
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                self._save()
+
+    def flush(self) -> None:
+        """Write the index if it changed since the last write."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def close(self) -> None:
+        """Flush the index; the store stays usable."""
+        self.flush()
+
+    def total_bytes(self) -> int:
+        """Size of all distinct stored bodies."""
+        sizes = {entry["body"]: entry["size"] for entry in self.index.values()}
+        return sum(sizes.values())
+
+    def _evict(self) -> None:
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return
+        references = Counter(entry["body"] for entry in self.index.values())
+        for key, _ in sorted(self.index.items(), key=lambda item: item[1]["last_used"]):
+            entry = self.index.pop(key)
+            references[entry["body"]] -= 1
+            if not references[entry["body"]]:
+                total -= entry["size"]
+                try:
+                    os.remove(os.path.join(self.objects_dir, entry["body"]))
+                except FileNotFoundError:
+                    pass
+            if total <= self.max_bytes:
+                break
+
+    def _save(self) -> None:
+        # Merge entries recorded meanwhile by other workers sharing the store
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as f:
+                on_disk = json.load(f)
+            for key, entry in on_disk.items():
+                if key not in self.index and os.path.exists(os.path.join(self.objects_dir, entry["body"])):
+                    self.index[key] = entry
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.index, f)
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+
+class CachingProxyServer(BackgroundHttpServer):
+    """
+    Forward HTTP proxy that records responses to, or replays them from, a ResponseStore.
+
+    The browser talks plain HTTP to the proxy; hosts listed in ``https_hosts``
+    are fetched upstream over HTTPS, so a site can be recorded while the
+    browser stays on http:// URLs the proxy can see. In replay mode every
+    request is answered from the store and no upstream connection is made.
+    Store lookups and writes run in the default executor, off the event loop.
+    """
+
+    def __init__(self, store: ResponseStore, mode: str = "replay",
+                 https_hosts: Iterable[str] = (), ignored_form_fields: Iterable[str] = ("_token",),
+                 host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            store: Response store to record into or replay from
+            mode: 'record' or 'replay'
+            https_hosts: Hosts to fetch over HTTPS upstream
+            ignored_form_fields: Volatile form fields (e.g. CSRF tokens) left out of the cache key
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported cache mode: {mode}")
+        super().__init__(host, port)
+        self.store = store
+        self.mode = mode
+        self.https_hosts = set(https_hosts)
+        self.ignored_form_fields = set(ignored_form_fields)
+        self.hits = 0
+        self.misses = 0
+        self.upstream_requests = 0
+
+    async def handle(self, request: HttpRequest) -> HttpResponse:
+        """Answer a proxied request from the store or from upstream."""
+        url = self._absolute_url(request)
+        key = self.store.make_key(request.method, url, self._normalized_body(request))
+
+        loop = asyncio.get_running_loop()
+        cached = await loop.run_in_executor(None, self.store.get, key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        if self.mode == "replay":
+            self.logger.warning(f"Cache miss in replay mode: {request.method} {url}")
+            return HttpResponse(504, {"Content-Type": "text/plain"}, b"Not in HTTP cache")
+
+        response = await loop.run_in_executor(None, self._fetch_upstream, request, url)
+        if response.status < 500:
+            await loop.run_in_executor(None, self.store.put, key, url, response)
+        return response
+
+    def stop(self) -> None:
+        """Stop the proxy and flush the store's index."""
+        super().stop()
+        self.store.close()
+
+    async def handle_tunnel(self, request: HttpRequest, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter) -> None:
+        """
+        Tunnel a CONNECT request to its upstream host.
+
+        Tunnels are opaque and cannot be cached, so they are refused in replay
+        mode and for recorded hosts (which makes the browser stay on HTTP).
+        """
+        host, _, port = request.target.partition(":")
+        if self.mode == "replay" or host in self.https_hosts:
+            writer.write(encode_response(HttpResponse(403, {}, b""), keep_alive=False))
+            await writer.drain()
+            return
+        await self._tunnel(host, int(port or 443), reader, writer)
+
+    def _absolute_url(self, request: HttpRequest) -> str:
+        target = request.target
+        if not target.startswith(("http://", "https://")):
+            target = f"http://{request.headers.get('host', '')}{target}"
+        parts = urlsplit(target)
+        if parts.scheme == "http" and parts.hostname in self.https_hosts:
+            target = "https" + target[len("http"):]
+        return target
+
+    def _normalized_body(self, request: HttpRequest) -> bytes:
+        if not request.body or "urlencoded" not in request.headers.get("content-type", ""):
+            return request.body
+        fields = [(name, value) for name, value in parse_qsl(request.body.decode("utf-8", "replace"),
+                                                             keep_blank_values=True)
+                  if name not in self.ignored_form_fields]
+        return urlencode(fields).encode()
+
+    def _fetch_upstream(self, request: HttpRequest, url: str) -> HttpResponse:
+        self.upstream_requests += 1
+        parts = urlsplit(url)
+        connection_class = (http.client.HTTPSConnection if parts.scheme == "https"
+                            else http.client.HTTPConnection)
+        connection = connection_class(parts.netloc, timeout=30)
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+        headers = {name: value for name, value in request.headers.items()
+                   if name not in HOP_BY_HOP_HEADERS}
+        try:
+            connection.request(request.method, path, body=request.body or None, headers=headers)
+            upstream = connection.getresponse()
+            body = upstream.read()
+            response_headers = {}
+            for name, value in upstream.getheaders():
+                lower = name.lower()
+                if lower in HOP_BY_HOP_HEADERS or lower == "strict-transport-security":
+                    continue
+                if lower == "location":
+                    value = self._downgrade_location(value)
+                response_headers[name] = value
+            return HttpResponse(upstream.status, response_headers, body)
+        finally:
+            connection.close()
+
+    def _downgrade_location(self, location: str) -> str:
+        parts = urlsplit(location)
+        if parts.scheme == "https" and parts.hostname in self.https_hosts:
+            return "http" + location[len("https"):]
+        return location
+
+    @staticmethod
+    async def _tunnel(host: str, port: int, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection(host, port)
+        except OSError:
+            writer.write(encode_response(HttpResponse(502, {}, b""), keep_alive=False))
+            await writer.drain()
+            return
+        writer.write(b"HTTP/1.1 200 Connection Established\r\n\r\n")
+        await writer.drain()
+
+        async def pipe(source: asyncio.StreamReader, sink: asyncio.StreamWriter) -> None:
+            try:
+                while True:
+                    data = await source.read(65536)
+                    if not data:
+                        break
+                    sink.write(data)
+                    await sink.drain()
+            except ConnectionError:
+                pass
+            finally:
+                sink.close()
+
+        await asyncio.gather(pipe(reader, writer), pipe(upstream_reader, upstream_writer))
+
@@ -0,0 +1,167 @@
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from http import HTTPStatus
+from typing import Dict, NamedTuple, Optional
+from urllib.parse import parse_qsl, urlsplit
+from utilities.logger import get_logger
+
+
+class HttpRequest(NamedTuple):
+    """A parsed HTTP/1.1 request."""
+
+    method: str
+    target: str
+    headers: Dict[str, str]
+    body: bytes
+
+    @property
+    def path(self) -> str:
+        """Request path without the query string."""
+        return urlsplit(self.target).path or "/"
+
+    @property
+    def form(self) -> Dict[str, str]:
+        """Query string and url-encoded body parameters, body taking precedence."""
+        params = dict(parse_qsl(urlsplit(self.target).query, keep_blank_values=True))
+        if self.body and "urlencoded" in self.headers.get("content-type", "urlencoded"):
+            params.update(parse_qsl(self.body.decode("utf-8", "replace"), keep_blank_values=True))
+        return params
+
+
+class HttpResponse(NamedTuple):
+    """An HTTP response to send back to the client."""
+
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[HttpRequest]:
+    """
+    Read one request from the stream.
+
+    Returns:
+        The parsed request, or None when the client closed the connection
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+
+    lines = head.decode("latin-1").split("\r\n")
+    method, target, _ = lines[0].split(" ", 2)
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length", 0))
+    body = await reader.readexactly(length) if length else b""
+    return HttpRequest(method.upper(), target, headers, body)
+
+
+def encode_response(response: HttpResponse, keep_alive: bool = True) -> bytes:
+    """Serialize a response with an explicit Content-Length."""
+    reason = HTTPStatus(response.status).phrase
+    headers = {k: v for k, v in response.headers.items()
+               if k.lower() not in ("content-length", "transfer-encoding", "connection")}
+    headers["Content-Length"] = str(len(response.body))
+    headers["Connection"] = "keep-alive" if keep_alive else "close"
+    head = f"HTTP/1.1 {response.status} {reason}\r\n"
+    head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+    return head.encode("latin-1") + b"\r\n" + response.body
+
+
+class BackgroundHttpServer(ABC):
+    """
+    Minimal asyncio HTTP/1.1 server running on its own event loop thread.
+
+    Subclasses must implement ``handle`` to turn a request into a response.
+    Connections are kept alive so a browser reuses them across page loads.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.host = host
+        self.port = port
+        self.logger = get_logger(self.__class__.__name__)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+
+    @abstractmethod
+    async def handle(self, request: HttpRequest) -> HttpResponse:
+        """Produce the response for a request."""
+
+    async def handle_tunnel(self, request: HttpRequest, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter) -> None:
+        """Handle a CONNECT request; refused unless a subclass supports tunnelling."""
+        writer.write(encode_response(HttpResponse(405, {}, b""), keep_alive=False))
+        await writer.drain()
+
+    def start(self) -> "BackgroundHttpServer":
+        """Start serving in a background thread and wait until the port is bound."""
+        self._thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+        self._thread.start()
+        self._started.wait()
+        self.logger.info(f"Serving on http://{self.host}:{self.port}")
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and its event loop thread."""
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = None
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._serve_client, self.host, self.port)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.close()
+
+    async def _serve_client(self, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                if request.method == "CONNECT":
+                    await self.handle_tunnel(request, reader, writer)
+                    return
+                try:
+                    response = await self.handle(request)
+                except Exception as e:
+                    self.logger.error(f"Error handling {request.method} {request.target}: {e}")
+                    response = HttpResponse(500, {"Content-Type": "text/plain"}, str(e).encode())
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                writer.write(encode_response(response, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            # Idle keep-alive connections are cancelled when the server stops
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,329 @@
+import heapq
+import html
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from selenium.webdriver.remote.webdriver import WebDriver
+from config.config import Config
+
+
+PAGES_DIR = os.path.join(Config.ROOT_DIR, "pages")
+# Frames searched above a command for a page-object method before giving up
+PAGE_SEARCH_DEPTH = 25
+# W3C key identifying a web element reference in commands and responses
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class CommandRecord(NamedTuple):
+    """A single WebDriver command execution."""
+
+    test: Optional[str]
+    command: str
+    locator: Optional[str]
+    page_method: Optional[str]
+    duration: float
+
+
+class CommandRecorder:
+    """
+    Records the latency of every WebDriver command and explicit wait.
+
+    Drivers are instrumented by wrapping their ``execute`` method, which every
+    WebDriver and WebElement call goes through. Commands are attributed to the
+    test set with start_test on the calling thread and to the outermost
+    page-object method on the call stack, and aggregated per test, command
+    and page method; only the Config.TIMING_TOP slowest are kept individually.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.commands: Dict[Tuple[Optional[str], str, Optional[str]], List[float]] = {}
+        self.slowest: List[Tuple[float, int, CommandRecord]] = []
+        self._recorded = 0
+        self.tests: Dict[str, Dict[str, float]] = {}
+
+    @property
+    def current_test(self) -> Optional[str]:
+        """Test the calling thread's commands are attributed to."""
+        return getattr(self._local, "test", None)
+
+    @property
+    def _element_locators(self) -> Dict[str, str]:
+        locators = getattr(self._local, "element_locators", None)
+        if locators is None:
+            locators = self._local.element_locators = {}
+        return locators
+
+    def instrument(self, driver: WebDriver) -> WebDriver:
+        """
+        Wrap the driver so every command it executes is recorded.
+
+        Returns:
+            The same driver instance
+        """
+        if getattr(driver, "_command_recorder", None) is self:
+            return driver
+        execute = driver.execute
+
+        def timed_execute(driver_command: str, params: dict = None):
+            start = time.perf_counter()
+            response = None
+            try:
+                response = execute(driver_command, params)
+                return response
+            finally:
+                self.record_command(driver_command, params, response,
+                                    time.perf_counter() - start)
+
+        driver.execute = timed_execute
+        driver._command_recorder = self
+        return driver
+
+    def start_test(self, nodeid: str) -> None:
+        """Attribute subsequent records of the calling thread to the given test."""
+        self._local.test = nodeid
+        self.tests[nodeid] = {"start": time.perf_counter(), "wall_time": 0.0, "wait_time": 0.0}
+
+    def finish_test(self, nodeid: str) -> None:
+        """Close the timing window of the given test."""
+        test = self.tests.get(nodeid)
+        if test is not None:
+            test["wall_time"] = time.perf_counter() - test.pop("start")
+        self._local.test = None
+        self._element_locators.clear()
+
+    def record_command(self, command: str, params: Optional[dict],
+                       response: Optional[dict], duration: float) -> None:
+        """Record one executed WebDriver command."""
+        params = params or {}
+        locator = None
+        if "using" in params:
+            locator = f"{params['using']}={params.get('value')}"
+        elif "id" in params:
+            locator = self._element_locators.get(params["id"])
+
+        if locator and response:
+            for element_id in self._element_ids(response.get("value")):
+                self._element_locators[element_id] = locator
+
+        test, page_method = self.current_test, self._calling_page_method()
+        with self._lock:
+            stats = self.commands.setdefault((test, command, page_method), [0, 0.0])
+            stats[0] += 1
+            stats[1] += duration
+            self._recorded += 1
+            entry = (duration, self._recorded,
+                     CommandRecord(test, command, locator, page_method, duration))
+            if len(self.slowest) < Config.TIMING_TOP:
+                heapq.heappush(self.slowest, entry)
+            elif self.slowest and duration > self.slowest[0][0]:
+                heapq.heapreplace(self.slowest, entry)
+
+    def record_wait(self, label: str, duration: float, timed_out: bool) -> None:
+        """Add the duration of an explicit wait to the current test."""
+        test = self.tests.get(self.current_test)
+        if test is not None:
+            test["wait_time"] += duration
+
+    def summarize(self, top: int = 20) -> Dict[str, Any]:
+        """
+        Aggregate the records per test and per page object.
+
+        Args:
+            top: Number of slowest commands to include, at most Config.TIMING_TOP
+
+        Returns:
+            JSON-serializable timing breakdown
+        """
+        tests = {}
+        for nodeid, timing in self.tests.items():
+            tests[nodeid] = {
+                "wall_time": timing.get("wall_time", 0.0),
+                "wait_time": timing.get("wait_time", 0.0),
+                "command_time": 0.0,
+                "commands": 0,
+                "by_command": defaultdict(lambda: {"count": 0, "total": 0.0}),
+            }
+        page_objects = defaultdict(lambda: {"count": 0, "total": 0.0})
+
+        with self._lock:
+            commands = list(self.commands.items())
+            slowest = [record for _, _, record in heapq.nlargest(top, self.slowest)]
+        for (nodeid, command, page_method), (count, total) in commands:
+            test = tests.get(nodeid)
+            if test is not None:
+                test["commands"] += count
+                test["command_time"] += total
+                test["by_command"][command]["count"] += count
+                test["by_command"][command]["total"] += total
+            page = page_objects[page_method or "<test code>"]
+            page["count"] += count
+            page["total"] += total
+
+        return {
+            "tests": {nodeid: dict(test, by_command=dict(test["by_command"]))
+                      for nodeid, test in tests.items()},
+            "page_objects": dict(page_objects),
+            "slowest_commands": [record._asdict() for record in slowest],
+        }
+
+    @staticmethod
+    def _element_ids(value: Any) -> List[str]:
+        if isinstance(value, dict) and ELEMENT_KEY in value:
+            return [value[ELEMENT_KEY]]
+        if isinstance(value, list):
+            return [v[ELEMENT_KEY] for v in value if isinstance(v, dict) and ELEMENT_KEY in v]
+        return []
+
+    @staticmethod
+    def _calling_page_method() -> Optional[str]:
+        """
+        Find the outermost page-object method on the current call stack.
+
+        The walk ends at the first frame above the page-object frames, or
+        after PAGE_SEARCH_DEPTH frames without one, rather than at the top
+        of the pytest stack.
+        """
+        caller = None
+        frame = sys._getframe(2)
+        depth = 0
+        while frame is not None:
+            if frame.f_code.co_filename.startswith(PAGES_DIR):
+                owner = frame.f_locals.get("self")
+                if owner is not None and hasattr(owner, "driver"):
+                    caller = f"{type(owner).__name__}.{frame.f_code.co_name}"
+            elif caller is not None or depth >= PAGE_SEARCH_DEPTH:
+                break
+            depth += 1
+            frame = frame.f_back
+        return caller
+
+
+_recorder = CommandRecorder()
+
+
+def get_recorder() -> CommandRecorder:
+    """Return the process-wide command recorder."""
+    return _recorder
+
+
+def merge_summaries(summaries: List[Dict[str, Any]], top: int = 20) -> Dict[str, Any]:
+    """
+    Merge per-worker summaries into a single timing report.
+
+    Args:
+        summaries: Results of CommandRecorder.summarize from each worker
+        top: Number of slowest commands to keep
+
+    Returns:
+        Timing report with an overall summary section
+    """
+    tests, page_objects, slowest = {}, defaultdict(lambda: {"count": 0, "total": 0.0}), []
+    for summary in summaries:
+        tests.update(summary["tests"])
+        for name, stats in summary["page_objects"].items():
+            page_objects[name]["count"] += stats["count"]
+            page_objects[name]["total"] += stats["total"]
+        slowest.extend(summary["slowest_commands"])
+
+    wall_time = sum(t["wall_time"] for t in tests.values())
+    wait_time = sum(t["wait_time"] for t in tests.values())
+    return {
+        "summary": {
+            "tests": len(tests),
+            "commands": sum(t["commands"] for t in tests.values()),
+            "wall_time": wall_time,
+            "command_time": sum(t["command_time"] for t in tests.values()),
+            "wait_time": wait_time,
+            "wait_share": wait_time / wall_time if wall_time else 0.0,
+        },
+        "tests": tests,
+        "page_objects": dict(sorted(page_objects.items(),
+                                    key=lambda item: item[1]["total"], reverse=True)),
+        "slowest_commands": sorted(slowest, key=lambda r: r["duration"], reverse=True)[:top],
+    }
+
+
+def save_partial_summary(summary: Dict[str, Any], directory: str, worker_id: str) -> None:
+    """Persist a worker's summary so the controller can merge it."""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, f"{worker_id}.json"), "w") as f:
+        json.dump(summary, f)
+
+
+def load_partial_summaries(directory: str) -> List[Dict[str, Any]]:
+    """Load and remove the worker summaries saved in directory."""
+    summaries = []
+    if not os.path.isdir(directory):
+        return summaries
+    for filename in sorted(os.listdir(directory)):
+        path = os.path.join(directory, filename)
+        with open(path) as f:
+            summaries.append(json.load(f))
+        os.remove(path)
+    return summaries
+
+
+def write_timing_report(report: Dict[str, Any], directory: str) -> str:
+    """
+    Write the timing report as timing.json and timing.html.
+
+    Args:
+        report: Result of merge_summaries
+        directory: Output directory
+
+    Returns:
+        Path to the JSON report
+    """
+    os.makedirs(directory, exist_ok=True)
+    json_path = os.path.join(directory, "timing.json")
+    with open(json_path, "w") as f:
+        json.dump(report, f, indent=2)
+    with open(os.path.join(directory, "timing.html"), "w") as f:
+        f.write(_render_html(report))
+    return json_path
+
+
+def _render_html(report: Dict[str, Any]) -> str:
+    def table(headers, rows):
+        head = "".join(f"<th>{html.escape(h)}</th>" for h in headers)
+        body = "".join(
+            "<tr>" + "".join(f"<td>{html.escape(str(c))}</td>" for c in row) + "</tr>"
+            for row in rows
+        )
+        return f"<table><tr>{head}</tr>{body}</table>"
+
+    summary = report["summary"]
+    tests = table(
+        ["Test", "Wall (s)", "Commands", "Command (s)", "Waiting (s)", "Waiting %"],
+        [[nodeid, f"{t['wall_time']:.3f}", t["commands"], f"{t['command_time']:.3f}",
+          f"{t['wait_time']:.3f}",
+          f"{100 * t['wait_time'] / t['wall_time']:.1f}" if t["wall_time"] else "0.0"]
+         for nodeid, t in report["tests"].items()]
+    )
+    pages = table(
+        ["Page object method", "Commands", "Total (s)"],
+        [[name, p["count"], f"{p['total']:.3f}"] for name, p in report["page_objects"].items()]
+    )
+    slowest = table(
+        ["Test", "Command", "Locator", "Page object method", "Duration (s)"],
+        [[r["test"], r["command"], r["locator"] or "", r["page_method"] or "",
+          f"{r['duration']:.3f}"] for r in report["slowest_commands"]]
+    )
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        "<title>WebDriver Command Timing</title>"
+        "<style>body{font-family:sans-serif}table{border-collapse:collapse;margin-bottom:2em}"
+        "td,th{border:1px solid #ccc;padding:4px 8px;text-align:left}</style></head><body>"
+        "<h1>WebDriver Command Timing</h1>"
+        f"<p>{summary['tests']} tests, {summary['commands']} commands, "
+        f"{summary['wall_time']:.2f}s wall time, {summary['command_time']:.2f}s in commands, "
+        f"{summary['wait_time']:.2f}s waiting ({100 * summary['wait_share']:.1f}%)</p>"
+        f"<h2>Tests</h2>{tests}<h2>Page objects</h2>{pages}"
+        f"<h2>Slowest commands</h2>{slowest}</body></html>"
+    )
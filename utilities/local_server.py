@@ -0,0 +1,133 @@
+import html
+import itertools
+import os
+import random
+import time
+from datetime import datetime, timezone
+from string import Template
+from typing import Dict, List, Tuple
+from utilities.http_server import BackgroundHttpServer, HttpRequest, HttpResponse
+
+
+SITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "local_site")
+
+DEPARTURE_CITIES = ["Paris", "Philadelphia", "Boston", "Portland", "San Diego", "Mexico City", "São Paolo"]
+DESTINATION_CITIES = ["Buenos Aires", "Rome", "London", "Berlin", "New York", "Dublin", "Cairo"]
+
+# Flights offered for every route, as listed by BlazeDemo
+FLIGHTS = [
+    {"flight": "43", "airline": "Virgin America", "departs": "1:43 AM", "arrives": "9:45 PM", "price": "472.56"},
+    {"flight": "234", "airline": "United Airlines", "departs": "7:43 AM", "arrives": "12:45 PM", "price": "432.98"},
+    {"flight": "9696", "airline": "Aer Lingus", "departs": "5:27 AM", "arrives": "8:22 PM", "price": "200.98"},
+    {"flight": "12", "airline": "Virgin America", "departs": "11:23 AM", "arrives": "1:45 PM", "price": "765.32"},
+    {"flight": "4346", "airline": "Lufthansa", "departs": "1:43 AM", "arrives": "9:45 PM", "price": "233.98"},
+]
+
+FEES = "514.76"
+
+
+class LocalBlazeDemoServer(BackgroundHttpServer):
+    """
+    Local stand-in for the BlazeDemo booking flow.
+
+    Serves the home, reserve, purchase and confirmation pages with the same
+    structure and locators as www.blazedemo.com and generates transaction
+    IDs, so tests can run hermetically at LAN speed.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        super().__init__(host, port)
+        self._templates = self._load_templates()
+        self._transaction_ids = itertools.count(int(time.time() * 1000) * 1000)
+        self.routes = {
+            "/": self.home,
+            "/index.php": self.home,
+            "/reserve.php": self.reserve,
+            "/purchase.php": self.purchase,
+            "/confirmation.php": self.confirmation,
+        }
+
+    async def handle(self, request: HttpRequest) -> HttpResponse:
+        """Dispatch the request to its page handler."""
+        return self.respond(request)
+
+    def respond(self, request: HttpRequest) -> HttpResponse:
+        """Render the response to a request without going through a socket."""
+        handler = self.routes.get(request.path)
+        if handler is None:
+            return HttpResponse(404, {"Content-Type": "text/plain"}, b"Not Found")
+        title, content = handler(request.form)
+        page = self._templates["layout"].substitute(title=html.escape(title), content=content)
+        return HttpResponse(200, {"Content-Type": "text/html; charset=utf-8"}, page.encode("utf-8"))
+
+    def home(self, form: Dict[str, str]) -> Tuple[str, str]:
+        """Render the departure and destination search form."""
+        return "BlazeDemo", self._render(
+            "home",
+            departures=self._options(DEPARTURE_CITIES),
+            destinations=self._options(DESTINATION_CITIES),
+        )
+
+    def reserve(self, form: Dict[str, str]) -> Tuple[str, str]:
+        """Render the flights available for the selected route."""
+        route = {
+            "from_port": form.get("fromPort", DEPARTURE_CITIES[0]),
+            "to_port": form.get("toPort", DESTINATION_CITIES[0]),
+        }
+        rows = "\n".join(self._render("reserve_row", **flight, **route) for flight in FLIGHTS)
+        return "BlazeDemo - reserve", self._render("reserve", rows=rows, **route)
+
+    def purchase(self, form: Dict[str, str]) -> Tuple[str, str]:
+        """Render the purchase form for the chosen flight."""
+        price = form.get("price", FLIGHTS[0]["price"])
+        try:
+            total = f"{float(price) + float(FEES):.2f}"
+        except ValueError:
+            total = FEES
+        return "BlazeDemo Purchase", self._render(
+            "purchase",
+            from_port=form.get("fromPort", DEPARTURE_CITIES[0]),
+            to_port=form.get("toPort", DESTINATION_CITIES[0]),
+            airline=form.get("airline", FLIGHTS[0]["airline"]),
+            flight=form.get("flight", FLIGHTS[0]["flight"]),
+            price=price,
+            fees=FEES,
+            total=total,
+            token=f"{random.getrandbits(128):032x}",
+        )
+
+    def confirmation(self, form: Dict[str, str]) -> Tuple[str, str]:
+        """Render the purchase confirmation with a new transaction ID."""
+        card_number = form.get("creditCardNumber", "")
+        return "BlazeDemo Confirmation", self._render(
+            "confirmation",
+            transaction_id=str(next(self._transaction_ids)),
+            amount=form.get("amount", FEES),
+            card_number="x" * max(len(card_number) - 4, 0) + card_number[-4:],
+            month=form.get("creditCardMonth", ""),
+            year=form.get("creditCardYear", ""),
+            auth_code=f"{random.randint(0, 999999):06d}",
+            timestamp=datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000"),
+        )
+
+    @staticmethod
+    def _load_templates() -> Dict[str, Template]:
+        templates = {}
+        for filename in os.listdir(SITE_DIR):
+            if filename.endswith(".html"):
+                with open(os.path.join(SITE_DIR, filename), encoding="utf-8") as f:
+                    templates[filename[:-len(".html")]] = Template(f.read())
+        return templates
+
+    def _render(self, template: str, **values: str) -> str:
+        escaped = {name: html.escape(str(value)) for name, value in values.items()
+                   if name not in ("rows", "departures", "destinations")}
+        raw = {name: value for name, value in values.items() if name not in escaped}
+        return self._templates[template].substitute(**escaped, **raw)
+
+    @staticmethod
+    def _options(cities: List[str]) -> str:
+        return "\n".join(
+            f'                <option value="{html.escape(city)}">{html.escape(city)}</option>'
+            for city in cities
+        )
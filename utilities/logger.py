@@ -1,13 +1,142 @@
+import atexit
+import copy
+import json
 import logging
 import os
-from datetime import datetime
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Set
 from config.config import Config
 
 
+CONSOLE_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+FILE_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
+
+_lock = threading.Lock()
+_queue_handler: Optional[QueueHandler] = None
+_console_handler: Optional[logging.Handler] = None
+_listener: Optional[QueueListener] = None
+_loggers: Set[str] = set()
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats records as one JSON object per line for machine consumption."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "function": record.funcName,
+            "line": record.lineno,
+            "thread": record.threadName,
+            "test": getattr(record, "test", ""),
+        }
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _ConsoleHandler(logging.StreamHandler):
+    """
+    Writes to the current sys.stderr on the calling thread.
+
+    The stream is looked up on every record, so output written while pytest
+    captures a test ends up in that test's captured output.
+    """
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    Hands records to the background writer with as little work as possible.
+
+    The message is merged with its arguments and the running test is
+    attached to a copy of the record on the calling thread; all formatting
+    happens in the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Other handlers of the logger and its parents still get the original record
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.test = os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0]
+        return record
+
+
+def _run_log_path(extension: str) -> str:
+    """Path of this process's run log; xdist workers each get their own file."""
+    log_dir = os.path.join(Config.ROOT_DIR, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    suffix = f"_{worker}" if worker else ""
+    return os.path.join(
+        log_dir, f"test_run_{datetime.now().strftime('%Y%m%d_%H%M%S')}{suffix}.{extension}"
+    )
+
+
+def _get_console_handler() -> logging.Handler:
+    """Return the console handler shared by every logger, created on first use."""
+    global _console_handler
+    if _console_handler is None:
+        _console_handler = _ConsoleHandler()
+        _console_handler.setLevel(logging.INFO)
+        _console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+    return _console_handler
+
+
+def _start_listener() -> QueueHandler:
+    """Start the process-wide background writer of the log files and return the handler feeding it."""
+    global _queue_handler, _listener
+    if _queue_handler is not None:
+        return _queue_handler
+
+    # File handler, shared by every logger of the run
+    file_handler = logging.FileHandler(_run_log_path("log"))
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(logging.Formatter(FILE_FORMAT))
+    handlers = [file_handler]
+
+    # Structured JSON-lines sink
+    if Config.LOG_JSON:
+        json_handler = logging.FileHandler(_run_log_path("jsonl"))
+        json_handler.setLevel(logging.DEBUG)
+        json_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(json_handler)
+
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _queue_handler = _RecordQueueHandler(log_queue)
+    atexit.register(stop_logging)
+    return _queue_handler
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Create and configure a logger instance.
 
+    Records of INFO and above are written to the console on the calling
+    thread, where pytest captures them with the test's output. All records
+    are then enqueued, and a single background thread per process writes
+    them to the run's log file and the JSON-lines log.
+    Records below Config.LOG_LEVEL are dropped before they are created.
+
     Args:
         name: Logger name (typically __name__)
 
@@ -17,31 +146,40 @@ def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
 
     if not logger.handlers:
-        logger.setLevel(logging.DEBUG)
-
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_format = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        console_handler.setFormatter(console_format)
-        logger.addHandler(console_handler)
-
-        # File handler
-        log_dir = os.path.join(Config.ROOT_DIR, "logs")
-        os.makedirs(log_dir, exist_ok=True)
-
-        log_file = os.path.join(
-            log_dir,
-            f"test_run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        )
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
-        file_format = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
-        )
-        file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+        with _lock:
+            if not logger.handlers:
+                logger.setLevel(Config.LOG_LEVEL)
+                logger.addHandler(_get_console_handler())
+                logger.addHandler(_start_listener())
+                _loggers.add(name)
 
     return logger
+
+
+def set_log_level(level: str) -> None:
+    """
+    Change the level of every framework logger.
+
+    Args:
+        level: Level name, e.g. "INFO" to drop DEBUG records before they are formatted
+    """
+    Config.LOG_LEVEL = level.upper()
+    with _lock:
+        for name in _loggers:
+            logging.getLogger(name).setLevel(Config.LOG_LEVEL)
+
+
+def stop_logging() -> None:
+    """Write out every queued record and stop the background writer."""
+    global _queue_handler, _listener
+    with _lock:
+        listener, _listener = _listener, None
+        handler, _queue_handler = _queue_handler, None
+        for name in _loggers:
+            logging.getLogger(name).removeHandler(handler)
+            logging.getLogger(name).removeHandler(_console_handler)
+        _loggers.clear()
+    if listener is not None:
+        listener.stop()
+        for target in listener.handlers:
+            target.close()
@@ -0,0 +1,207 @@
+import json
+import os
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+
+def _extensions(*extensions: str) -> List[str]:
+    """URL patterns of files with the given extensions, with or without a query string."""
+    return [pattern for extension in extensions
+            for pattern in (f"*.{extension}", f"*.{extension}?*")]
+
+
+# URL patterns blocked through CDP Network.setBlockedURLs in Chrome
+BLOCKED_URL_PATTERNS = {
+    "images": _extensions("png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "bmp"),
+    "fonts": _extensions("woff", "woff2", "ttf", "otf", "eot"),
+    "css": _extensions("css"),
+    "media": _extensions("mp4", "webm", "mp3", "ogg", "wav"),
+    "analytics": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*hotjar.com*", "*segment.io*", "*facebook.net*", "*newrelic.com*",
+    ],
+    # Known public CDN hosts; CDP URL patterns cannot express "any other origin"
+    "cdn": [
+        "*fonts.googleapis.com*", "*fonts.gstatic.com*", "*cdnjs.cloudflare.com*",
+        "*cdn.jsdelivr.net*", "*maxcdn.bootstrapcdn.com*", "*stackpath.bootstrapcdn.com*",
+    ],
+}
+
+# Closest Firefox preferences; Firefox has no URL blocklist, so analytics
+# blocking falls back to its built-in tracking protection and CDN blocking
+# to disabling downloadable fonts
+FIREFOX_BLOCKING_PREFS = {
+    "images": {"permissions.default.image": 2},
+    "fonts": {"gfx.downloadable_fonts.enabled": False, "browser.display.use_document_fonts": 0},
+    "css": {"permissions.default.stylesheet": 2},
+    "media": {"media.autoplay.default": 5, "media.autoplay.blocking_policy": 2},
+    "analytics": {"privacy.trackingprotection.enabled": True},
+    "cdn": {"gfx.downloadable_fonts.enabled": False},
+}
+
+# Polled by BasePage.wait_for_page_load: returns the ready state and, once the
+# page has loaded, the transfer size and load time of the navigation
+PAGE_LOAD_SCRIPT = """
+var state = document.readyState, result = {state: state, url: location.href};
+if (state === 'complete' || state === 'interactive') {
+    var nav = performance.getEntriesByType('navigation')[0];
+    var bytes = nav ? nav.transferSize : 0;
+    performance.getEntriesByType('resource').forEach(function (r) { bytes += r.transferSize || 0; });
+    result.bytes = bytes;
+    result.load_time = nav ? ((nav.loadEventEnd || nav.domContentLoadedEventEnd) - nav.startTime) / 1000 : 0;
+}
+return result;
+"""
+
+
+def parse_categories(value: Optional[Iterable[str]]) -> List[str]:
+    """
+    Normalize a resource blocking selection.
+
+    Args:
+        value: Comma separated string or iterable of category names
+
+    Returns:
+        Sorted list of categories
+
+    Raises:
+        ValueError: If a category is unknown
+    """
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(",")
+    categories = sorted({c.strip().lower() for c in value if c.strip()})
+    unknown = [c for c in categories if c not in BLOCKED_URL_PATTERNS]
+    if unknown:
+        raise ValueError(
+            f"Unknown resource categories: {unknown} "
+            f"(choose from {sorted(BLOCKED_URL_PATTERNS)})"
+        )
+    return categories
+
+
+def blocked_url_patterns(categories: Iterable[str]) -> List[str]:
+    """Get the CDP URL patterns for the given categories."""
+    patterns = []
+    for category in categories:
+        patterns.extend(p for p in BLOCKED_URL_PATTERNS[category] if p not in patterns)
+    return patterns
+
+
+def firefox_blocking_prefs(categories: Iterable[str]) -> Dict[str, Any]:
+    """Get the Firefox preferences for the given categories."""
+    prefs = {}
+    for category in categories:
+        prefs.update(FIREFOX_BLOCKING_PREFS[category])
+    return prefs
+
+
+def apply_chrome_blocking(driver: WebDriver, categories: Iterable[str]) -> None:
+    """
+    Block resources on a running Chrome driver through CDP.
+
+    Passing no categories lifts any previous blocking.
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_url_patterns(categories)})
+
+
+class PageLoadStats:
+    """Collects the transfer size and load time of each page load per blocking profile."""
+
+    def __init__(self):
+        self.loads: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.profile = "none"
+
+    def record(self, url: str, transferred: int, load_time: float) -> None:
+        """Record one completed page load under the active profile."""
+        self.loads[self.profile].append({
+            "path": urlparse(url).path or "/",
+            "bytes": transferred,
+            "load_time": load_time,
+        })
+
+    def summarize(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Average transfer size and load time per profile and URL path.
+
+        Returns:
+            {profile: {path: {"loads", "bytes", "load_time"}}}
+        """
+        summary = {}
+        for profile, loads in self.loads.items():
+            paths = defaultdict(lambda: {"loads": 0, "bytes": 0.0, "load_time": 0.0})
+            for load in loads:
+                stats = paths[load["path"]]
+                stats["loads"] += 1
+                stats["bytes"] += load["bytes"]
+                stats["load_time"] += load["load_time"]
+            summary[profile] = dict(paths)
+        return summary
+
+
+_page_load_stats = PageLoadStats()
+
+
+def get_page_load_stats() -> PageLoadStats:
+    """Return the process-wide page load statistics."""
+    return _page_load_stats
+
+
+def merge_page_load_summaries(summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge PageLoadStats.summarize results from several workers."""
+    merged = defaultdict(lambda: defaultdict(lambda: {"loads": 0, "bytes": 0.0, "load_time": 0.0}))
+    for summary in summaries:
+        for profile, paths in summary.items():
+            for path, stats in paths.items():
+                for key in ("loads", "bytes", "load_time"):
+                    merged[profile][path][key] += stats[key]
+    return {profile: dict(paths) for profile, paths in merged.items()}
+
+
+def compare_to_baseline(summary: Dict[str, Any], baseline_path: str) -> List[str]:
+    """
+    Describe the bytes and load time saved by each blocking profile.
+
+    Unblocked runs (profile "none") refresh the baseline file; blocking
+    profiles are compared path by path against it.
+
+    Args:
+        summary: Merged page load summary
+        baseline_path: JSON file holding averages of an unblocked run
+
+    Returns:
+        Human readable report lines
+    """
+    baseline = {}
+    if "none" in summary:
+        baseline = {
+            path: {"bytes": s["bytes"] / s["loads"], "load_time": s["load_time"] / s["loads"]}
+            for path, s in summary["none"].items()
+        }
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        with open(baseline_path, "w") as f:
+            json.dump(baseline, f, indent=2)
+    elif os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+
+    lines = []
+    for profile, paths in sorted(summary.items()):
+        loads = sum(s["loads"] for s in paths.values())
+        transferred = sum(s["bytes"] for s in paths.values())
+        load_time = sum(s["load_time"] for s in paths.values())
+        line = (f"{profile}: {loads} page loads, {transferred / 1024:.1f} KB transferred, "
+                f"{load_time / loads:.3f}s average load")
+
+        compared = [(path, s) for path, s in paths.items() if path in baseline]
+        if profile != "none" and compared:
+            saved_bytes = sum(baseline[p]["bytes"] * s["loads"] - s["bytes"] for p, s in compared)
+            saved_time = sum(baseline[p]["load_time"] * s["loads"] - s["load_time"] for p, s in compared)
+            line += f" (saved {saved_bytes / 1024:.1f} KB and {saved_time:.2f}s vs unblocked baseline)"
+        lines.append(line)
+    return lines
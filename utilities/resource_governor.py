@@ -0,0 +1,264 @@
+import os
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+from config.config import Config
+from utilities.logger import get_logger
+
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+MB = 1024 * 1024
+
+
+def process_table() -> Dict[int, int]:
+    """Map every running process ID to its parent ID, read from /proc."""
+    table = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces; the parent ID follows it
+                table[int(entry)] = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+    return table
+
+
+def process_rss(pid: int) -> int:
+    """Resident set size of a process in bytes, or 0 if it is gone."""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def tree_rss(root: int, table: Dict[int, int]) -> int:
+    """Summed resident set size of a process and all of its descendants in bytes."""
+    children = defaultdict(list)
+    for pid, parent in table.items():
+        children[parent].append(pid)
+    total, pending = 0, [root]
+    while pending:
+        pid = pending.pop()
+        total += process_rss(pid)
+        pending.extend(children.get(pid, ()))
+    return total
+
+
+def _cmdline(pid: int) -> str:
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            return f.read().replace(b"\0", b" ").decode(errors="replace")
+    except OSError:
+        return ""
+
+
+def browser_pid(driver, table: Dict[int, int] = None) -> Optional[int]:
+    """
+    Find the root process of a driver's browser.
+
+    Firefox reports its process ID; Chrome is found among the children of
+    chromedriver by the user data directory of the session.
+
+    Returns:
+        Process ID, or None for drivers without a local browser
+    """
+    capabilities = getattr(driver, "capabilities", None) or {}
+    if capabilities.get("moz:processID"):
+        return int(capabilities["moz:processID"])
+    user_data_dir = (capabilities.get("chrome") or {}).get("userDataDir")
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    if not user_data_dir or process is None:
+        return None
+    table = process_table() if table is None else table
+    marker = f"--user-data-dir={user_data_dir}"
+    return next((pid for pid, parent in table.items()
+                 if parent == process.pid and marker in _cmdline(pid)), None)
+
+
+class ResourceGovernor:
+    """
+    Samples the memory of the browser process trees of this worker.
+
+    A background thread sums the resident set size of every watched
+    driver's browser and its child processes (renderers, GPU, network
+    service) every Config.MEMORY_SAMPLE_INTERVAL seconds. The peak of the
+    worker's browser memory is kept per test. A driver over the per-driver
+    budget is recycled by the driver pool instead of being reused, and
+    while the worker's browsers are over the worker budget the pool stops
+    keeping idle drivers.
+
+    Shared pages are counted once per process, so the figures overstate
+    what the browsers cost together; they are meant for budgets and trends.
+    Sampling reads /proc and is disabled where it does not exist.
+    """
+
+    def __init__(self, budget_mb: int = None, worker_budget_mb: int = None, interval: float = None):
+        """
+        Args:
+            budget_mb: Memory budget per driver in MB, 0 for none (defaults to Config.MEMORY_BUDGET_MB)
+            worker_budget_mb: Memory budget of all drivers of the worker in MB, 0 for none
+            interval: Seconds between samples
+        """
+        self.budget_mb = Config.MEMORY_BUDGET_MB if budget_mb is None else budget_mb
+        self.worker_budget_mb = Config.WORKER_MEMORY_BUDGET_MB if worker_budget_mb is None else worker_budget_mb
+        self.interval = interval or Config.MEMORY_SAMPLE_INTERVAL
+        self.supported = os.path.isdir("/proc")
+        self.logger = get_logger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._roots: Dict[int, int] = {}
+        self._usage: Dict[int, float] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.current_test: Optional[str] = None
+        self.tests: Dict[str, float] = {}
+        self.peak_mb = 0.0
+        self.recycled = 0
+        self.throttled = 0
+
+    def watch(self, driver) -> None:
+        """Start sampling the memory of a driver's browser."""
+        if not self.supported:
+            return
+        pid = browser_pid(driver)
+        if pid is None:
+            return
+        with self._lock:
+            self._roots[id(driver)] = pid
+            if self._thread is None:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="resource-governor", daemon=True)
+                self._thread.start()
+
+    def unwatch(self, driver) -> None:
+        """Stop sampling a driver, e.g. when it quits."""
+        with self._lock:
+            self._roots.pop(id(driver), None)
+            self._usage.pop(id(driver), None)
+
+    def sample(self) -> float:
+        """
+        Measure every watched browser now.
+
+        Returns:
+            Total browser memory of the worker in MB
+        """
+        with self._lock:
+            roots = dict(self._roots)
+        if not roots:
+            return 0.0
+        table = process_table()
+        usage = {}
+        for key, pid in roots.items():
+            if pid in table:
+                usage[key] = tree_rss(pid, table) / MB
+        total = sum(usage.values())
+        with self._lock:
+            for key in roots:
+                if key not in usage:
+                    # The browser exited without the driver being unwatched
+                    self._roots.pop(key, None)
+            self._usage = usage
+            self.peak_mb = max(self.peak_mb, total)
+            if self.current_test is not None:
+                self.tests[self.current_test] = max(self.tests.get(self.current_test, 0.0), total)
+        return total
+
+    def usage_mb(self, driver) -> float:
+        """Last sampled memory of a driver's browser in MB."""
+        return self._usage.get(id(driver), 0.0)
+
+    def over_budget(self, driver) -> bool:
+        """Whether a driver's browser was over the per-driver budget at the last sample."""
+        return bool(self.budget_mb) and self.usage_mb(driver) > self.budget_mb
+
+    def over_worker_budget(self) -> bool:
+        """Whether the worker's browsers together were over the worker budget at the last sample."""
+        return bool(self.worker_budget_mb) and sum(self._usage.values()) > self.worker_budget_mb
+
+    def start_test(self, nodeid: str) -> None:
+        """Attribute subsequent samples to the given test."""
+        with self._lock:
+            self.current_test = nodeid
+        if self._roots:
+            self.sample()
+
+    def finish_test(self, nodeid: str) -> Optional[float]:
+        """
+        Close the sampling window of a test.
+
+        Returns:
+            Peak browser memory of the worker during the test in MB, or None if nothing was sampled
+        """
+        if self._roots:
+            self.sample()
+        with self._lock:
+            self.current_test = None
+        return self.tests.get(nodeid)
+
+    def stop(self) -> None:
+        """Stop the sampling thread."""
+        self._stop.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def summarize(self, top: int = 10) -> Dict[str, Any]:
+        """
+        Peak browser memory of the run and of its heaviest tests.
+
+        Returns:
+            {"peak_mb", "recycled", "throttled", "tests": {nodeid: peak_mb}}
+        """
+        heaviest = sorted(self.tests.items(), key=lambda item: item[1], reverse=True)[:top]
+        return {
+            "peak_mb": self.peak_mb,
+            "recycled": self.recycled,
+            "throttled": self.throttled,
+            "tests": dict(heaviest),
+        }
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                self.logger.debug(f"Memory sample failed: {e}")
+
+
+def merge_memory_summaries(summaries: List[Dict[str, Any]], top: int = 10) -> Dict[str, Any]:
+    """Merge ResourceGovernor.summarize results from several workers."""
+    merged = {"peak_mb": 0.0, "recycled": 0, "throttled": 0, "tests": {}}
+    for summary in summaries:
+        merged["peak_mb"] = max(merged["peak_mb"], summary["peak_mb"])
+        merged["recycled"] += summary["recycled"]
+        merged["throttled"] += summary["throttled"]
+        merged["tests"].update(summary["tests"])
+    merged["tests"] = dict(sorted(merged["tests"].items(), key=lambda item: item[1], reverse=True)[:top])
+    return merged
+
+
+def format_memory_summary(summary: Dict[str, Any]) -> List[str]:
+    """Describe the peak browser memory of the run and its heaviest tests."""
+    if not summary["tests"]:
+        return []
+    lines = [f"Browser memory: peak {summary['peak_mb']:.0f} MB per worker, "
+             f"{summary['recycled']} driver(s) recycled and {summary['throttled']} "
+             f"released driver(s) closed over budget"]
+    lines.extend(f"  {peak:7.0f} MB  {nodeid}" for nodeid, peak in summary["tests"].items())
+    return lines
+
+
+_governor: Optional[ResourceGovernor] = None
+
+
+def get_resource_governor() -> ResourceGovernor:
+    """Return the process-wide resource governor, created on first use."""
+    global _governor
+    if _governor is None:
+        _governor = ResourceGovernor()
+    return _governor
@@ -0,0 +1,167 @@
+import json
+import os
+from collections import OrderedDict
+from statistics import mean
+from typing import Dict, List, Optional, Tuple
+from xdist.scheduler import LoadScopeScheduling
+
+
+class DurationStore:
+    """
+    Per-test wall times persisted across runs.
+
+    Each new measurement is blended into the stored value with exponential
+    smoothing, so a single slow or fast run does not swing the estimate.
+    """
+
+    def __init__(self, path: str, smoothing: float = 0.5, default: float = 1.0):
+        """
+        Args:
+            path: JSON file mapping test node IDs to seconds
+            smoothing: Weight of a new measurement (1 keeps only the latest run)
+            default: Estimate used while no test has a recorded duration
+        """
+        self.path = path
+        self.smoothing = smoothing
+        self.default = default
+        self.durations: Dict[str, float] = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.durations = json.load(f)
+
+    def estimate(self, nodeid: str) -> float:
+        """Expected duration of a test; unknown tests get the average of known ones."""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        return mean(self.durations.values()) if self.durations else self.default
+
+    def update(self, measured: Dict[str, float]) -> None:
+        """Blend the durations measured in a run into the store."""
+        for nodeid, duration in measured.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = (duration if previous is None else
+                                      self.smoothing * duration + (1 - self.smoothing) * previous)
+
+    def save(self) -> None:
+        """Write the store atomically."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(dict(sorted(self.durations.items())), f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def plan_lpt(costs: Dict[str, float], workers: int) -> List[Tuple[List[str], float]]:
+    """
+    Pack work units onto workers longest-processing-time first.
+
+    Units are taken in decreasing cost and each goes to the currently least
+    loaded worker, which keeps the makespan within 4/3 of the optimum.
+
+    Args:
+        costs: Mapping of work unit to its expected duration
+        workers: Number of workers
+
+    Returns:
+        One (units in execution order, total cost) pair per worker
+    """
+    bins: List[Tuple[List[str], float]] = [([], 0.0) for _ in range(max(workers, 1))]
+    for unit, cost in sorted(costs.items(), key=lambda item: (-item[1], item[0])):
+        index = min(range(len(bins)), key=lambda i: bins[i][1])
+        units, load = bins[index]
+        units.append(unit)
+        bins[index] = (units, load + cost)
+    return bins
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """
+    xdist scheduler distributing test scopes by their historical durations.
+
+    Tests are grouped like ``--dist=loadscope`` (a class, or the module-level
+    functions of a module, form one unit) so class-scoped fixtures are set up
+    once. Units are packed onto workers with plan_lpt. A worker that runs out
+    of planned units takes the smallest pending unit of the worker with the
+    most remaining work, which absorbs estimation errors and crashed workers.
+    """
+
+    def __init__(self, config, store: DurationStore, log=None):
+        """
+        Args:
+            config: pytest config
+            store: Historical test durations used as cost estimates
+            log: xdist log producer
+        """
+        super().__init__(config, log)
+        self.store = store
+        self.plan: Optional[Dict[object, List[str]]] = None
+        self.unit_costs: Dict[str, float] = {}
+        self.predicted_loads: Dict[str, float] = {}
+
+    @property
+    def predicted_makespan(self) -> float:
+        """Expected wall time of the busiest worker."""
+        return max(self.predicted_loads.values(), default=0.0)
+
+    def _build_plan(self) -> None:
+        self.unit_costs = {
+            scope: sum(self.store.estimate(nodeid) for nodeid in work_unit)
+            for scope, work_unit in self.workqueue.items()
+        }
+        nodes = self.nodes
+        self.plan = {}
+        for node, (units, load) in zip(nodes, plan_lpt(self.unit_costs, len(nodes))):
+            self.plan[node] = units
+            self.predicted_loads[node.gateway.id] = load
+        self.log("LPT plan:", {node.gateway.id: units for node, units in self.plan.items()})
+
+    def _next_scope(self, node) -> str:
+        if self.plan is None:
+            self._build_plan()
+        planned = self.plan.setdefault(node, [])
+        while planned and planned[0] not in self.workqueue:
+            planned.pop(0)
+        if planned:
+            return planned.pop(0)
+
+        # Take over the smallest unit of the worker with the most remaining work
+        remaining = {
+            donor: sum(self.unit_costs.get(scope, 0.0) for scope in scopes if scope in self.workqueue)
+            for donor, scopes in self.plan.items() if donor is not node
+        }
+        for donor in sorted(remaining, key=remaining.get, reverse=True):
+            scopes = self.plan[donor]
+            while scopes:
+                scope = scopes.pop()
+                if scope in self.workqueue:
+                    return scope
+        # Units re-queued after a worker crash are not in any plan
+        return next(iter(self.workqueue))
+
+    def _assign_work_unit(self, node) -> None:
+        """Assign the next planned work unit to a node."""
+        assert self.workqueue
+
+        scope = self._next_scope(node)
+        work_unit = self.workqueue.pop(scope)
+
+        assigned_to_node = self.assigned_work.setdefault(node, default=OrderedDict())
+        assigned_to_node[scope] = work_unit
+
+        worker_collection = self.registered_collections[node]
+        nodeids_indexes = [
+            worker_collection.index(nodeid)
+            for nodeid, completed in work_unit.items()
+            if not completed
+        ]
+        node.send_runtest_some(nodeids_indexes)
+
+    def _reschedule(self, node) -> None:
+        # Only take over other workers' units once idle, so the plan is kept while it holds
+        if (self.plan is not None and not self.plan.get(node)
+                and self._pending_of(self.assigned_work[node]) > 0):
+            return
+        super()._reschedule(node)
+
@@ -0,0 +1,301 @@
+import fnmatch
+import functools
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import subprocess
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set
+from config.config import Config
+
+
+MAP_VERSION = 2
+
+# Changed files that cannot affect a test run, including the framework's own output
+IGNORED_CHANGES = ("*.md", "benchmarks/*", ".gitignore", "LICENSE*",
+                   "logs/*", "reports/*", "screenshots/*")
+
+# Changed files mapped to the tests that touched them; any other change runs everything
+MAPPED_CHANGES = ("pages/*.py", "tests/test_*.py")
+
+
+class GitError(RuntimeError):
+    """A git command failed."""
+
+
+def git(*args: str) -> str:
+    """
+    Run a git command in the repository root.
+
+    Returns:
+        Standard output
+
+    Raises:
+        GitError: If git is missing or the command fails
+    """
+    try:
+        result = subprocess.run(["git", *args], cwd=Config.ROOT_DIR, capture_output=True,
+                                text=True, check=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise GitError(getattr(e, "stderr", "") or str(e)) from e
+    return result.stdout
+
+
+def changed_files(ref: str) -> List[str]:
+    """Files that differ between a git ref and the working tree, including untracked files."""
+    changed = set(git("diff", "--name-only", ref, "--").split())
+    changed.update(git("ls-files", "--others", "--exclude-standard").split())
+    return sorted(changed)
+
+
+def _matches(path: str, patterns: Iterable[str]) -> bool:
+    return any(fnmatch.fnmatch(path, pattern) for pattern in patterns)
+
+
+class DependencyTracker:
+    """
+    Records which page-object modules and methods each test calls.
+
+    install() wraps the methods of every class in the pages package once;
+    while a test runs, each call adds "pages/module.py::Class.method" to
+    the test's dependencies.
+    """
+
+    def __init__(self):
+        self.current_test: Optional[str] = None
+        self.tests: Dict[str, Set[str]] = {}
+        self.outcomes: Dict[str, bool] = {}
+        self._installed = False
+        self._lock = threading.Lock()
+
+    def install(self, package: str = "pages") -> None:
+        """Wrap the methods of the page-object classes of a package."""
+        if self._installed:
+            return
+        self._installed = True
+        root = importlib.import_module(package)
+        for module_info in pkgutil.iter_modules(root.__path__, f"{package}."):
+            module = importlib.import_module(module_info.name)
+            path = os.path.relpath(module.__file__, Config.ROOT_DIR).replace(os.sep, "/")
+            for _, cls in inspect.getmembers(module, inspect.isclass):
+                if cls.__module__ == module.__name__:
+                    self._wrap_class(cls, path)
+
+    def start_test(self, nodeid: str) -> None:
+        """Attribute subsequent page-object calls to the given test."""
+        self.current_test = nodeid
+        self.tests[nodeid] = set()
+        self.outcomes[nodeid] = True
+
+    def record_failure(self, nodeid: str) -> None:
+        """Mark a test as failed; its recorded dependencies may be incomplete."""
+        self.outcomes[nodeid] = False
+
+    def finish_test(self, nodeid: str) -> None:
+        """Close the recording window of the given test."""
+        self.current_test = None
+
+    def summarize(self) -> Dict[str, Any]:
+        """
+        Dependencies of the tests run by this process.
+
+        Returns:
+            {nodeid: {"methods": [...], "passed": bool}}
+        """
+        return {nodeid: {"methods": sorted(methods), "passed": self.outcomes.get(nodeid, False)}
+                for nodeid, methods in self.tests.items()}
+
+    def _touch(self, key: str) -> None:
+        test = self.current_test
+        if test is not None:
+            with self._lock:
+                self.tests[test].add(key)
+
+    def _wrap_class(self, cls: type, path: str) -> None:
+        for name, attribute in list(vars(cls).items()):
+            if name.startswith("__"):
+                continue
+            key = f"{path}::{cls.__name__}.{name}"
+            if isinstance(attribute, (staticmethod, classmethod)):
+                setattr(cls, name, type(attribute)(self._wrap(attribute.__func__, key)))
+            elif inspect.isfunction(attribute):
+                setattr(cls, name, self._wrap(attribute, key))
+
+    def _wrap(self, function, key: str):
+        touch = self._touch
+
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def tracked_async(*args, **kwargs):
+                touch(key)
+                return await function(*args, **kwargs)
+            return tracked_async
+
+        @functools.wraps(function)
+        def tracked(*args, **kwargs):
+            touch(key)
+            return function(*args, **kwargs)
+        return tracked
+
+
+class DependencyMap:
+    """
+    Page-object dependencies of every test, persisted across runs.
+
+    Each entry remembers the commit it was recorded at, so tests left out of
+    a run keep the commit their dependencies are known to be valid for. A
+    test that passed replaces its entry; a failed test only adds to it, since
+    it may have stopped before reaching some of its dependencies, and keeps
+    the older commit.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Args:
+            path: JSON file (defaults to Config.DEPENDENCY_MAP_FILE)
+        """
+        self.path = path or Config.DEPENDENCY_MAP_FILE
+        self.tests: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == MAP_VERSION:
+                self.tests = data.get("tests", {})
+
+    def update(self, recorded: Dict[str, Any], commit: str) -> None:
+        """
+        Merge the dependencies recorded in a run.
+
+        Args:
+            recorded: DependencyTracker.summarize results
+            commit: Commit the run was recorded at
+        """
+        for nodeid, entry in recorded.items():
+            methods = set(entry["methods"])
+            previous = self.tests.get(nodeid)
+            if not entry["passed"] and previous is not None:
+                methods.update(previous["methods"])
+                commit_recorded = previous["commit"]
+            else:
+                commit_recorded = commit
+            self.tests[nodeid] = {"methods": sorted(methods), "commit": commit_recorded}
+
+    def commit(self, nodeid: str) -> Optional[str]:
+        """Commit a test's dependencies were recorded at, or None if it is not in the map."""
+        entry = self.tests.get(nodeid)
+        return entry["commit"] if entry else None
+
+    def modules(self, nodeid: str) -> Set[str]:
+        """Files a test depends on: its own module and the page-object modules it called."""
+        entry = self.tests.get(nodeid, {"methods": ()})
+        modules = {method.split("::", 1)[0] for method in entry["methods"]}
+        modules.add(nodeid.split("::", 1)[0])
+        return modules
+
+    def save(self) -> None:
+        """Write the map atomically."""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": MAP_VERSION, "tests": dict(sorted(self.tests.items()))},
+                      f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class AffectedTests:
+    """
+    Decides which tests a change since a git ref affects.
+
+    Tests are selected when a page-object module they called or their own
+    test module changed; tests missing from the map always run, and so do
+    tests with a stale entry: one of its modules changed between the commit
+    the entry was recorded at and the working tree, so the test may now call
+    page objects the entry does not list. The whole suite runs instead when
+    the map is missing, git fails, or a changed file is not mapped to tests
+    (conftest, utilities, config, test data, requirements).
+    """
+
+    def __init__(self, ref: str, changed: List[str], full_run_reason: Optional[str] = None,
+                 dependency_map: DependencyMap = None):
+        self.ref = ref
+        self.changed = changed
+        self.full_run_reason = full_run_reason
+        self.map = dependency_map or DependencyMap()
+        self._changed = set(changed)
+        self._changed_since: Dict[str, Optional[Set[str]]] = {}
+
+    @classmethod
+    def since(cls, ref: str, dependency_map: DependencyMap = None) -> "AffectedTests":
+        """
+        Work out the change since a git ref and whether the map can select tests for it.
+
+        Raises:
+            GitError: If the ref does not exist
+        """
+        dependency_map = dependency_map or DependencyMap()
+        git("rev-parse", "--verify", f"{ref}^{{commit}}")
+        try:
+            changed = changed_files(ref)
+        except GitError as e:
+            return cls(ref, [], f"git diff failed: {e}", dependency_map)
+        relevant = [path for path in changed if not _matches(path, IGNORED_CHANGES)]
+        return cls(ref, relevant, cls._full_run_reason(relevant, dependency_map), dependency_map)
+
+    @staticmethod
+    def _full_run_reason(changed: List[str], dependency_map: DependencyMap) -> Optional[str]:
+        unmapped = [path for path in changed if not _matches(path, MAPPED_CHANGES)]
+        if unmapped:
+            return f"unmapped changes: {', '.join(unmapped[:5])}"
+        if not dependency_map.tests:
+            return "no dependency map recorded yet"
+        return None
+
+    @property
+    def full_run(self) -> bool:
+        return self.full_run_reason is not None
+
+    def is_affected(self, nodeid: str) -> bool:
+        """Whether a test has to run for this change."""
+        if self.full_run or nodeid not in self.map.tests:
+            return True
+        modules = self.map.modules(nodeid)
+        return bool(modules & self._changed) or self.is_stale(nodeid, modules)
+
+    def is_stale(self, nodeid: str, modules: Set[str] = None) -> bool:
+        """Whether one of a test's modules changed since its map entry was recorded."""
+        commit = self.map.commit(nodeid)
+        if commit not in self._changed_since:
+            try:
+                self._changed_since[commit] = set(changed_files(commit))
+            except GitError:
+                self._changed_since[commit] = None
+        changed = self._changed_since[commit]
+        if changed is None:
+            return True
+        return bool((modules or self.map.modules(nodeid)) & changed)
+
+    def describe(self) -> str:
+        """One-line description of the selection."""
+        if self.full_run:
+            return f"Affected tests since {self.ref}: running all tests, {self.full_run_reason}"
+        changed = ", ".join(self.changed) or "nothing"
+        return f"Affected tests since {self.ref}: selected by dependency map (changed: {changed})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"ref": self.ref, "changed": self.changed, "full_run_reason": self.full_run_reason}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AffectedTests":
+        return cls(data["ref"], data["changed"], data["full_run_reason"])
+
+
+_tracker = DependencyTracker()
+
+
+def get_dependency_tracker() -> DependencyTracker:
+    """Return the process-wide dependency tracker."""
+    return _tracker